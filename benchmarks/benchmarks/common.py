@@ -0,0 +1,62 @@
+import time
+import zlib
+
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+
+from sklearn_genetic.space import Categorical, Continuous, Integer
+
+
+class StubClassifier(ClassifierMixin, BaseEstimator):
+    """
+    Classifier that doesn't learn anything, its fit takes ``fit_time`` seconds and its score
+    is a deterministic function of the hyperparameters, so the benchmarks measure the time
+    spent by the search engine instead of the estimator. It accepts any hyperparameter.
+    """
+
+    def __init__(self, fit_time=0.0, **hyperparameters):
+        self.fit_time = fit_time
+        self.hyperparameters = hyperparameters
+
+    def get_params(self, deep=True):
+        return {"fit_time": self.fit_time, **self.hyperparameters}
+
+    def set_params(self, **params):
+        self.fit_time = params.pop("fit_time", self.fit_time)
+        self.hyperparameters.update(params)
+        return self
+
+    def fit(self, X, y=None, **fit_params):
+        if self.fit_time:
+            time.sleep(self.fit_time)
+        self.classes_ = np.unique(y)
+        return self
+
+    def predict(self, X):
+        return np.full(len(X), self.classes_[0])
+
+    def score(self, X, y=None, sample_weight=None):
+        key = repr(sorted(self.hyperparameters.items())).encode()
+        return zlib.crc32(key) / 2**32
+
+
+def make_param_grid(n_parameters):
+    """
+    Search space with ``n_parameters`` hyperparameters, alternating
+    integer, continuous and categorical dimensions
+    """
+    dimensions = [
+        lambda: Integer(1, 100),
+        lambda: Continuous(1e-4, 1, distribution="log-uniform"),
+        lambda: Categorical(["a", "b", "c", "d"]),
+    ]
+    return {
+        f"param_{n}": dimensions[n % len(dimensions)]() for n in range(n_parameters)
+    }
+
+
+def make_data(n_samples=100, n_features=4, random_state=0):
+    rng = np.random.RandomState(random_state)
+    X = rng.normal(size=(n_samples, n_features))
+    y = np.arange(n_samples) % 2
+    return X, y
@@ -0,0 +1,92 @@
+import numpy as np
+from deap import tools
+
+from sklearn_genetic import GASearchCV
+from sklearn_genetic.algorithms import _compile, _var_and, _var_or
+from sklearn_genetic.callbacks import (
+    ConsecutiveStopping,
+    DeltaThreshold,
+    ThresholdStopping,
+)
+from sklearn_genetic.callbacks.validations import eval_callbacks
+from sklearn_genetic.utils.cv_results import CVResults
+from sklearn_genetic.utils.population import ArrayPopulation
+
+from .common import StubClassifier, make_param_grid
+
+
+class OperatorsSuite:
+    """
+    Each step of a generation of the search engine, over an evaluated population
+    """
+
+    params = [[10, 100, 1000], [2, 20], [False, True]]
+    param_names = ["population_size", "n_parameters", "vectorized"]
+
+    def setup(self, population_size, n_parameters, vectorized):
+        np.random.seed(0)
+        self.search = GASearchCV(
+            StubClassifier(),
+            cv=2,
+            param_grid=make_param_grid(n_parameters),
+            population_size=population_size,
+            vectorized=vectorized,
+            verbose=False,
+        )
+        self.search._register()
+        self.search._cv_results = CVResults(self.search.space.parameters, 2)
+        self.toolbox = self.search.toolbox
+        self.individuals = self.search._pop
+        for individual in self.individuals:
+            individual.fitness.values = (np.random.random_sample(),)
+
+        # The vectorized operators breed the population as an array
+        self.population = self.individuals
+        if vectorized:
+            self.population = ArrayPopulation.from_individuals(
+                self.search.space, self.individuals
+            )
+
+        self.parameters = [
+            dict(zip(self.search.space.parameters, individual))
+            for individual in self.individuals
+        ]
+        self.result = self.search._cv_result(np.array([0.5, 0.7]))
+
+        self.logbook = tools.Logbook()
+        for gen in range(10):
+            self.logbook.record(gen=gen, **self.search._stats.compile(self.individuals))
+        self.callbacks = [
+            ThresholdStopping(threshold=2.0, metric="fitness_max"),
+            ConsecutiveStopping(generations=5, metric="fitness"),
+            DeltaThreshold(threshold=1e-6, metric="fitness"),
+        ]
+
+    def time_register(self, *params):
+        self.search._register()
+
+    def time_var_and(self, *params):
+        _var_and(self.population, self.toolbox, 0.8, 0.1)
+
+    def time_var_or(self, population_size, *params):
+        _var_or(self.population, self.toolbox, 2 * population_size, 0.8, 0.1)
+
+    def time_select(self, population_size, *params):
+        self.toolbox.select(self.population, population_size)
+
+    def time_mutate(self, *params):
+        for individual in self.individuals:
+            self.toolbox.mutate(self.toolbox.clone(individual))
+
+    def time_hall_of_fame_update(self, *params):
+        tools.HallOfFame(5).update(self.individuals)
+
+    def time_statistics_compile(self, *params):
+        _compile(self.search._stats, self.population)
+
+    def time_record_evaluations(self, *params):
+        for parameters in self.parameters:
+            self.search._record(parameters, self.result)
+
+    def time_callbacks(self, *params):
+        eval_callbacks(self.callbacks, self.logbook[-1], self.logbook, self.search)
@@ -0,0 +1,60 @@
+import time
+
+from sklearn_genetic import GASearchCV
+
+from .common import StubClassifier, make_data, make_param_grid
+
+
+class SearchSuite:
+    """
+    Complete fits of GASearchCV with a stub estimator, so the measured time is
+    the overhead of the search engine plus the configured fit time of each cv split
+    """
+
+    params = [
+        [10, 100],
+        [2, 20],
+        ["eaSimple", "eaMuPlusLambda", "eaMuCommaLambda"],
+        [0.0, 0.001],
+    ]
+    param_names = ["population_size", "n_parameters", "algorithm", "fit_time"]
+    timeout = 300
+
+    generations = 5
+    cv = 2
+
+    def setup(self, population_size, n_parameters, algorithm, fit_time):
+        self.X, self.y = make_data()
+        self.param_grid = make_param_grid(n_parameters)
+
+    def _fit(self, population_size, n_parameters, algorithm, fit_time):
+        search = GASearchCV(
+            StubClassifier(fit_time=fit_time),
+            cv=self.cv,
+            param_grid=self.param_grid,
+            population_size=population_size,
+            generations=self.generations,
+            algorithm=algorithm,
+            refit=False,
+            verbose=False,
+        )
+        start = time.perf_counter()
+        search.fit(self.X, self.y)
+        return search, time.perf_counter() - start
+
+    def time_fit(self, *params):
+        self._fit(*params)
+
+    def track_evaluations_per_second(self, *params):
+        search, elapsed = self._fit(*params)
+        return len(search.logbook.chapters["parameters"]) / elapsed
+
+    track_evaluations_per_second.unit = "evaluations/s"
+
+    def track_overhead_per_generation(self, *params):
+        search, elapsed = self._fit(*params)
+        fit_time = params[-1]
+        n_fits = len(search.logbook.chapters["parameters"]) * self.cv
+        return (elapsed - n_fits * fit_time) / len(search.history["gen"])
+
+    track_overhead_per_generation.unit = "seconds"
@@ -0,0 +1,88 @@
+"""
+Runs the benchmarks of the ``benchmarks`` package without asv, in the current environment:
+
+    python benchmarks/run.py
+    python benchmarks/run.py --bench "OperatorsSuite.time_var_and" --repeat 10
+
+It prints a line per benchmark and combination of parameters, with the median time
+of the ``time_*`` benchmarks and the median value of the ``track_*`` ones.
+"""
+
+import argparse
+import itertools
+import os
+import re
+import statistics
+import sys
+import timeit
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+# The benchmarks package and the sklearn_genetic of the repository it benchmarks
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+from benchmarks import operators, search  # noqa: E402
+
+SUITES = [search.SearchSuite, operators.OperatorsSuite]
+
+
+def parameter_combinations(suite):
+    params = getattr(suite, "params", [])
+    if params and not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def format_parameters(suite, params):
+    names = getattr(suite, "param_names", [])
+    return ", ".join(f"{name}={value}" for name, value in zip(names, params))
+
+
+def run_benchmark(suite, method_name, params, repeat):
+    values = []
+    for _ in range(repeat):
+        instance = suite()
+        if hasattr(instance, "setup"):
+            instance.setup(*params)
+        method = getattr(instance, method_name)
+        if method_name.startswith("time_"):
+            timer = timeit.Timer(lambda: method(*params))
+            number, _ = timer.autorange()
+            values.append(timer.timeit(number) / number)
+        else:
+            values.append(method(*params))
+
+    unit = getattr(getattr(suite, method_name), "unit", "seconds")
+    return statistics.median(values), unit
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--bench",
+        default="",
+        help="Regular expression, only the benchmarks whose name matches it are run",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of samples of each benchmark"
+    )
+    args = parser.parse_args(argv)
+
+    for suite in SUITES:
+        methods = sorted(
+            name for name in dir(suite) if name.startswith(("time_", "track_"))
+        )
+        for method_name in methods:
+            name = f"{suite.__name__}.{method_name}"
+            if not re.search(args.bench, name):
+                continue
+            for params in parameter_combinations(suite):
+                value, unit = run_benchmark(suite, method_name, params, args.repeat)
+                print(
+                    f"{name} [{format_parameters(suite, params)}]: {value:.6g} {unit}",
+                    flush=True,
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,40 @@
-from .genetic_search import GASearchCV
-
-from .callbacks import (
-    ThresholdStopping,
-    ConsecutiveStopping,
-    DeltaThreshold,
-    LogbookSaver,
-)
-
+import importlib
 
 from ._version import __version__
 
+# The public API is imported on first access (PEP 562), so importing the package,
+# like the worker processes do, doesn't load deap, scipy and most of scikit-learn
+_lazy_attributes = {
+    "GASearchCV": "genetic_search",
+    "ThresholdStopping": "callbacks",
+    "ConsecutiveStopping": "callbacks",
+    "DeltaThreshold": "callbacks",
+    "LogbookSaver": "callbacks",
+    "ModelCheckpoint": "callbacks",
+    "LogbookStreamer": "callbacks",
+}
+
 __all__ = [
     "GASearchCV",
     "ThresholdStopping",
     "ConsecutiveStopping",
     "DeltaThreshold",
     "LogbookSaver",
+    "ModelCheckpoint",
+    "LogbookStreamer",
     "__version__",
 ]
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        module = importlib.import_module(f".{_lazy_attributes[name]}", __name__)
+        value = getattr(module, name)
+        # Cache it, so the next accesses don't go through this function
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
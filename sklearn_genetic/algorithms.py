@@ -1,7 +1,189 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from contextlib import contextmanager
+from operator import attrgetter
+
+import numpy as np
 from deap import tools
 from deap.algorithms import varAnd, varOr
 
 from .callbacks.validations import eval_callbacks
+from .utils.population import ArrayPopulation
+
+# Phases of a generation whose wall time is recorded in the logbook as ``<phase>_time``
+PHASES = ["variation", "evaluation", "hall_of_fame", "selection", "stats", "callbacks"]
+
+
+class _PhaseTimer:
+    """
+    Measures the wall time spent in each phase of a generation. A phase started
+    inside another one pauses it, so each interval is counted in only one phase.
+    """
+
+    def __init__(self):
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self._phase = None
+        self._start = None
+
+    @contextmanager
+    def __call__(self, phase):
+        previous = self._phase
+        self._switch(phase)
+        try:
+            yield
+        finally:
+            self._switch(previous)
+
+    def pop(self, *phases):
+        """
+        Parameters
+        ----------
+        phases: str
+            Names of the phases, if none is given, all the phases are returned
+
+        Returns
+        -------
+            Dictionary with the ``<phase>_time`` of each phase, their times are restarted
+        """
+        times = {}
+        for phase in phases or PHASES:
+            times[f"{phase}_time"] = self.times[phase]
+            self.times[phase] = 0.0
+        return times
+
+    def _switch(self, phase):
+        now = time.perf_counter()
+        if self._phase is not None:
+            self.times[self._phase] += now - self._start
+        self._phase, self._start = phase, now
+
+
+def _eval_callbacks(callbacks, record, logbook, estimator, timer):
+    """
+    Evaluates the callbacks and adds the time they took to the last record of the logbook
+
+    Returns
+    -------
+        ``True`` if any of the callbacks decided to stop the algorithm
+    """
+    with timer("callbacks"):
+        stop = eval_callbacks(callbacks, record, logbook, estimator)
+    logbook[-1].update(timer.pop("callbacks"))
+    return stop
+
+
+def _out_of_budget(budget):
+    """
+    Returns
+    -------
+        ``True`` if there is a budget of the search and it's exhausted
+    """
+    if budget is not None and budget.exhausted():
+        print("INFO: The budget of the search is exhausted")
+        return True
+    return False
+
+
+def _compile(stats, population):
+    """
+    Returns
+    -------
+        The statistics of the population, or an empty record if there are no statistics
+        or no individual of the population was evaluated
+    """
+    if stats is None or not population:
+        return {}
+    if isinstance(population, ArrayPopulation):
+        # The statistics are computed over the scores, as their key does with the individuals
+        scores = population.scores()
+        return {name: function(scores) for name, function in stats.functions.items()}
+    return stats.compile(population)
+
+
+def _evaluated(population):
+    """
+    Returns
+    -------
+        The individuals of the population with a valid fitness
+    """
+    if isinstance(population, ArrayPopulation):
+        return population.take(np.flatnonzero(population.evaluated()))
+    return [ind for ind in population if ind.fitness.valid]
+
+
+def _evaluate_invalid(population, toolbox):
+    """
+    Evaluates the individuals with an invalid fitness and sets their fitness values.
+    If the toolbox has registered an ``evaluate_population`` method, all the individuals
+    are evaluated in a single batch, otherwise ``toolbox.evaluate`` is mapped over them.
+    A ``None`` fitness means the individual wasn't evaluated because the budget of the search
+    ran out, its fitness stays invalid.
+    The individuals of an :class:`~sklearn_genetic.utils.population.ArrayPopulation` are only
+    built for the evaluation, and their fitness is set back in the population.
+
+    Returns
+    -------
+    invalid_ind: list
+        The individuals that were evaluated
+    """
+    if isinstance(population, ArrayPopulation):
+        rows = np.flatnonzero(~population.evaluated())
+        invalid_ind = population.take(rows).to_individuals()
+    else:
+        invalid_ind = [ind for ind in population if not ind.fitness.valid]
+
+    if hasattr(toolbox, "evaluate_population"):
+        fitnesses = toolbox.evaluate_population(invalid_ind)
+    else:
+        fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
+
+    for ind, fit in zip(invalid_ind, fitnesses):
+        if fit is not None:
+            ind.fitness.values = fit
+
+    if isinstance(population, ArrayPopulation):
+        population.set_fitness(
+            rows,
+            [ind.fitness.values if ind.fitness.valid else None for ind in invalid_ind],
+        )
+
+    return [ind for ind in invalid_ind if ind.fitness.valid]
+
+
+def _breed(toolbox, variation):
+    """
+    Generates the offspring with the variation function. If the toolbox has registered
+    a ``prescreen`` method, it receives the variation function and returns the offspring,
+    so it can breed more candidates and keep only the most promising ones.
+
+    Returns
+    -------
+    offspring: list
+        The generated offspring
+    """
+    if hasattr(toolbox, "prescreen"):
+        return toolbox.prescreen(variation)
+    return variation()
+
+
+def _var_and(population, toolbox, cxpb, mutpb):
+    """
+    Applies :func:`deap.algorithms.varAnd`, or the ``var_and`` method
+    of the toolbox if it has registered a vectorized version of it
+    """
+    if hasattr(toolbox, "var_and"):
+        return toolbox.var_and(population, cxpb, mutpb)
+    return varAnd(population, toolbox, cxpb, mutpb)
+
+
+def _var_or(population, toolbox, lambda_, cxpb, mutpb):
+    """
+    Applies :func:`deap.algorithms.varOr`, or the ``var_or`` method
+    of the toolbox if it has registered a vectorized version of it
+    """
+    if hasattr(toolbox, "var_or"):
+        return toolbox.var_or(population, lambda_, cxpb, mutpb)
+    return varOr(population, toolbox, lambda_, cxpb, mutpb)
 
 
 def eaSimple(
@@ -15,6 +197,8 @@ def eaSimple(
     callbacks=None,
     verbose=True,
     estimator=None,
+    logbook=None,
+    budget=None,
 ):
     """
     The base implementation is directly taken from: https://github.com/DEAP/deap/blob/master/deap/algorithms.py
@@ -23,7 +207,10 @@ def eaSimple(
     presented in chapter 7 of Back2000.
 
     population: A list of individuals.
-        Population resulting of the iteration process.
+        Population resulting of the iteration process. It can also be an
+        :class:`~sklearn_genetic.utils.population.ArrayPopulation` if the toolbox has registered
+        the vectorized ``select``, ``var_and`` and ``var_or`` methods, the individuals are
+        only built to evaluate them and update the hall of fame.
 
     toolbox: A :class:`~deap.base.Toolbox`
         Contains the evolution operators.
@@ -52,6 +239,16 @@ def eaSimple(
     estimator: :class:`~sklearn_genetic.GASearchCV`, default = None
         Estimator that is being optimized
 
+    logbook: Logbook, default=None
+        Statistics of the already completed generations of a resumed evolution,
+        the population must be the one of its last generation and it continues from the next one.
+        If ``None`` or empty, the evolution starts by evaluating the population.
+        The statistics of the new generations are recorded in it.
+
+    budget: :class:`~sklearn_genetic.utils.budget.Budget`, default=None
+        Time and evaluations limits of the search, the individuals that weren't evaluated
+        when it's exhausted are discarded and the algorithm stops after the current generation.
+
     Returns
     -------
 
@@ -59,62 +256,78 @@ def eaSimple(
         The final population.
 
     log: Logbook
-        Statistics of the evolution.
+        Statistics of the evolution, with the wall time of each phase of the generation.
 
     n_gen: int
         Number of generations used.
 
     """
-    logbook = tools.Logbook()
-    logbook.header = ["gen", "nevals"] + (stats.fields if stats else [])
+    timer = _PhaseTimer()
+    if logbook is None:
+        logbook = tools.Logbook()
+    if not len(logbook):
+        logbook.header = ["gen", "nevals"] + (stats.fields if stats else [])
 
-    # Evaluate the individuals with an invalid fitness
-    invalid_ind = [ind for ind in population if not ind.fitness.valid]
-    fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-    for ind, fit in zip(invalid_ind, fitnesses):
-        ind.fitness.values = fit
+        # Evaluate the individuals with an invalid fitness
+        with timer("evaluation"):
+            invalid_ind = _evaluate_invalid(population, toolbox)
+        population[:] = _evaluated(population)
+
+        with timer("hall_of_fame"):
+            if halloffame is not None:
+                halloffame.update(invalid_ind)
 
-    if halloffame is not None:
-        halloffame.update(population)
+        with timer("stats"):
+            record = _compile(stats, population)
+        logbook.record(gen=0, nevals=len(invalid_ind), **record, **timer.pop())
+        if verbose:
+            print(logbook.stream)
 
-    record = stats.compile(population) if stats else {}
-    logbook.record(gen=0, nevals=len(invalid_ind), **record)
-    if verbose:
-        print(logbook.stream)
+    def select():
+        with timer("selection"):
+            return toolbox.select(population, len(population))
 
     # Begin the generational process
-    for gen in range(1, ngen + 1):
-        # Select the next generation individuals
-        offspring = toolbox.select(population, len(population))
+    for gen in range(len(logbook), ngen + 1):
+        if _out_of_budget(budget):
+            print("INFO: Stopping the algorithm")
+            break
 
-        # Vary the pool of individuals
-        offspring = varAnd(offspring, toolbox, cxpb, mutpb)
+        # Select the next generation individuals and vary the pool of individuals
+        with timer("variation"):
+            offspring = _breed(
+                toolbox, lambda: _var_and(select(), toolbox, cxpb, mutpb)
+            )
 
         # Evaluate the individuals with an invalid fitness
-        invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-        fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-        for ind, fit in zip(invalid_ind, fitnesses):
-            ind.fitness.values = fit
+        with timer("evaluation"):
+            invalid_ind = _evaluate_invalid(offspring, toolbox)
+        # The offspring that wasn't evaluated before the budget ran out is discarded
+        offspring = _evaluated(offspring)
 
-        # Update the hall of fame with the generated individuals
-        if halloffame is not None:
-            halloffame.update(offspring)
+        # Update the hall of fame with the evaluated individuals, the rest of the
+        # offspring was already offered to it when they were evaluated
+        with timer("hall_of_fame"):
+            if halloffame is not None:
+                halloffame.update(invalid_ind)
 
         # Replace the current population by the offspring
-        population[:] = offspring
+        if offspring:
+            population[:] = offspring
 
         # Append the current generation statistics to the logbook
-        record = stats.compile(population) if stats else {}
-        logbook.record(gen=gen, nevals=len(invalid_ind), **record)
+        with timer("stats"):
+            record = _compile(stats, population)
+        logbook.record(gen=gen, nevals=len(invalid_ind), **record, **timer.pop())
         if verbose:
             print(logbook.stream)
 
         # Check if any of the callbacks conditions are True to stop the iteration
-        if eval_callbacks(callbacks, record, logbook, estimator):
+        if _eval_callbacks(callbacks, record, logbook, estimator, timer):
             print("INFO: Stopping the algorithm")
             break
 
-    n_gen = gen + 1
+    n_gen = len(logbook)
 
     return population, logbook, n_gen
 
@@ -132,6 +345,8 @@ def eaMuPlusLambda(
     callbacks=None,
     verbose=True,
     estimator=None,
+    logbook=None,
+    budget=None,
 ):
     """
     The base implementation is directly taken from: https://github.com/DEAP/deap/blob/master/deap/algorithms.py
@@ -139,7 +354,10 @@ def eaMuPlusLambda(
     This is the :math:`(\mu + \lambda)` evolutionary algorithm.
 
     population: A list of individuals.
-        Population resulting of the iteration process.
+        Population resulting of the iteration process. It can also be an
+        :class:`~sklearn_genetic.utils.population.ArrayPopulation` if the toolbox has registered
+        the vectorized ``select``, ``var_and`` and ``var_or`` methods, the individuals are
+        only built to evaluate them and update the hall of fame.
 
     toolbox: A :class:`~deap.base.Toolbox`
         Contains the evolution operators.
@@ -173,6 +391,16 @@ def eaMuPlusLambda(
     estimator: :class:`~sklearn_genetic.GASearchCV`, default = None
         Estimator that is being optimized
 
+    logbook: Logbook, default=None
+        Statistics of the already completed generations of a resumed evolution,
+        the population must be the one of its last generation and it continues from the next one.
+        If ``None`` or empty, the evolution starts by evaluating the population.
+        The statistics of the new generations are recorded in it.
+
+    budget: :class:`~sklearn_genetic.utils.budget.Budget`, default=None
+        Time and evaluations limits of the search, the individuals that weren't evaluated
+        when it's exhausted are discarded and the algorithm stops after the current generation.
+
     Returns
     -------
 
@@ -180,58 +408,73 @@ def eaMuPlusLambda(
         The final population.
 
     log: Logbook
-        Statistics of the evolution.
+        Statistics of the evolution, with the wall time of each phase of the generation.
 
     n_gen: int
         Number of generations used.
 
     """
-    logbook = tools.Logbook()
-    logbook.header = ["gen", "nevals"] + (stats.fields if stats else [])
+    timer = _PhaseTimer()
+    if logbook is None:
+        logbook = tools.Logbook()
+    if not len(logbook):
+        logbook.header = ["gen", "nevals"] + (stats.fields if stats else [])
 
-    # Evaluate the individuals with an invalid fitness
-    invalid_ind = [ind for ind in population if not ind.fitness.valid]
-    fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-    for ind, fit in zip(invalid_ind, fitnesses):
-        ind.fitness.values = fit
+        # Evaluate the individuals with an invalid fitness
+        with timer("evaluation"):
+            invalid_ind = _evaluate_invalid(population, toolbox)
+        population[:] = _evaluated(population)
 
-    if halloffame is not None:
-        halloffame.update(population)
+        with timer("hall_of_fame"):
+            if halloffame is not None:
+                halloffame.update(invalid_ind)
 
-    record = stats.compile(population) if stats is not None else {}
-    logbook.record(gen=0, nevals=len(invalid_ind), **record)
-    if verbose:
-        print(logbook.stream)
+        with timer("stats"):
+            record = _compile(stats, population)
+        logbook.record(gen=0, nevals=len(invalid_ind), **record, **timer.pop())
+        if verbose:
+            print(logbook.stream)
 
     # Begin the generational process
-    for gen in range(1, ngen + 1):
+    for gen in range(len(logbook), ngen + 1):
+        if _out_of_budget(budget):
+            print("INFO: Stopping the algorithm")
+            break
+
         # Vary the population
-        offspring = varOr(population, toolbox, lambda_, cxpb, mutpb)
+        with timer("variation"):
+            offspring = _breed(
+                toolbox, lambda: _var_or(population, toolbox, lambda_, cxpb, mutpb)
+            )
 
         # Evaluate the individuals with an invalid fitness
-        invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-        fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-        for ind, fit in zip(invalid_ind, fitnesses):
-            ind.fitness.values = fit
+        with timer("evaluation"):
+            invalid_ind = _evaluate_invalid(offspring, toolbox)
+        # The offspring that wasn't evaluated before the budget ran out is discarded
+        offspring = _evaluated(offspring)
 
-        # Update the hall of fame with the generated individuals
-        if halloffame is not None:
-            halloffame.update(offspring)
+        # Update the hall of fame with the evaluated individuals, the rest of the
+        # offspring was already offered to it when they were evaluated
+        with timer("hall_of_fame"):
+            if halloffame is not None:
+                halloffame.update(invalid_ind)
 
         # Select the next generation population
-        population[:] = toolbox.select(population + offspring, mu)
+        with timer("selection"):
+            population[:] = toolbox.select(population + offspring, mu)
 
         # Update the statistics with the new population
-        record = stats.compile(population) if stats is not None else {}
-        logbook.record(gen=gen, nevals=len(invalid_ind), **record)
+        with timer("stats"):
+            record = _compile(stats, population)
+        logbook.record(gen=gen, nevals=len(invalid_ind), **record, **timer.pop())
         if verbose:
             print(logbook.stream)
 
-        if eval_callbacks(callbacks, record, logbook, estimator):
+        if _eval_callbacks(callbacks, record, logbook, estimator, timer):
             print("INFO: Stopping the algorithm")
             break
 
-    n_gen = gen + 1
+    n_gen = len(logbook)
     return population, logbook, n_gen
 
 
@@ -248,6 +491,8 @@ def eaMuCommaLambda(
     callbacks=None,
     verbose=True,
     estimator=None,
+    logbook=None,
+    budget=None,
 ):
     """
     The base implementation is directly taken from: https://github.com/DEAP/deap/blob/master/deap/algorithms.py
@@ -255,7 +500,10 @@ def eaMuCommaLambda(
     This is the :math:`(\mu~,~\lambda)` evolutionary algorithm.
 
     population: A list of individuals.
-        Population resulting of the iteration process.
+        Population resulting of the iteration process. It can also be an
+        :class:`~sklearn_genetic.utils.population.ArrayPopulation` if the toolbox has registered
+        the vectorized ``select``, ``var_and`` and ``var_or`` methods, the individuals are
+        only built to evaluate them and update the hall of fame.
 
     toolbox: A :class:`~deap.base.Toolbox`
         Contains the evolution operators.
@@ -290,6 +538,16 @@ def eaMuCommaLambda(
     estimator: :class:`~sklearn_genetic.GASearchCV`, default = None
         Estimator that is being optimized
 
+    logbook: Logbook, default=None
+        Statistics of the already completed generations of a resumed evolution,
+        the population must be the one of its last generation and it continues from the next one.
+        If ``None`` or empty, the evolution starts by evaluating the population.
+        The statistics of the new generations are recorded in it.
+
+    budget: :class:`~sklearn_genetic.utils.budget.Budget`, default=None
+        Time and evaluations limits of the search, the individuals that weren't evaluated
+        when it's exhausted are discarded and the algorithm stops after the current generation.
+
     Returns
     -------
 
@@ -297,7 +555,7 @@ def eaMuCommaLambda(
         The final population.
 
     log: Logbook
-        Statistics of the evolution.
+        Statistics of the evolution, with the wall time of each phase of the generation.
 
     n_gen: int
         Number of generations used.
@@ -305,51 +563,260 @@ def eaMuCommaLambda(
     """
     assert lambda_ >= mu, "lambda must be greater or equal to mu."
 
-    # Evaluate the individuals with an invalid fitness
-    invalid_ind = [ind for ind in population if not ind.fitness.valid]
-    fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-    for ind, fit in zip(invalid_ind, fitnesses):
-        ind.fitness.values = fit
+    timer = _PhaseTimer()
+    if logbook is None:
+        logbook = tools.Logbook()
+    if not len(logbook):
+        logbook.header = ["gen", "nevals"] + (stats.fields if stats else [])
 
-    if halloffame is not None:
-        halloffame.update(population)
+        # Evaluate the individuals with an invalid fitness
+        with timer("evaluation"):
+            invalid_ind = _evaluate_invalid(population, toolbox)
+        population[:] = _evaluated(population)
 
-    logbook = tools.Logbook()
-    logbook.header = ["gen", "nevals"] + (stats.fields if stats else [])
+        with timer("hall_of_fame"):
+            if halloffame is not None:
+                halloffame.update(invalid_ind)
 
-    record = stats.compile(population) if stats is not None else {}
-    logbook.record(gen=0, nevals=len(invalid_ind), **record)
-    if verbose:
-        print(logbook.stream)
+        with timer("stats"):
+            record = _compile(stats, population)
+        logbook.record(gen=0, nevals=len(invalid_ind), **record, **timer.pop())
+        if verbose:
+            print(logbook.stream)
 
     # Begin the generational process
-    for gen in range(1, ngen + 1):
+    for gen in range(len(logbook), ngen + 1):
+        if _out_of_budget(budget):
+            print("INFO: Stopping the algorithm")
+            break
+
         # Vary the population
-        offspring = varOr(population, toolbox, lambda_, cxpb, mutpb)
+        with timer("variation"):
+            offspring = _breed(
+                toolbox, lambda: _var_or(population, toolbox, lambda_, cxpb, mutpb)
+            )
 
         # Evaluate the individuals with an invalid fitness
-        invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-        fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-        for ind, fit in zip(invalid_ind, fitnesses):
-            ind.fitness.values = fit
+        with timer("evaluation"):
+            invalid_ind = _evaluate_invalid(offspring, toolbox)
+        # The offspring that wasn't evaluated before the budget ran out is discarded
+        offspring = _evaluated(offspring)
 
-        # Update the hall of fame with the generated individuals
-        if halloffame is not None:
-            halloffame.update(offspring)
+        # Update the hall of fame with the evaluated individuals, the rest of the
+        # offspring was already offered to it when they were evaluated
+        with timer("hall_of_fame"):
+            if halloffame is not None:
+                halloffame.update(invalid_ind)
 
         # Select the next generation population
-        population[:] = toolbox.select(offspring, mu)
+        with timer("selection"):
+            if offspring:
+                population[:] = toolbox.select(offspring, mu)
 
         # Update the statistics with the new population
-        record = stats.compile(population) if stats is not None else {}
-        logbook.record(gen=gen, nevals=len(invalid_ind), **record)
+        with timer("stats"):
+            record = _compile(stats, population)
+        logbook.record(gen=gen, nevals=len(invalid_ind), **record, **timer.pop())
         if verbose:
             print(logbook.stream)
 
         # Check if any of the callbacks conditions are True to stop the iteration
-        if eval_callbacks(callbacks, record, logbook, estimator):
+        if _eval_callbacks(callbacks, record, logbook, estimator, timer):
             print("INFO: Stopping the algorithm")
             break
 
-    n_gen = gen + 1
+    n_gen = len(logbook)
+    return population, logbook, n_gen
+
+
+def eaAsyncSteadyState(
+    population,
+    toolbox,
+    mu,
+    cxpb,
+    mutpb,
+    ngen,
+    n_in_flight,
+    stats=None,
+    halloffame=None,
+    callbacks=None,
+    verbose=True,
+    estimator=None,
+    budget=None,
+    logbook=None,
+):
+    """
+    Asynchronous steady-state evolutionary algorithm, there is no barrier between generations:
+    a fixed number of evaluations are kept running and, as soon as one of them completes,
+    the individual is inserted in the population (replacing the worst one if the population is full)
+    and a new offspring is bred to take its place in the running evaluations.
+
+    The toolbox must have registered a ``submit`` method, that starts the evaluation of an individual
+    and returns a :class:`concurrent.futures.Future` (or ``None`` if the fitness was set without
+    evaluating it), and a ``collect`` method that receives the individual and its completed future
+    and returns its fitness.
+
+    When a callback stops the algorithm, the evaluations that completed in the same wait as the
+    stopping one but were submitted after it are discarded, as well as the running ones,
+    so the algorithm stops exactly at the record where the callback met its criteria.
+
+    population: A list of individuals.
+        Population resulting of the iteration process.
+
+    toolbox: A :class:`~deap.base.Toolbox`
+        Contains the evolution operators.
+
+    mu: int, default=None
+        The number of individuals in the population.
+
+    cxpb: float, default=None
+        The probability that an offspring is produced by crossover.
+
+    mutpb: float, default=None
+        The probability that an offspring is produced by mutation.
+
+    ngen: int, default=None
+        The number of generations, each generation is equivalent to ``mu`` evaluated offspring.
+
+    n_in_flight: int, default=None
+        The number of evaluations running at the same time.
+
+    stats: A :class:`~deap.tools.Statistics`
+        Object that is updated inplace, optional.
+
+    halloffame: A :class:`~deap.tools.HallOfFame`
+        Object that will contain the best individuals, optional.
+
+    callbacks: list or Callable
+        One or a list of the :class:`~sklearn_genetic.callbacks` methods available in the package.
+
+    verbose: bool, default=True
+        Whether or not to log the statistics.
+
+    estimator: :class:`~sklearn_genetic.GASearchCV`, default = None
+        Estimator that is being optimized
+
+    budget: :class:`~sklearn_genetic.utils.budget.Budget`, default=None
+        Time and evaluations limits of the search, when it's exhausted the running
+        evaluations are abandoned and the algorithm stops.
+
+    logbook: Logbook, default=None
+        Empty logbook to record the statistics of the evolution in, if ``None``, a new one is created.
+
+    Returns
+    -------
+
+    pop: list
+        The final population.
+
+    log: Logbook
+        Statistics of the evolution, with one record per completed evaluation
+        and the wall time of each phase since the previous record.
+
+    n_gen: int
+        Number of records in the logbook.
+
+    """
+    if logbook is None:
+        logbook = tools.Logbook()
+    logbook.header = ["gen", "nevals"] + (stats.fields if stats else [])
+
+    pending = [ind for ind in population if not ind.fitness.valid]
+    population[:] = [ind for ind in population if ind.fitness.valid]
+    n_evaluations = len(pending) + ngen * mu
+    if budget is not None and budget.remaining_evaluations() is not None:
+        n_evaluations = min(n_evaluations, budget.remaining_evaluations())
+    n_submitted = 0
+    in_flight = {}
+    stop = False
+    timer = _PhaseTimer()
+
+    def vary():
+        offspring = _var_or(population, toolbox, 1, cxpb, mutpb)
+        # A reproduced individual is a member of the population, it's copied and
+        # mutated so each evaluation explores a new one
+        if offspring[0].fitness.valid:
+            offspring = toolbox.mutate(toolbox.clone(offspring[0]))
+            del offspring[0].fitness.values
+        return offspring
+
+    def next_individual():
+        if pending:
+            return pending.pop(0)
+        with timer("variation"):
+            return _breed(toolbox, vary)[0]
+
+    def complete(ind):
+        # Insert the individual and keep the best mu
+        with timer("selection"):
+            population.append(ind)
+            if len(population) > mu:
+                population.remove(min(population, key=attrgetter("fitness")))
+
+        with timer("hall_of_fame"):
+            if halloffame is not None:
+                halloffame.update([ind])
+
+        # Each record has the time of the phases since the previous one
+        with timer("stats"):
+            record = _compile(stats, population)
+        logbook.record(gen=len(logbook), nevals=1, **record, **timer.pop())
+        if verbose:
+            print(logbook.stream)
+
+        return _eval_callbacks(callbacks, record, logbook, estimator, timer)
+
+    while True:
+        # Keep n_in_flight evaluations running
+        while (
+            not stop
+            and len(in_flight) < n_in_flight
+            and n_submitted < n_evaluations
+            and (pending or population)
+        ):
+            ind = next_individual()
+            n_submitted += 1
+            with timer("evaluation"):
+                future = toolbox.submit(ind)
+            if future is None:
+                stop = complete(ind)
+            else:
+                in_flight[future] = ind
+
+        if stop or not in_flight:
+            break
+
+        # Wait until an evaluation completes, the deadline of the budget
+        # passes or the search is interrupted
+        try:
+            with timer("evaluation"):
+                done, _ = wait(
+                    in_flight,
+                    timeout=None if budget is None else budget.remaining_time(),
+                    return_when=FIRST_COMPLETED,
+                )
+        except KeyboardInterrupt:
+            if budget is None:
+                raise
+            budget.interrupt()
+            done = set()
+
+        # The completed evaluations are processed in the order they were submitted,
+        # the ones after the evaluation that stops the algorithm are discarded
+        for future in [future for future in in_flight if future in done]:
+            ind = in_flight.pop(future)
+            with timer("evaluation"):
+                ind.fitness.values = toolbox.collect(ind, future)
+            if complete(ind):
+                stop = True
+                break
+
+        stop = stop or _out_of_budget(budget)
+
+    if stop:
+        for future in in_flight:
+            future.cancel()
+        print("INFO: Stopping the algorithm")
+
+    n_gen = len(logbook)
     return population, logbook, n_gen
@@ -1,8 +1,12 @@
+import json
 import logging
+import os
 from copy import deepcopy
 from joblib import dump
 
 from .base import BaseCallback
+from ..parameters import LogFormats
+from ..utils.logbook import open_log_file
 
 
 class LogbookSaver(BaseCallback):
@@ -34,3 +38,161 @@ class LogbookSaver(BaseCallback):
 
     def __call__(self, record=None, logbook=None, estimator=None):
         return self.on_step(record, logbook, estimator)
+
+
+class ModelCheckpoint(BaseCallback):
+    """
+    Saves after each generation the full state of the evolution: population, hall of fame,
+    logbooks, fitness cache and random number generators states, so the optimization can be
+    continued with ``GASearchCV.fit(X, y, resume_from=checkpoint_path)``
+    """
+
+    def __init__(self, checkpoint_path, **dump_options):
+        """
+        Parameters
+        ----------
+        checkpoint_path: str
+            Location where checkpoint will be saved to
+        dump_options, str
+            Valid kwargs from joblib :class:`~joblib.dump`
+        """
+
+        self.checkpoint_path = checkpoint_path
+        self.dump_options = dump_options
+
+    def on_step(self, record=None, logbook=None, estimator=None):
+        try:
+            checkpoint = estimator._get_checkpoint(logbook)
+            # The previous checkpoint is only replaced once the new one is complete
+            temporary_path = f"{self.checkpoint_path}.tmp"
+            dump(checkpoint, temporary_path, **self.dump_options)
+            os.replace(temporary_path, self.checkpoint_path)
+        except Exception as e:
+            logging.error("Could not save the checkpoint")
+
+        return False
+
+
+class LogbookStreamer(BaseCallback):
+    """
+    Appends after each generation the new records of the estimator.logbook parameters chapter
+    to a file, so each evaluation is written once instead of dumping the whole chapter every time.
+    The evaluations are read back with :func:`~sklearn_genetic.utils.read_logbook`.
+    The file is rewritten when a new fit starts, unless it's resumed from a checkpoint,
+    then the new records are appended after the ones already written
+    """
+
+    def __init__(
+        self, path, format="jsonl", compression=None, max_records_in_memory=None
+    ):
+        """
+        Parameters
+        ----------
+        path: str
+            Location of the JSON lines file, or of the folder of the Parquet files
+        format: {"jsonl", "parquet"}, default="jsonl"
+            With "jsonl", each evaluation is a line of the file. With "parquet",
+            the new evaluations of each generation are written in a new file of the folder,
+            it requires pyarrow
+        compression: str, default=None
+            Compression of the files. For "jsonl" it can be "gzip", "bz2" or "xz",
+            if ``None``, it's inferred from the extension of the path.
+            For "parquet" it's any codec supported by pyarrow, if ``None``, it uses snappy
+        max_records_in_memory: int, default=None
+            If set, once the records are written only the last ``max_records_in_memory``
+            are kept in the logbook of the estimator, the rest are only in the file
+        """
+        if format not in LogFormats.list():
+            raise ValueError(
+                f"format must be one of {LogFormats.list()}, got {format} instead"
+            )
+
+        self.path = path
+        self.format = format
+        self.compression = compression
+        self.max_records_in_memory = max_records_in_memory
+        self._log = None
+        self._n_written = 0
+        self._n_parts = 0
+
+    def on_step(self, record=None, logbook=None, estimator=None):
+        try:
+            log = estimator.logbook.chapters["parameters"]
+            if log is not self._log:
+                # A new fit, the previous records are discarded unless it continues them
+                resume = getattr(estimator, "_resumed", False) or log.offset > 0
+                self._start(log, resume)
+
+            start = self._n_written - log.offset
+            records = log[start:]
+            if records:
+                self._write(records)
+                self._n_written += len(records)
+
+            if self.max_records_in_memory is not None:
+                log.discard(len(log) - self.max_records_in_memory)
+        except Exception as e:
+            logging.error("Could not write the Logbook records")
+
+        return False
+
+    def _start(self, log, resume=False):
+        self._log = log
+        if resume:
+            # The records of the checkpoint that are already in the stream aren't written again
+            self._n_written = max(self._count_written(), log.offset)
+            return
+
+        self._n_written = log.offset
+        self._n_parts = 0
+        if self.format == LogFormats.parquet.value:
+            os.makedirs(self.path, exist_ok=True)
+            for name in os.listdir(self.path):
+                if name.endswith(".parquet"):
+                    os.remove(os.path.join(self.path, name))
+        else:
+            open_log_file(self.path, "wt", self.compression).close()
+
+    def _count_written(self):
+        """
+        Returns
+        -------
+            The number of records in the stream, the new parts are numbered after the existing ones
+        """
+        if self.format == LogFormats.parquet.value:
+            os.makedirs(self.path, exist_ok=True)
+            import pyarrow.parquet as pq
+
+            parts = sorted(
+                name for name in os.listdir(self.path) if name.endswith(".parquet")
+            )
+            self._n_parts = len(parts)
+            return sum(
+                pq.ParquetFile(os.path.join(self.path, name)).metadata.num_rows
+                for name in parts
+            )
+
+        if not os.path.exists(self.path):
+            return 0
+        with open_log_file(self.path, "rt", self.compression) as file:
+            return sum(1 for line in file if line.strip())
+
+    def _write(self, records):
+        if self.format == LogFormats.parquet.value:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            path = os.path.join(self.path, f"part-{self._n_parts:05d}.parquet")
+            pq.write_table(
+                pa.Table.from_pylist(records),
+                path,
+                compression=self.compression or "snappy",
+            )
+            self._n_parts += 1
+        else:
+            with open_log_file(self.path, "at", self.compression) as file:
+                for record in records:
+                    file.write(json.dumps(record, default=str) + "\n")
+
+    def __call__(self, record=None, logbook=None, estimator=None):
+        return self.on_step(record, logbook, estimator)
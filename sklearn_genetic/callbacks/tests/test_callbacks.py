@@ -1,6 +1,9 @@
 import pytest
 import os
 import logging
+import random
+
+import numpy as np
 
 from deap.tools import Logbook
 from sklearn.tree import DecisionTreeClassifier
@@ -8,15 +11,19 @@ from sklearn.datasets import load_digits
 from sklearn.model_selection import train_test_split
 
 from ... import GASearchCV
-from ...space import Integer, Continuous
+from ...algorithms import PHASES
+from ...space import Integer, Continuous, Categorical
 from .. import (
     ThresholdStopping,
     ConsecutiveStopping,
     DeltaThreshold,
     LogbookSaver,
+    LogbookStreamer,
+    ModelCheckpoint,
 )
 from ..validations import check_stats, check_callback
 from ..base import BaseCallback
+from ...utils import read_logbook
 
 data = load_digits()
 label_names = data["target_names"]
@@ -27,6 +34,22 @@ X_train, X_test, y_train, y_test = train_test_split(
     X, y, test_size=0.33, random_state=42
 )
 
+TIMED_FIELDS = {"fit_time", "score_time", "fit_times", "score_times", "peak_memory"}
+TIMED_FIELDS.update(f"{phase}_time" for phase in PHASES)
+
+
+def without_nan(records):
+    """
+    The peak_memory is nan when the fit doesn't increase it, and nan isn't equal to itself
+    """
+    return [
+        {
+            key: None if isinstance(value, float) and np.isnan(value) else value
+            for key, value in record.items()
+        }
+        for record in records
+    ]
+
 
 def test_check_metrics():
     assert check_stats("fitness") is None
@@ -189,3 +212,232 @@ def test_logbook_saver_callback(caplog):
         callback = LogbookSaver(checkpoint_path="./no_folder/logbook.pkl", estimator=4)
         callback()
     assert "Could not save the Logbook in the checkpoint" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "algorithm, cache_size",
+    [("eaSimple", None), ("eaMuPlusLambda", 10), ("eaMuCommaLambda", None)],
+)
+def test_model_checkpoint_resume(algorithm, cache_size, tmp_path):
+    def get_estimator(generations):
+        return GASearchCV(
+            DecisionTreeClassifier(random_state=42),
+            cv=3,
+            scoring="accuracy",
+            population_size=5,
+            generations=generations,
+            param_grid={
+                "min_weight_fraction_leaf": Continuous(0, 0.5),
+                "max_depth": Integer(2, 20),
+                "criterion": Categorical(["gini", "entropy"]),
+            },
+            algorithm=algorithm,
+            cache_size=cache_size,
+            keep_top_k=3,
+            verbose=False,
+        )
+
+    random.seed(7)
+    np.random.seed(7)
+    uninterrupted = get_estimator(generations=5)
+    uninterrupted.fit(X_train, y_train)
+
+    # Same run stopped after the second generation
+    path = str(tmp_path / "checkpoint.pkl")
+    random.seed(7)
+    np.random.seed(7)
+    interrupted = get_estimator(generations=2)
+    interrupted.fit(X_train, y_train, callbacks=ModelCheckpoint(path))
+    assert os.path.exists(path)
+    assert not os.path.exists(f"{path}.tmp")
+
+    resumed = get_estimator(generations=5)
+    resumed.fit(X_train, y_train, resume_from=path)
+
+    # The times and memory of the evaluations are not reproducible
+    def without_times(records):
+        return [
+            {key: value for key, value in record.items() if key not in TIMED_FIELDS}
+            for record in records
+        ]
+
+    assert len(resumed) == len(uninterrupted) == 6
+    assert without_times([resumed.history]) == without_times([uninterrupted.history])
+    assert resumed.hof == uninterrupted.hof
+    assert resumed.best_params_ == uninterrupted.best_params_
+    assert without_times(resumed.logbook.chapters["parameters"]) == without_times(
+        uninterrupted.logbook.chapters["parameters"]
+    )
+
+
+def test_wrong_resume(tmp_path, caplog):
+    path = str(tmp_path / "checkpoint.pkl")
+    param_grid = {
+        "max_depth": Integer(2, 20),
+        "criterion": Categorical(["gini", "entropy"]),
+    }
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(),
+        cv=2,
+        population_size=4,
+        generations=1,
+        param_grid=param_grid,
+        verbose=False,
+    )
+    evolved_estimator.fit(X_train, y_train, callbacks=ModelCheckpoint(path))
+
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid=param_grid,
+            algorithm="eaSimple",
+            verbose=False,
+        ).fit(X_train, y_train, resume_from=path)
+    assert (
+        str(excinfo.value)
+        == "The checkpoint was created with a different algorithm or param_grid"
+    )
+
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid=param_grid,
+            algorithm="asyncSteadyState",
+            verbose=False,
+        ).fit(X_train, y_train, resume_from=path)
+    assert (
+        str(excinfo.value)
+        == "resume_from is not supported by the asyncSteadyState algorithm"
+    )
+
+    with caplog.at_level(logging.ERROR):
+        callback = ModelCheckpoint(checkpoint_path="./no_folder/checkpoint.pkl")
+        callback(estimator=evolved_estimator)
+    assert "Could not save the checkpoint" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "file_name, max_records_in_memory",
+    [("evaluations.jsonl", None), ("evaluations.jsonl.gz", 4)],
+)
+def test_logbook_streamer(file_name, max_records_in_memory, tmp_path):
+    path = str(tmp_path / file_name)
+    callback = LogbookStreamer(path, max_records_in_memory=max_records_in_memory)
+    assert check_callback(callback) == [callback]
+
+    param_grid = {
+        "min_weight_fraction_leaf": Continuous(0, 0.5),
+        "max_depth": Integer(2, 20),
+        "criterion": Categorical(["gini", "entropy"]),
+    }
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(),
+        cv=2,
+        population_size=6,
+        generations=3,
+        param_grid=param_grid,
+        verbose=False,
+    )
+    evolved_estimator.fit(X_train, y_train, callbacks=callback)
+    log = evolved_estimator.logbook.chapters["parameters"]
+
+    logbook = read_logbook(path, space=evolved_estimator.space)
+    stream = logbook.chapters["parameters"]
+    assert len(stream) == log.offset + len(log)
+    assert without_nan(stream[log.offset :]) == without_nan(log[:])
+    if max_records_in_memory is not None:
+        assert len(log) == max_records_in_memory
+        assert log.offset > 0
+
+    # A new fit rewrites the file
+    evolved_estimator.fit(X_train, y_train, callbacks=callback)
+    log = evolved_estimator.logbook.chapters["parameters"]
+    assert len(read_logbook(path).chapters["parameters"]) == log.offset + len(log)
+
+
+@pytest.mark.parametrize("format", ["jsonl", "parquet"])
+def test_logbook_streamer_resume(format, tmp_path):
+    if format == "parquet":
+        pytest.importorskip("pyarrow")
+    path = str(tmp_path / "evaluations")
+    checkpoint_path = str(tmp_path / "checkpoint.pkl")
+
+    def get_estimator(generations):
+        return GASearchCV(
+            DecisionTreeClassifier(random_state=42),
+            cv=2,
+            population_size=5,
+            generations=generations,
+            param_grid={
+                "max_depth": Integer(2, 20),
+                "criterion": Categorical(["gini", "entropy"]),
+            },
+            verbose=False,
+        )
+
+    interrupted = get_estimator(generations=2)
+    interrupted.fit(
+        X_train,
+        y_train,
+        callbacks=[
+            LogbookStreamer(path, format=format, max_records_in_memory=4),
+            ModelCheckpoint(checkpoint_path),
+        ],
+    )
+    written = read_logbook(path).chapters["parameters"][:]
+    log = interrupted.logbook.chapters["parameters"]
+    assert log.offset > 0
+    assert len(written) == log.offset + len(log)
+
+    # The records only kept in the stream aren't lost when the fit is resumed
+    resumed = get_estimator(generations=4)
+    resumed.fit(
+        X_train,
+        y_train,
+        callbacks=LogbookStreamer(path, format=format, max_records_in_memory=4),
+        resume_from=checkpoint_path,
+    )
+    log = resumed.logbook.chapters["parameters"]
+    stream = read_logbook(path).chapters["parameters"]
+    assert len(stream) == log.offset + len(log)
+    assert len(stream) > len(written)
+    assert without_nan(stream[: len(written)]) == without_nan(written)
+    assert without_nan(stream[log.offset :]) == without_nan(log[:])
+
+
+def test_logbook_streamer_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "evaluations")
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(),
+        cv=2,
+        population_size=4,
+        generations=2,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+    )
+    evolved_estimator.fit(
+        X_train, y_train, callbacks=LogbookStreamer(path, format="parquet")
+    )
+    log = evolved_estimator.logbook.chapters["parameters"]
+
+    assert len(os.listdir(path)) > 1
+    stream = read_logbook(path).chapters["parameters"]
+    assert without_nan(stream[:]) == without_nan(log[:])
+
+
+def test_wrong_logbook_streamer(caplog):
+    with pytest.raises(Exception) as excinfo:
+        LogbookStreamer("./evaluations.csv", format="csv")
+    assert (
+        str(excinfo.value)
+        == "format must be one of ['jsonl', 'parquet'], got csv instead"
+    )
+
+    with caplog.at_level(logging.ERROR):
+        callback = LogbookStreamer("./no_folder/evaluations.jsonl")
+        callback(estimator=4)
+    assert "Could not write the Logbook records" in caplog.text
@@ -0,0 +1,685 @@
+import multiprocessing
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import (
+    CancelledError,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from multiprocessing.connection import Client
+from traceback import format_exc
+
+import numpy as np
+from joblib import effective_n_jobs
+
+from .utils.cv_scores import (
+    cross_validate,
+    cross_validate_in_worker,
+    init_worker,
+    select_folds,
+    timeout_evaluation,
+)
+
+
+class BaseExecutor(ABC):
+    """
+    Base class of the executors that cross-validate the candidates of
+    :class:`~sklearn_genetic.GASearchCV`.
+    The data of the search (estimator, cv folds and scorer) is sent once per fit with
+    :meth:`start`, after that only the hyperparameters of each candidate are submitted.
+
+    The attribute ``n_workers`` is the number of candidates that can be evaluated at the same time.
+    """
+
+    n_workers = 1
+
+    def start(
+        self,
+        estimator,
+        folds,
+        scorer,
+        error_score=np.nan,
+        warm_start=None,
+        model_size=False,
+    ):
+        """
+        Sends the data of the search to the workers
+
+        Parameters
+        ----------
+        estimator: estimator object
+            Unfitted estimator to clone and fit
+        folds: list of :class:`~sklearn_genetic.utils.cv_scores.Fold`
+            All the cv folds that the candidates can be evaluated on
+        scorer: callable
+            Scorer with signature ``scorer(estimator, X, y)``
+        error_score: 'raise' or numeric, default=np.nan
+            Value to assign to the score if an error occurs in estimator fitting.
+        warm_start: :class:`~sklearn_genetic.utils.warm_start.WarmStart`, default=None
+            Settings of the warm-started training, each worker keeps its own fitted models
+        model_size: bool, default=False
+            If ``True``, the size of the fitted estimators is measured
+        """
+        self._data = (estimator, folds, scorer, error_score, warm_start, model_size)
+
+    @abstractmethod
+    def submit(self, parameters, folds=None):
+        """
+        Parameters
+        ----------
+        parameters: dict
+            Hyperparameters of the candidate
+        folds: list of int, default=None
+            Position of the folds to evaluate the candidate on, if ``None``,
+            all the folds given in :meth:`start` are used
+
+        Returns
+        -------
+            A :class:`concurrent.futures.Future` with the evaluation of the candidate,
+            a dictionary like the one of :func:`~sklearn_genetic.utils.cv_scores.cross_validate`.
+            A custom executor can also return only the array with the score of each fold,
+            in that case the fit times and memory are not recorded
+        """
+
+    def map(self, candidates, folds=None, timeout=None):
+        """
+        Parameters
+        ----------
+        candidates: list of dict
+            Hyperparameters of each candidate
+        folds: list of int, default=None
+            Position of the folds to evaluate the candidates on, if ``None``,
+            all the folds given in :meth:`start` are used
+        timeout: float, default=None
+            Seconds to wait for all the evaluations, a :class:`concurrent.futures.TimeoutError`
+            is raised if they are not completed in time. If ``None``, there is no limit
+
+        Yields
+        -------
+        evaluation: dict
+            The evaluation of each candidate, in the same order as the candidates,
+            the evaluations that are not completed are cancelled when the generator is closed
+        """
+        end_time = None if timeout is None else time.monotonic() + timeout
+        futures = [self.submit(parameters, folds) for parameters in candidates]
+        try:
+            for future in futures:
+                if end_time is None:
+                    yield future.result()
+                else:
+                    yield future.result(max(end_time - time.monotonic(), 0))
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def shutdown(self):
+        """
+        Release the workers and the data of the search
+        """
+        self._data = None
+
+    def _cross_validate(self, parameters, folds=None):
+        estimator, all_folds, scorer, error_score, warm_start, model_size = self._data
+        return cross_validate(
+            estimator,
+            select_folds(all_folds, folds),
+            scorer,
+            parameters,
+            error_score,
+            warm_start,
+            model_size,
+        )
+
+
+class SerialExecutor(BaseExecutor):
+    """
+    Evaluates the candidates one at a time in the current process
+    """
+
+    def submit(self, parameters, folds=None):
+        future = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(self._cross_validate(parameters, folds))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class ThreadExecutor(BaseExecutor):
+    """
+    Evaluates the candidates in a pool of threads of the current process,
+    useful with estimators that release the GIL while fitting
+    """
+
+    def __init__(self, n_jobs=None):
+        """
+        Parameters
+        ----------
+        n_jobs: int, default=None
+            Number of threads.
+            ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
+            ``-1`` means using all processors.
+        """
+        self.n_jobs = n_jobs
+        self.n_workers = effective_n_jobs(n_jobs)
+        self._pool = None
+
+    def start(
+        self,
+        estimator,
+        folds,
+        scorer,
+        error_score=np.nan,
+        warm_start=None,
+        model_size=False,
+    ):
+        super().start(estimator, folds, scorer, error_score, warm_start, model_size)
+        self._pool = ThreadPoolExecutor(max_workers=self.n_workers)
+
+    def submit(self, parameters, folds=None):
+        return self._pool.submit(self._cross_validate, parameters, folds)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        super().shutdown()
+
+
+class ProcessExecutor(BaseExecutor):
+    """
+    Evaluates the candidates in a pool of processes, the data of the search
+    is sent to each process only once, when it starts
+    """
+
+    def __init__(self, n_jobs=None):
+        """
+        Parameters
+        ----------
+        n_jobs: int, default=None
+            Number of processes.
+            ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
+            ``-1`` means using all processors.
+        """
+        self.n_jobs = n_jobs
+        self.n_workers = effective_n_jobs(n_jobs)
+        self._pool = None
+        self._futures = set()
+
+    def start(
+        self,
+        estimator,
+        folds,
+        scorer,
+        error_score=np.nan,
+        warm_start=None,
+        model_size=False,
+    ):
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=init_worker,
+            initargs=(estimator, folds, scorer, error_score, warm_start, model_size),
+        )
+
+    def submit(self, parameters, folds=None):
+        future = self._pool.submit(cross_validate_in_worker, parameters, folds)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
+
+    def shutdown(self):
+        if self._pool is None:
+            return
+        # The pending evaluations are cancelled and the running ones were abandoned,
+        # so the processes are terminated instead of waiting for their fits.
+        # ProcessPoolExecutor doesn't expose its processes, they are read from its private
+        # _processes attribute of CPython, without it the running fits are left to finish
+        processes = list((getattr(self._pool, "_processes", None) or {}).values())
+        for future in list(self._futures):
+            future.cancel()
+        try:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            # cancel_futures requires python 3.9, the futures were already cancelled
+            self._pool.shutdown(wait=False)
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+        self._futures = set()
+        self._pool = None
+
+
+class TimeoutExecutor(BaseExecutor):
+    """
+    Evaluates the candidates in worker processes that are terminated, and replaced by new ones,
+    when an evaluation takes longer than ``timeout`` seconds, so a runaway fit can't stall the search.
+    The cv splits of a timed out evaluation get the ``error_score`` and the evaluation is marked as
+    ``timed_out``, with ``error_score='raise'`` a :class:`TimeoutError` is raised instead.
+    The data of the search is sent to each process when it starts.
+    """
+
+    def __init__(self, n_jobs=None, timeout=None):
+        """
+        Parameters
+        ----------
+        n_jobs: int, default=None
+            Number of processes.
+            ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
+            ``-1`` means using all processors.
+        timeout: float, default=None
+            Maximum number of seconds of the evaluation of a candidate in all its cv splits.
+            If ``None``, the evaluations are never stopped.
+        """
+        self.n_jobs = n_jobs
+        self.timeout = timeout
+        self.n_workers = effective_n_jobs(n_jobs)
+        self._tasks = None
+        self._threads = []
+        self._busy = set()
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        estimator,
+        folds,
+        scorer,
+        error_score=np.nan,
+        warm_start=None,
+        model_size=False,
+    ):
+        super().start(estimator, folds, scorer, error_score, warm_start, model_size)
+        self._tasks = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._dispatch, daemon=True)
+            for _ in range(self.n_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, parameters, folds=None):
+        future = Future()
+        self._tasks.put((future, parameters, folds))
+        return future
+
+    def shutdown(self):
+        for _ in self._threads:
+            self._tasks.put(None)
+        # The evaluations that are still running were abandoned, they are not waited for
+        with self._lock:
+            for process in self._busy:
+                process.terminate()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._tasks = None
+        super().shutdown()
+
+    def _dispatch(self):
+        """
+        Sends the submitted tasks to a worker process, one at a time, until the executor
+        is shut down. The process is replaced when it's terminated because of the timeout.
+        """
+        process, connection = None, None
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+
+            future, parameters, folds = task
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if process is None:
+                    process, connection = self._start_process()
+                status, value = self._evaluate(process, connection, parameters, folds)
+            except (OSError, EOFError) as e:
+                status, value = "crash", e
+
+            if status in ["timeout", "crash"] and process is not None:
+                process.terminate()
+                process.join()
+                connection.close()
+                process, connection = None, None
+
+            if status == "timeout":
+                self._set_timeout(future, parameters, folds)
+            elif status in ["error", "crash"]:
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+        if process is not None:
+            connection.send(None)
+            process.join()
+            connection.close()
+
+    def _evaluate(self, process, connection, parameters, folds):
+        """
+        Sends a task to a worker process and waits for its outcome until the timeout
+
+        Returns
+        -------
+        status, value: tuple
+            ``"result"`` and the evaluation, ``"error"`` and the exception
+            or ``"timeout"`` and ``None``
+        """
+        with self._lock:
+            self._busy.add(process)
+        try:
+            connection.send((parameters, folds))
+            if not connection.poll(self.timeout):
+                return "timeout", None
+            return connection.recv()
+        finally:
+            with self._lock:
+                self._busy.discard(process)
+
+    def _start_process(self):
+        """
+        Returns
+        -------
+        process, connection: tuple
+            A new worker process with the data of the search and the connection to send it the tasks
+        """
+        connection, worker_connection = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_evaluate_in_process,
+            args=(worker_connection, self._data),
+            daemon=True,
+        )
+        process.start()
+        worker_connection.close()
+        # The start up of the process doesn't count in the timeout of its first evaluation
+        try:
+            connection.recv()
+        except (OSError, EOFError):
+            process.join()
+            connection.close()
+            raise
+        return process, connection
+
+    def _set_timeout(self, future, parameters, folds):
+        """
+        Sets the outcome of an evaluation that was stopped because of the timeout
+        """
+        _, all_folds, _, error_score, _, model_size = self._data
+        if error_score == "raise":
+            future.set_exception(
+                TimeoutError(
+                    f"The evaluation of {parameters} took longer than {self.timeout} seconds"
+                )
+            )
+            return
+        n_folds = len(all_folds) if folds is None else len(folds)
+        future.set_result(
+            timeout_evaluation(n_folds, self.timeout, error_score, model_size)
+        )
+
+
+def _evaluate_in_process(connection, data):
+    """
+    Loop of the worker processes of a :class:`TimeoutExecutor`, once the data is set
+    it notifies the executor and evaluates the candidates received in the connection
+    until it receives ``None``
+
+    Parameters
+    ----------
+    connection: :class:`multiprocessing.connection.Connection`
+        Connection with the executor
+    data: tuple
+        Data of the search, the arguments of :func:`~sklearn_genetic.utils.cv_scores.init_worker`
+    """
+    init_worker(*data)
+    with connection:
+        connection.send(("ready", None))
+        while True:
+            task = connection.recv()
+            if task is None:
+                break
+
+            parameters, folds = task
+            try:
+                connection.send(("result", cross_validate_in_worker(parameters, folds)))
+            except Exception as e:
+                try:
+                    connection.send(("error", e))
+                except Exception:
+                    # The exception can't be pickled
+                    connection.send(("error", RuntimeError(format_exc())))
+
+
+class RemoteExecutor(BaseExecutor):
+    """
+    Evaluates the candidates in worker servers, that can run in several machines, started with::
+
+        python -m sklearn_genetic.worker --host 0.0.0.0 --port 6000 --authkey <secret>
+
+    The data of the search is sent to each worker once per fit, after that only
+    the hyperparameters of the candidates are sent. Each worker evaluates one candidate at a time,
+    run several workers per machine to use all its processors.
+
+    The messages are pickled, so the workers must only be reachable from trusted hosts and
+    share a secret ``authkey``, there is no default one.
+    """
+
+    def __init__(self, addresses, authkey, poll_interval=0.5):
+        """
+        Parameters
+        ----------
+        addresses: list of str or tuple
+            Address of each worker, as a ``"host:port"`` string or a ``(host, port)`` tuple
+        authkey: bytes or str
+            Secret key used to authenticate the connections with the workers,
+            the same one the workers were started with
+        poll_interval: float, default=0.5
+            Seconds between the checks for the shut down of the executor while waiting
+            for a worker, the evaluations still running when it's shut down are abandoned
+        """
+        self.addresses = addresses
+        self.authkey = check_authkey(authkey)
+        self.poll_interval = poll_interval
+        self.n_workers = len(addresses)
+        self._tasks = None
+        self._threads = []
+        self._n_alive = 0
+        self._lock = threading.Lock()
+        self._closing = threading.Event()
+
+    def start(
+        self,
+        estimator,
+        folds,
+        scorer,
+        error_score=np.nan,
+        warm_start=None,
+        model_size=False,
+    ):
+        connections = [
+            Client(parse_address(address), authkey=self.authkey)
+            for address in self.addresses
+        ]
+        for connection in connections:
+            connection.send(
+                (
+                    "start",
+                    (estimator, folds, scorer, error_score, warm_start, model_size),
+                )
+            )
+
+        self._tasks = queue.Queue()
+        self._closing.clear()
+        self._n_alive = len(connections)
+        self._threads = [
+            threading.Thread(target=self._dispatch, args=(connection,), daemon=True)
+            for connection in connections
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, parameters, folds=None):
+        future = Future()
+        self._tasks.put((future, parameters, folds))
+        return future
+
+    def shutdown(self):
+        if self._tasks is None:
+            return
+        # The pending evaluations are cancelled and the running ones are abandoned,
+        # their connections are closed instead of waiting for the fits of the workers
+        self._closing.set()
+        for _ in self._threads:
+            self._tasks.put(None)
+        for thread in self._threads:
+            thread.join()
+        # The tasks given back by a disconnected worker after the others stopped
+        while not self._tasks.empty():
+            task = self._tasks.get()
+            if task is not None:
+                task[0].cancel()
+        self._threads = []
+        self._tasks = None
+
+    def _dispatch(self, connection):
+        """
+        Sends the submitted tasks to a worker, one at a time, until the executor is shut down
+        """
+        alive = True
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+
+            future, parameters, folds = task
+            if self._closing.is_set():
+                future.cancel()
+                continue
+            if not alive:
+                future.set_exception(
+                    ConnectionError("All the workers are disconnected")
+                )
+                continue
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                connection.send(("evaluate", (parameters, folds)))
+                reply = self._receive(connection)
+            except (OSError, EOFError) as e:
+                alive = False
+                with self._lock:
+                    self._n_alive -= 1
+                    others_alive = self._n_alive > 0
+                if others_alive:
+                    # Give the task back to the workers that are still connected
+                    retry = Future()
+                    retry.add_done_callback(_chain(future))
+                    self._tasks.put((retry, parameters, folds))
+                    break
+                future.set_exception(e)
+                continue
+
+            if reply is None:
+                # The worker is still busy with the abandoned fit, so it isn't sent the close
+                future.set_exception(CancelledError("The executor was shut down"))
+                alive = False
+                break
+
+            status, value = reply
+            if status == "error":
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+        if alive:
+            connection.send(("close", None))
+        connection.close()
+
+    def _receive(self, connection):
+        """
+        Waits for the reply of the worker, checking every ``poll_interval`` seconds
+        if the executor is being shut down
+
+        Returns
+        -------
+            The status and value sent by the worker, or ``None`` if the executor is shut down first
+        """
+        while not connection.poll(self.poll_interval):
+            if self._closing.is_set():
+                return None
+        return connection.recv()
+
+
+def _chain(future):
+    """
+    Callback that copies the outcome of a retried task to its original future
+    """
+
+    def copy_outcome(retry):
+        if retry.cancelled():
+            future.set_exception(CancelledError("The executor was shut down"))
+        elif retry.exception() is not None:
+            future.set_exception(retry.exception())
+        else:
+            future.set_result(retry.result())
+
+    return copy_outcome
+
+
+def parse_address(address):
+    """
+    Parameters
+    ----------
+    address: str or tuple
+        A ``"host:port"`` string or a ``(host, port)`` tuple
+
+    Returns
+    -------
+        The ``(host, port)`` tuple
+    """
+    if isinstance(address, str):
+        host, port = address.rsplit(":", 1)
+        return host, int(port)
+    host, port = address
+    return host, int(port)
+
+
+def check_authkey(authkey):
+    """
+    Parameters
+    ----------
+    authkey: bytes or str
+        Secret key shared by a :class:`RemoteExecutor` and its workers
+
+    Returns
+    -------
+        The key as bytes, if it's not empty
+    """
+    if isinstance(authkey, str):
+        authkey = authkey.encode()
+    if not isinstance(authkey, bytes) or not authkey:
+        raise ValueError("authkey must be a non empty bytes or str secret")
+    return authkey
+
+
+def check_executor(executor):
+    """
+    Parameters
+    ----------
+    executor: BaseExecutor or None
+        The executor set in :class:`~sklearn_genetic.GASearchCV`
+
+    Returns
+    -------
+        The executor, if it's valid
+    """
+    if executor is None or isinstance(executor, BaseExecutor):
+        return executor
+    raise ValueError(
+        "executor should be either None or an instance of executors.BaseExecutor"
+    )
@@ -1,21 +1,57 @@
+from concurrent import futures
 from datetime import datetime
+import numbers
 import random
+import shutil
+import tempfile
 
 import numpy as np
-from deap import base, creator, tools
+from scipy import stats
+from deap import base, tools
+from joblib import Parallel, delayed, effective_n_jobs, hash as joblib_hash, load
 from sklearn.base import clone
-from sklearn.model_selection import cross_val_score
+from sklearn.model_selection import check_cv
 from sklearn.base import is_classifier, is_regressor
+from sklearn.utils import indexable
 from sklearn.utils.metaestimators import if_delegate_has_method
 from sklearn.utils.validation import check_is_fitted
 from sklearn.metrics import check_scoring
 from sklearn.exceptions import NotFittedError
 from sklearn.model_selection._search import BaseSearchCV
 
-from .parameters import Algorithms, Criteria
+from .parameters import Algorithms, Criteria, Objectives, ParetoSelection, RacingTests
 from .space import Space
-from .algorithms import eaSimple, eaMuPlusLambda, eaMuCommaLambda
+from .algorithms import (
+    PHASES,
+    eaSimple,
+    eaMuPlusLambda,
+    eaMuCommaLambda,
+    eaAsyncSteadyState,
+)
 from .callbacks.validations import check_callback
+from .executors import ProcessExecutor, TimeoutExecutor, check_executor
+from .store import check_trial_store
+from .utils.budget import Budget
+from .utils.cache import FitnessCache, genome_key
+from .utils.cv_results import CVResults
+from .utils.cv_scores import (
+    Fold,
+    as_evaluation,
+    concatenate_evaluations,
+    evaluation_result,
+    fit_and_score,
+)
+from .utils.individual import Individual, MultiObjectiveIndividual, score_fitness
+from .utils.logbook import EvaluationLog
+from .utils.population import (
+    ArrayPopulation,
+    sel_roulette,
+    sel_tournament,
+    var_and,
+    var_or,
+)
+from .utils.shared import to_memmap
+from .utils.warm_start import WarmStart, clear_model_cache, release_in_worker
 
 
 class GASearchCV(BaseSearchCV):
@@ -80,7 +116,9 @@ class GASearchCV(BaseSearchCV):
 
     n_jobs : int, default=None
         Number of jobs to run in parallel. Training the estimator and computing
-        the score are parallelized over the cross-validation splits.
+        the score are parallelized over the cross-validation splits of all the
+        individuals evaluated in a generation, so each generation is dispatched
+        as a single batch of (individual, split) fits.
         ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
         ``-1`` means using all processors.
 
@@ -94,9 +132,12 @@ class GASearchCV(BaseSearchCV):
     criteria : {'max', 'min'} , default='max'
         ``max`` if a higher scoring metric is better, ``min`` otherwise.
 
-    algorithm : {'eaMuPlusLambda', 'eaMuCommaLambda', 'eaSimple'}, default='eaMuPlusLambda'
+    algorithm : {'eaMuPlusLambda', 'eaMuCommaLambda', 'eaSimple', 'asyncSteadyState'}, default='eaMuPlusLambda'
         Evolutionary algorithm to use.
         See more details in the deap algorithms documentation.
+        ``'asyncSteadyState'`` has no barrier between generations, it keeps as many
+        evaluations running as workers has the ``executor`` and breeds a new individual as soon as
+        one of them completes; it doesn't support successive halving nor racing.
 
     refit : bool, default=True
         Refit an estimator using the best found parameters on the whole dataset.
@@ -126,21 +167,201 @@ class GASearchCV(BaseSearchCV):
         Configuration to log metrics and models to mlflow, of None,
         no mlflow logging will be performed
 
+    cache_size : int, default=None
+        Maximum number of evaluated hyperparameters combinations whose cv-score is kept
+        in memory, so repeated individuals are not cross-validated again.
+        When the cache is full, the least recently used combination is discarded.
+        If ``None``, every individual is evaluated.
+
+    trial_store : str or :class:`~sklearn_genetic.store.BaseTrialStore`, default=None
+        Persistent store of the cv-scores of the evaluated hyperparameters, so they are reused
+        by other calls of the fit method with the same data, cv splits, scoring and estimator.
+        If a str is given, it's used as the path of a
+        :class:`~sklearn_genetic.store.SQLiteTrialStore` file.
+        If ``None``, no trials are stored.
+
+    precompute_folds : bool, default=False
+        If ``True``, the train and test partitions of each cv split (and the fit params)
+        are sliced once at the beginning of the fit, as contiguous arrays when the data is
+        a numpy array, and reused by all the evaluations. It avoids re-indexing the data
+        for every individual at the cost of keeping a copy of each partition in memory.
+
+    min_resources : int, default=None
+        If set, the new individuals are evaluated with successive halving: they are first
+        cross-validated using ``min_resources``, then only the best ``1 / halving_factor``
+        of them are evaluated again using ``halving_factor`` times more resources,
+        until the last evaluation that uses ``max_resources``.
+        The eliminated individuals get as fitness their last score, bounded by the worst
+        score of the individuals evaluated with all the resources.
+        If ``None``, every individual is evaluated with all the resources.
+
+    max_resources : int, default=None
+        Resources used in the last evaluation of the successive halving.
+        It's required if ``resource`` is an estimator parameter, for ``'n_samples'``
+        all the training samples of each cv split are used.
+
+    resource : str, default='n_samples'
+        Resource that increases with each successive halving evaluation.
+        ``'n_samples'`` uses a subsample of the training samples of each cv split,
+        stratified for classifiers, otherwise it's the name of an estimator parameter
+        that can't be part of the ``param_grid``, like ``'n_estimators'``.
+
+    halving_factor : int or float, default=3
+        Proportion of individuals that are discarded and increase in resources
+        in each successive halving evaluation.
+
+    racing : {'t-test', 'hoeffding'}, default=None
+        If set, the individuals are scored one cv split at a time and an individual
+        stops being evaluated (raced) when the statistical test shows, with confidence
+        ``1 - racing_alpha``, that its average score can't reach the fitness of the worst
+        individual of the current population. The fitness of a raced individual is the
+        average of its evaluated splits.
+        ``'t-test'`` uses the upper bound of a one-sided t confidence interval, it requires
+        at least two scored splits; ``'hoeffding'`` uses the Hoeffding inequality bound,
+        assuming the scores lie in an interval of length ``racing_score_range``.
+        If ``None``, all the cv splits are always evaluated.
+
+    racing_alpha : float, default=0.05
+        Significance level of the racing test.
+
+    racing_score_range : float, default=1.0
+        Length of the interval of possible scores, used by the ``'hoeffding'`` racing test.
+
+    executor : :class:`~sklearn_genetic.executors.BaseExecutor`, default=None
+        Executor that cross-validates the candidates, like a
+        :class:`~sklearn_genetic.executors.ProcessExecutor` or a
+        :class:`~sklearn_genetic.executors.RemoteExecutor` whose workers can run in other machines.
+        The data is sent to the workers once per fit, then only the hyperparameters of each candidate.
+        If ``None``, the (individual, cv split) fits are run with joblib using ``n_jobs``,
+        except for the ``'asyncSteadyState'`` algorithm that uses a
+        :class:`~sklearn_genetic.executors.ProcessExecutor` with ``n_jobs`` processes,
+        and when ``fit_timeout`` is set.
+
+    shared_data : bool, default=False
+        If ``True``, the numpy arrays of the data and the fit params (or the partitions of each
+        cv split, if ``precompute_folds=True``) are dumped once per fit in read-only memory-mapped
+        files, the worker processes attach to these files instead of receiving a copy of the data,
+        so the memory stays around one time the size of the data regardless of the number of workers.
+        The joblib workers and the processes of the executors are reused by all the generations.
+        With a :class:`~sklearn_genetic.executors.RemoteExecutor` whose workers run in other
+        machines, ``temp_folder`` must be in a filesystem shared by all of them.
+
+    temp_folder : str, default=None
+        Folder where the memory-mapped files are created, they are removed at the end of the fit.
+        If ``None``, the default temporary folder of the system is used.
+
+    warm_start_params : list of str, default=None
+        Growable hyperparameters of an estimator that supports ``warm_start``, like
+        ``n_estimators`` of the ensembles or ``max_iter`` of the histogram gradient boosting,
+        for which a warm-started fit grows the model up to the new value.
+        The models fitted in each cv split are kept in a cache, and a candidate that only differs
+        from a cached model in bigger values of these hyperparameters continues the training of a
+        copy of that model instead of being fitted from scratch.
+        They must be part of the ``param_grid`` or be the ``resource`` of the successive halving.
+        If ``None``, every candidate is fitted from scratch.
+
+    warm_start_cache_size : int, default=100
+        Maximum number of fitted models kept for the warm start by each process
+        that evaluates the candidates, each search has its own limit.
+        The models are released at the end of the fit, with ``n_jobs`` other than 1
+        a cleanup task is sent to each joblib worker.
+
+    surrogate : regressor object, default=None
+        If set, a copy of this regressor (like a
+        :class:`~sklearn.ensemble.RandomForestRegressor` or a
+        :class:`~sklearn.gaussian_process.GaussianProcessRegressor`) is fitted on the
+        evaluated hyperparameters of the logbook, encoded with
+        :meth:`~sklearn_genetic.space.Space.encode`, to predict their fitness.
+        Each generation, ``surrogate_candidates`` offspring are bred for each one that is needed,
+        and only the most promising one, according to the prediction plus ``surrogate_exploration``
+        times its uncertainty, is cross-validated.
+        The uncertainty is the standard deviation of the trees of a random forest or extra trees,
+        or the one returned by ``predict(X, return_std=True)`` if it's supported.
+        The pre-screening starts once there are more evaluated individuals than encoded features
+        (and at least 5).
+        If ``None``, all the offspring are cross-validated.
+
+    surrogate_candidates : int, default=5
+        Number of offspring bred for each one that is cross-validated, when ``surrogate`` is set.
+
+    surrogate_exploration : float, default=1.0
+        Weight of the uncertainty of the surrogate predictions, bigger values favor the
+        offspring in the less explored regions of the search space.
+
+    vectorized : bool, default=False
+        If ``True``, the selection, crossover and mutation work over the whole population
+        at once, stored as a numeric matrix where the categorical values are the position
+        of the choice during the whole evolution, and the individuals are only built to be
+        evaluated and to update the hall of fame. It makes the breeding of large populations
+        much faster, for the cases where the evaluations are cheap.
+        The ``asyncSteadyState`` algorithm breeds one offspring at a time, so it's not vectorized.
+
+    objectives : list of {'fit_time', 'predict_time', 'model_size'}, default=None
+        Costs to minimize along with the cv-score, if set, the search is multi-objective:
+        the fitness of each individual has its score followed by the average fit time,
+        time to predict and score the test partition or size in bytes of the pickled fitted
+        estimator of the cv splits, the selection keeps the non-dominated individuals and the
+        result is a Pareto front instead of a single best candidate.
+        It requires the ``'eaMuPlusLambda'`` or ``'eaMuCommaLambda'`` algorithm and doesn't
+        support successive halving, racing, surrogate pre-screening nor a trial store,
+        as they only compare the scores. ``keep_top_k`` is ignored, the hall of fame is the
+        Pareto front.
+
+    pareto_selection : {'NSGA2', 'SPEA2'}, default='NSGA2'
+        Selection of the multi-objective search, :func:`deap.tools.selNSGA2` or
+        :func:`deap.tools.selSPEA2`. Only used if ``objectives`` is set.
+
+    max_time : float, default=None
+        Maximum number of seconds of the search, counted from the start of the fit.
+        Unlike the :class:`~sklearn_genetic.callbacks.TimerStopping` callback, that is only
+        checked at the end of each generation, it's checked after each fit of a cv split:
+        when the deadline passes, the candidates that are not evaluated yet are discarded,
+        the queued fits are cancelled and the search finishes with the evaluated individuals.
+        If ``None``, there is no time limit.
+
+    max_evaluations : int, default=None
+        Maximum number of evaluations recorded in the logbook during the fit, the candidates
+        beyond it are not evaluated and the search finishes with the evaluated individuals.
+        The individuals found in the fitness cache don't count.
+        If ``None``, there is no limit.
+
+    fit_timeout : float, default=None
+        Maximum number of seconds of the evaluation of a candidate in all its cv splits.
+        If set, the candidates are evaluated by a :class:`~sklearn_genetic.executors.TimeoutExecutor`
+        with ``n_jobs`` processes, the process of an evaluation that takes longer is terminated,
+        its splits get the ``error_score`` and its record of the logbook has ``timed_out=True``,
+        so the duration of a generation is bounded by the timeout instead of by the slowest candidate.
+        It can't be used with an ``executor``, a ``TimeoutExecutor`` can be passed as executor instead.
+        If ``None``, the evaluations are never stopped.
+
     Attributes
     ----------
 
     logbook : :class:`DEAP.tools.Logbook`
         Contains the logs of every set of hyperparameters fitted with its average scoring metric.
+        Its ``parameters`` chapter is a :class:`~sklearn_genetic.utils.EvaluationLog`, with a record
+        per evaluation that has the hyperparameters, the ``score`` and the ``cv_scores`` of each split,
+        the total ``fit_time`` and ``score_time``, the ``fit_times`` and ``score_times`` of each split
+        and the ``peak_memory``, the bytes added by the fit over the memory in use when it started,
+        ``nan`` if it didn't rise (see :func:`~sklearn_genetic.utils.cv_scores.peak_memory`).
+        With a :class:`~sklearn_genetic.executors.TimeoutExecutor`, the records also have ``timed_out``.
     history : dict
         Dictionary of the form:
         {"gen": [],
         "fitness": [],
         "fitness_std": [],
         "fitness_max": [],
-        "fitness_min": []}
+        "fitness_min": [],
+        "variation_time": [],
+        "evaluation_time": [],
+        "hall_of_fame_time": [],
+        "selection_time": [],
+        "stats_time": [],
+        "callbacks_time": []}
 
          *gen* returns the index of the evaluated generations.
          Each entry on the others lists, represent the average metric in each generation.
+         The ``*_time`` entries are the wall time in seconds spent in each phase of the generation.
 
     best_estimator_ : estimator
         Estimator that was chosen by the search, i.e. estimator
@@ -150,6 +371,33 @@ class GASearchCV(BaseSearchCV):
     best_params_ : dict
         Parameter setting that gave the best results on the hold out data.
 
+    cv_results_ : dict of numpy (masked) ndarrays
+        A dict with keys as column headers and values as columns, with the same layout as
+        the ``cv_results_`` of :class:`~sklearn.model_selection.GridSearchCV`, and a row per
+        evaluation of the logbook. The evaluations that didn't score all the cv splits, because
+        of the successive halving or the racing, have ``nan`` split scores and the average of
+        the evaluated ones as ``mean_test_score``.
+        It's updated as soon as each evaluation completes, so it can be read from a callback.
+
+    best_index_ : int
+        The index of the ``cv_results_`` row with the best ``mean_test_score``.
+
+    cache_hits_ : int
+        Number of individuals whose fitness was taken from the cache. Only available if ``cache_size`` is set.
+
+    cache_misses_ : int
+        Number of individuals that had to be cross-validated. Only available if ``cache_size`` is set.
+
+    pareto_front_ : list of dict
+        Non-dominated candidates of a multi-objective search, sorted by score, each one with its
+        ``params``, ``score`` and the value of each one of the ``objectives``. ``best_params_``
+        are the ones with the highest score. Only available if ``objectives`` is set.
+
+    budget_exhausted_ : bool
+        Whether the search reached ``max_time`` or ``max_evaluations``, or it was interrupted
+        with a :class:`KeyboardInterrupt`, so it may have finished before the last generation.
+        In all the cases, the results are the ones of the evaluated individuals.
+
     """
 
     def __init__(
@@ -173,6 +421,30 @@ class GASearchCV(BaseSearchCV):
         pre_dispatch="2*n_jobs",
         error_score=np.nan,
         log_config=None,
+        cache_size=None,
+        trial_store=None,
+        precompute_folds=False,
+        min_resources=None,
+        max_resources=None,
+        resource="n_samples",
+        halving_factor=3,
+        racing=None,
+        racing_alpha=0.05,
+        racing_score_range=1.0,
+        executor=None,
+        shared_data=False,
+        temp_folder=None,
+        warm_start_params=None,
+        warm_start_cache_size=100,
+        surrogate=None,
+        surrogate_candidates=5,
+        surrogate_exploration=1.0,
+        vectorized=False,
+        objectives=None,
+        pareto_selection="NSGA2",
+        max_time=None,
+        max_evaluations=None,
+        fit_timeout=None,
     ):
 
         self.estimator = clone(estimator)
@@ -194,7 +466,6 @@ class GASearchCV(BaseSearchCV):
         self.n_jobs = n_jobs
         self.pre_dispatch = pre_dispatch
         self.error_score = error_score
-        self.creator = creator
         self.logbook = None
         self.history = None
         self._n_iterations = self.generations + 1
@@ -209,11 +480,54 @@ class GASearchCV(BaseSearchCV):
         self.hof = None
         self.X_predict = None
         self.scorer_ = None
-        self.cv_results_ = None
-        self.best_index_ = None
+        self._cv_results = None
         self.multimetric_ = False
         self.log_config = log_config
+        self.cache_size = cache_size
+        self._cache = None
+        self.trial_store = trial_store
+        self._trial_store = None
+        self.precompute_folds = precompute_folds
+        self._folds = None
+        self._fit_params = None
+        self._fingerprint = None
+        self.min_resources = min_resources
+        self.max_resources = max_resources
+        self.resource = resource
+        self.halving_factor = halving_factor
+        self._max_resources = None
+        self._halving_budgets = None
+        self._halving_folds = None
+        self.racing = racing
+        self.racing_alpha = racing_alpha
+        self.racing_score_range = racing_score_range
+        self.executor = executor
+        self._executor = None
+        self._fold_ids = None
+        self.shared_data = shared_data
+        self.temp_folder = temp_folder
+        self._temp_folder = None
+        self.warm_start_params = warm_start_params
+        self.warm_start_cache_size = warm_start_cache_size
+        self._warm_start = None
+        self.surrogate = surrogate
+        self.surrogate_candidates = surrogate_candidates
+        self.surrogate_exploration = surrogate_exploration
+        self._surrogate = None
+        self._surrogate_n_samples = 0
+        self.vectorized = vectorized
+        self.objectives = objectives
+        self.pareto_selection = pareto_selection
+        self._objectives = list(objectives) if objectives else []
+        self._individual_class = (
+            MultiObjectiveIndividual if self._objectives else Individual
+        )
+        self.max_time = max_time
+        self.max_evaluations = max_evaluations
+        self._budget = None
+        self.fit_timeout = fit_timeout
         self._initial_training_time = None
+        self._resumed = False
 
         # Check that the estimator is compatible with scikit-learn
         if not is_classifier(self.estimator) and not is_regressor(self.estimator):
@@ -234,6 +548,123 @@ class GASearchCV(BaseSearchCV):
         # Saves the param_grid and computes some extra properties in the same object
         self.space = Space(param_grid)
 
+        if algorithm == Algorithms.asyncSteadyState.value and (
+            min_resources is not None or racing is not None
+        ):
+            raise ValueError(
+                "The asyncSteadyState algorithm doesn't support successive halving nor racing"
+            )
+
+        if algorithm == Algorithms.asyncSteadyState.value and getattr(
+            log_config, "run_per_generation", False
+        ):
+            raise ValueError(
+                "The asyncSteadyState algorithm has no generations, "
+                "it doesn't support log_config with run_per_generation=True"
+            )
+
+        if racing is not None and racing not in RacingTests.list():
+            raise ValueError(
+                f"racing must be one of {RacingTests.list()} or None, got {racing} instead"
+            )
+
+        if self.min_resources is not None:
+            if self.halving_factor <= 1:
+                raise ValueError(
+                    f"halving_factor must be greater than 1, got {self.halving_factor} instead"
+                )
+            if self.resource in self.space.parameters:
+                raise ValueError(
+                    f"The resource {self.resource} can not be part of the param_grid"
+                )
+            if self.resource != "n_samples" and self.max_resources is None:
+                raise ValueError(
+                    "max_resources must be set when the resource is an estimator parameter"
+                )
+
+        if self.warm_start_params is not None:
+            if "warm_start" not in self.estimator.get_params():
+                raise ValueError(
+                    f"The estimator {type(self.estimator).__name__} doesn't support warm_start"
+                )
+            growable = list(self.space.parameters)
+            if self.min_resources is not None:
+                growable.append(self.resource)
+            for parameter in self.warm_start_params:
+                if parameter not in growable:
+                    raise ValueError(
+                        f"The warm start parameter {parameter} must be part of the param_grid "
+                        f"or be the resource of the successive halving"
+                    )
+
+        if self.surrogate is not None:
+            if not is_regressor(self.surrogate):
+                raise ValueError(
+                    f"surrogate must be a scikit-learn regressor, got {self.surrogate} instead"
+                )
+            if (
+                not isinstance(self.surrogate_candidates, int)
+                or self.surrogate_candidates < 1
+            ):
+                raise ValueError(
+                    f"surrogate_candidates must be a positive integer, "
+                    f"got {self.surrogate_candidates} instead"
+                )
+
+        if max_time is not None and (
+            not isinstance(max_time, numbers.Real) or max_time <= 0
+        ):
+            raise ValueError(
+                f"max_time must be a positive number or None, got {max_time} instead"
+            )
+        if max_evaluations is not None and (
+            not isinstance(max_evaluations, numbers.Integral) or max_evaluations < 1
+        ):
+            raise ValueError(
+                f"max_evaluations must be a positive integer or None, "
+                f"got {max_evaluations} instead"
+            )
+
+        if fit_timeout is not None:
+            if not isinstance(fit_timeout, numbers.Real) or fit_timeout <= 0:
+                raise ValueError(
+                    f"fit_timeout must be a positive number or None, got {fit_timeout} instead"
+                )
+            if executor is not None:
+                raise ValueError(
+                    "fit_timeout can't be used with an executor, "
+                    "use a TimeoutExecutor as the executor instead"
+                )
+
+        if self._objectives:
+            for objective in self._objectives:
+                if objective not in Objectives.list():
+                    raise ValueError(
+                        f"objectives must be a list with values of {Objectives.list()}, "
+                        f"got {objective} instead"
+                    )
+            if pareto_selection not in ParetoSelection.list():
+                raise ValueError(
+                    f"pareto_selection must be one of {ParetoSelection.list()}, "
+                    f"got {pareto_selection} instead"
+                )
+            if algorithm not in [
+                Algorithms.eaMuPlusLambda.value,
+                Algorithms.eaMuCommaLambda.value,
+            ]:
+                raise ValueError(
+                    "The multi-objective search is only supported by the "
+                    "eaMuPlusLambda and eaMuCommaLambda algorithms"
+                )
+            if any(
+                option is not None
+                for option in [min_resources, racing, surrogate, trial_store]
+            ):
+                raise ValueError(
+                    "The multi-objective search doesn't support successive halving, "
+                    "racing, surrogate pre-screening nor a trial store"
+                )
+
         super(GASearchCV, self).__init__(
             estimator=estimator,
             scoring=scoring,
@@ -251,9 +682,6 @@ class GASearchCV(BaseSearchCV):
         and create other objects to hold the hof, logbook and stats.
         """
 
-        self.creator.create("FitnessMax", base.Fitness, weights=[1.0])
-        self.creator.create("Individual", list, fitness=creator.FitnessMax)
-
         attributes = []
         # Assign all the parameters defined in the param_grid
         # It uses the distribution parameter to set the sampling function
@@ -266,14 +694,12 @@ class GASearchCV(BaseSearchCV):
         self.toolbox.register(
             "individual",
             tools.initCycle,
-            creator.Individual,
+            self._individual_class,
             tuple(attributes),
             n=IND_SIZE,
         )
 
-        self.toolbox.register(
-            "population", tools.initRepeat, list, self.toolbox.individual
-        )
+        self.toolbox.register("population", self._init_population)
 
         self.toolbox.register("mate", tools.cxTwoPoint)
         self.toolbox.register("mutate", self.mutate)
@@ -284,18 +710,71 @@ class GASearchCV(BaseSearchCV):
         else:
             self.toolbox.register("select", tools.selRoulette)
 
+        if self._objectives:
+            if self.pareto_selection == ParetoSelection.spea2.value:
+                self.toolbox.register("select", tools.selSPEA2)
+            else:
+                self.toolbox.register("select", tools.selNSGA2)
+
+        if self._vectorized():
+            # The population is an ArrayPopulation during the whole evolution
+            self.toolbox.register(
+                "select",
+                self._select,
+                pareto_select=self.toolbox.select if self._objectives else None,
+            )
+            self.toolbox.register("var_and", var_and)
+            self.toolbox.register("var_or", var_or)
+
         self.toolbox.register("evaluate", self.evaluate)
+        self.toolbox.register("evaluate_population", self.evaluate_population)
+        self.toolbox.register("submit", self._submit)
+        self.toolbox.register("collect", self._collect)
 
         self._pop = self.toolbox.population(n=self.population_size)
-        self._hof = tools.HallOfFame(self.keep_top_k)
+        if self._objectives:
+            self._hof = tools.ParetoFront()
+        else:
+            self._hof = tools.HallOfFame(self.keep_top_k)
 
-        self._stats = tools.Statistics(lambda ind: ind.fitness.values)
+        # The statistics are computed over the score, the first value of the fitness
+        self._stats = tools.Statistics(score_fitness)
         self._stats.register("fitness", np.mean)
         self._stats.register("fitness_std", np.std)
         self._stats.register("fitness_max", np.max)
         self._stats.register("fitness_min", np.min)
 
+        # The evaluations are recorded directly in a columnar chapter, the header
+        # prints it when the logbook is printed
         self.logbook = tools.Logbook()
+        self.logbook.header = ["parameters"]
+        self.logbook.chapters["parameters"] = EvaluationLog(self.space)
+
+        if self.cache_size is not None:
+            self._cache = FitnessCache(self.cache_size)
+
+        if self.surrogate is not None:
+            self.toolbox.register("prescreen", self.prescreen)
+            self._surrogate = None
+            self._surrogate_n_samples = 0
+
+    def _init_population(self, n):
+        """
+        Creates the initial population, sampling each hyperparameter
+        for all the individuals at once
+
+        Parameters
+        ----------
+        n: int
+            Number of individuals
+
+        Returns
+        -------
+            List with the random individuals
+        """
+        return [
+            self._individual_class(values) for values in self.space.sample_population(n)
+        ]
 
     def mutate(self, individual):
         """
@@ -321,6 +800,47 @@ class GASearchCV(BaseSearchCV):
 
         return [individual]
 
+    def _vectorized(self):
+        """
+        Returns
+        -------
+            ``True`` if the population is bred as an array, the asynchronous algorithm
+            breeds one offspring at a time so it always uses the individuals
+        """
+        return self.vectorized and self.algorithm != Algorithms.asyncSteadyState.value
+
+    def _select(self, population, k, pareto_select=None):
+        """
+        Selection of the population bred as an array, a vectorized tournament or roulette,
+        according to ``elitism``, or the pareto selection of the multi-objective searches
+
+        Parameters
+        ----------
+        population: :class:`~sklearn_genetic.utils.population.ArrayPopulation`
+            The evaluated individuals to select from
+        k: int
+            Number of individuals to select
+        pareto_select: callable, default=None
+            Selection of the multi-objective searches, like :func:`deap.tools.selNSGA2`,
+            it's applied to the individuals of the population
+
+        Returns
+        -------
+            The selected individuals as a new
+            :class:`~sklearn_genetic.utils.population.ArrayPopulation`
+        """
+        if pareto_select is not None:
+            individuals = population.to_individuals()
+            rows = {id(individual): row for row, individual in enumerate(individuals)}
+            selected = [
+                rows[id(individual)] for individual in pareto_select(individuals, k)
+            ]
+        elif self.elitism:
+            selected = sel_tournament(population.scores(), k, self.tournament_size)
+        else:
+            selected = sel_roulette(population.scores(), k)
+        return population.take(selected)
+
     def evaluate(self, individual):
         """
         Compute the cross-validation scores and record the logbook and mlflow (if specified)
@@ -335,45 +855,983 @@ class GASearchCV(BaseSearchCV):
 
         """
 
-        # Dictionary representation of the individual with key-> hyperparameter name, value -> value
-        current_generation_params = {
-            key: individual[n] for n, key in enumerate(self.space.parameters)
-        }
+        return self.evaluate_population([individual])[0]
+
+    def evaluate_population(self, individuals):
+        """
+        Compute the cross-validation scores of a group of individuals and record the logbook
+        and mlflow (if specified).
+        All the (individual, cv split) fits are dispatched together, so the parallelism is not
+        limited by the number of cv splits.
+
+        Parameters
+        ----------
+        individuals: list of Individual objects
+            The individuals (sets of hyperparameters) that are being evaluated
+
+        Returns
+        -------
+            List with the fitness value of each estimator candidate, in the same order as the individuals,
+            ``None`` for the ones that weren't evaluated because the budget of the search ran out
+        """
+
+        # Dictionary representation of the individuals with key-> hyperparameter name, value -> value
+        candidates = [
+            {key: individual[n] for n, key in enumerate(self.space.parameters)}
+            for individual in individuals
+        ]
+
+        if self._cache is None:
+            return self._evaluate_and_record(candidates)
+
+        # Only the distinct candidates that are not in the cache are cross-validated
+        keys, cached_fitnesses, pending = self._cache.lookup(candidates)
+        new_fitnesses = self._evaluate_and_record(list(pending.values()))
+        for key, fitness in zip(pending.keys(), new_fitnesses):
+            # The candidates that weren't evaluated because the budget ran out have no fitness
+            if fitness is not None:
+                self._cache.put(key, fitness)
+            cached_fitnesses[key] = fitness
+        return [cached_fitnesses[key] for key in keys]
+
+    def prescreen(self, variation):
+        """
+        Breeds ``surrogate_candidates`` offspring for each one that is needed and keeps, for each
+        position of the offspring, the most promising candidate according to the surrogate model
 
-        local_estimator = clone(self.estimator)
-        local_estimator.set_params(**current_generation_params)
-
-        # Compute the cv-score
-        cv_scores = cross_val_score(
-            local_estimator,
-            self.X_,
-            self.y_,
-            cv=self.cv,
-            scoring=self.scoring,
-            n_jobs=self.n_jobs,
-            pre_dispatch=self.pre_dispatch,
-            error_score=self.error_score,
+        Parameters
+        ----------
+        variation: callable
+            Function without arguments that breeds the offspring
+
+        Returns
+        -------
+            List with the selected offspring
+        """
+        batches = [variation() for _ in range(self.surrogate_candidates)]
+        if len(batches) == 1 or not self._fit_surrogate():
+            return batches[0]
+
+        if isinstance(batches[0], ArrayPopulation):
+            return self._prescreen_array(batches)
+
+        # The unchanged individuals are ranked by its fitness and the new ones by the surrogate
+        candidates = [ind for batch in batches for ind in batch]
+        new_candidates = [ind for ind in candidates if not ind.fitness.valid]
+        acquisition = {}
+        if new_candidates:
+            mean, std = self._surrogate_predict(self.space.encode(new_candidates))
+            values = mean + self.surrogate_exploration * std
+            acquisition = {id(ind): value for ind, value in zip(new_candidates, values)}
+
+        offspring = []
+        for slot in zip(*batches):
+            offspring.append(
+                max(
+                    slot,
+                    key=lambda ind: (
+                        ind.fitness.values[0]
+                        if ind.fitness.valid
+                        else acquisition[id(ind)]
+                    ),
+                )
+            )
+        return offspring
+
+    def _prescreen_array(self, batches):
+        """
+        :meth:`prescreen` of the offspring bred as an array
+
+        Parameters
+        ----------
+        batches: list of :class:`~sklearn_genetic.utils.population.ArrayPopulation`
+            The offspring bred by each call to the variation function
+
+        Returns
+        -------
+            The selected offspring as a new
+            :class:`~sklearn_genetic.utils.population.ArrayPopulation`
+        """
+        candidates = batches[0]
+        for batch in batches[1:]:
+            candidates = candidates + batch
+
+        # The unchanged individuals are ranked by its fitness and the new ones by the surrogate
+        acquisition = candidates.scores().copy()
+        new = np.flatnonzero(~candidates.evaluated())
+        if len(new):
+            mean, std = self._surrogate_predict(
+                self.space.encode(candidates.take(new).values())
+            )
+            acquisition[new] = mean + self.surrogate_exploration * std
+
+        n_offspring = len(batches[0])
+        best = np.argmax(acquisition.reshape(len(batches), n_offspring), axis=0)
+        return candidates.take(best * n_offspring + np.arange(n_offspring))
+
+    def _fit_surrogate(self):
+        """
+        Fits the surrogate model with the hyperparameters and fitness of the complete evaluations
+        of the logbook, it's only refitted if there are new evaluations
+
+        Returns
+        -------
+            ``True`` if there are enough evaluations to use the surrogate model
+        """
+        evaluations = self.logbook.chapters["parameters"]
+        if not len(evaluations):
+            return False
+
+        complete = np.isfinite(evaluations.column("score"))
+        if self.racing is not None:
+            complete &= ~evaluations.column("raced")
+        if self.min_resources is not None:
+            complete &= evaluations.column("resources") == self._max_resources
+        records = [evaluations[row] for row in np.flatnonzero(complete)]
+
+        X = self.space.encode(
+            [[record[key] for key in self.space.parameters] for record in records]
         )
+        if len(records) < max(5, X.shape[1] + 1):
+            return False
+
+        if len(records) != self._surrogate_n_samples:
+            y = self.criteria_sign * np.array(
+                [record["score"] for record in records], dtype=float
+            )
+            self._surrogate = clone(self.surrogate).fit(X, y)
+            self._surrogate_n_samples = len(records)
+
+        return True
+
+    def _surrogate_predict(self, X):
+        """
+        Returns
+        -------
+        mean, std: tuple
+            The predicted fitness of the encoded hyperparameters and its uncertainty
+        """
+        try:
+            return self._surrogate.predict(X, return_std=True)
+        except TypeError:
+            mean = self._surrogate.predict(X)
+
+        # Only needed by the searches with a surrogate, so it's not imported with the module
+        from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+
+        if isinstance(self._surrogate, (RandomForestRegressor, ExtraTreesRegressor)):
+            std = np.std(
+                [tree.predict(X) for tree in self._surrogate.estimators_], axis=0
+            )
+        else:
+            std = np.zeros(len(mean))
+        return mean, std
+
+    def _evaluate_and_record(self, candidates):
+        """
+        Cross-validates the candidates and records them in the logbook and mlflow (if specified).
+        If a trial store is set, the candidates already in the store are not cross-validated
+        and each new candidate is saved as soon as all its splits are scored.
+
+        Parameters
+        ----------
+        candidates: list of dict
+            Hyperparameters of each candidate
+
+        Returns
+        -------
+            List with the fitness of each candidate, ``None`` for the ones that
+            weren't evaluated because the budget of the search ran out
+        """
+
+        n_candidates = len(candidates)
+        if self._budget is not None:
+            candidates = candidates[: self._budget.remaining_evaluations()]
+
+        results = [None] * len(candidates)
+
+        if self._trial_store is not None:
+            trial_keys = [self._trial_key(parameters) for parameters in candidates]
+            for n, key in enumerate(trial_keys):
+                cv_scores = self._trial_store.get(key)
+                if cv_scores is not None:
+                    results[n] = self._cv_result(np.array(cv_scores, dtype=float))
+
+        new_candidates = [n for n, result in enumerate(results) if result is None]
+
+        if self.min_resources is None:
+            new_results = self._cross_validate([candidates[n] for n in new_candidates])
+        else:
+            new_results = self._successive_halving(
+                [candidates[n] for n in new_candidates]
+            )
+
+        for n, result in zip(new_candidates, new_results):
+            results[n] = result
+            # Only the complete evaluations with all the resources that didn't time out are stored
+            if (
+                self._trial_store is not None
+                and result is not None
+                and result["cv_scores"] is not None
+                and not result["timed_out"]
+            ):
+                self._trial_store.put(trial_keys[n], candidates[n], result["cv_scores"])
+
+        for current_generation_params, result in zip(candidates, results):
+            if result is not None:
+                self._record(current_generation_params, result)
+
+        if self.log_config is not None:
+            self.log_config.end_generation()
+
+        fitnesses = [
+            None if result is None else self._fitness(result) for result in results
+        ]
+        return fitnesses + [None] * (n_candidates - len(candidates))
+
+    def _fitness(self, result):
+        """
+        Parameters
+        ----------
+        result: dict
+            The result of the evaluation of a candidate
+
+        Returns
+        -------
+            The fitness values of the candidate, the cv-score with the criteria sign
+            followed by the negated cost of each objective of a multi-objective search
+        """
+        fitness = [self.criteria_sign * result["score"]]
+        for objective in self._objectives:
+            fitness.append(-self._objective_value(result, objective))
+        return fitness
+
+    def _objective_value(self, result, objective):
+        """
+        Average over the cv splits of the cost measured for an objective
+        """
+        values = {
+            Objectives.fit_time.value: result["fit_times"],
+            Objectives.predict_time.value: result["score_times"],
+            Objectives.model_size.value: result["model_sizes"],
+        }[objective]
+        if values is None:
+            raise ValueError(
+                f"The executor didn't measure the {objective} of the evaluations, "
+                f"it's needed by the multi-objective search"
+            )
+        return float(np.mean(values))
+
+    def _record(self, parameters, result):
+        """
+        Records the evaluation of a candidate in the logbook and mlflow (if specified)
 
-        score = np.mean(cv_scores)
+        Parameters
+        ----------
+        parameters: dict
+            Hyperparameters of the candidate
+        result: dict
+            The result of the evaluation of the candidate
+        """
+        score = result["score"]
 
         # Uses the log config to save in remote log server (e.g MLflow)
         if self.log_config is not None:
+            local_estimator = clone(self.estimator)
+            local_estimator.set_params(**parameters)
             self.log_config.create_run(
-                parameters=current_generation_params,
+                parameters=parameters,
                 score=score,
                 estimator=local_estimator,
             )
 
-        current_generation_params["score"] = score
+        record = {**parameters, "score": score, "cv_scores": result["cv_scores"]}
+        if self.min_resources is not None:
+            record["resources"] = result["resources"]
+        if self.racing is not None:
+            record["raced"] = result["raced"]
+
+        # The times and memory are not measured for the evaluations of the trial store
+        fit_times, score_times = result["fit_times"], result["score_times"]
+        record.update(
+            fit_time=None if fit_times is None else float(np.sum(fit_times)),
+            score_time=None if score_times is None else float(np.sum(score_times)),
+            fit_times=fit_times,
+            score_times=score_times,
+            peak_memory=result["peak_memory"],
+        )
+        if result["model_sizes"] is not None:
+            record["model_size"] = float(np.mean(result["model_sizes"]))
+        if isinstance(self._executor, TimeoutExecutor):
+            record["timed_out"] = result["timed_out"]
 
         # Log the hyperparameters and the cv-score
-        self.logbook.record(parameters=current_generation_params)
+        self.logbook.chapters["parameters"].record(**record)
+        if self._budget is not None:
+            self._budget.add_evaluation()
+        self._cv_results.add(
+            parameters,
+            score,
+            cv_scores=result["cv_scores"],
+            fit_times=result["fit_times"],
+            score_times=result["score_times"],
+        )
+
+    def _submit(self, individual):
+        """
+        Starts the evaluation of an individual in the executor, used by the
+        asynchronous algorithms. If the fitness is found in the cache or the trial store,
+        it's set without submitting it.
+
+        Parameters
+        ----------
+        individual: Individual object
+            The individual (set of hyperparameters) that is being evaluated
+
+        Returns
+        -------
+            A :class:`concurrent.futures.Future` with the cv-scores of the individual,
+            or ``None`` if its fitness was already set
+        """
+        parameters = {key: individual[n] for n, key in enumerate(self.space.parameters)}
+
+        if self._cache is not None:
+            keys, fitnesses, pending = self._cache.lookup([parameters])
+            if not pending:
+                individual.fitness.values = fitnesses[keys[0]]
+                return None
+
+        if self._trial_store is not None:
+            cv_scores = self._trial_store.get(self._trial_key(parameters))
+            if cv_scores is not None:
+                individual.fitness.values = self._complete_evaluation(
+                    parameters, as_evaluation(cv_scores), store=False
+                )
+                return None
+
+        return self._executor.submit(parameters, self._fold_indices(self._folds))
+
+    def _collect(self, individual, future):
+        """
+        Records the evaluation of an individual submitted with ``_submit``
+
+        Parameters
+        ----------
+        individual: Individual object
+            The individual (set of hyperparameters) that was evaluated
+        future: :class:`concurrent.futures.Future`
+            The completed evaluation
+
+        Returns
+        -------
+            The fitness value of the individual
+        """
+        parameters = {key: individual[n] for n, key in enumerate(self.space.parameters)}
+        return self._complete_evaluation(parameters, as_evaluation(future.result()))
+
+    def _complete_evaluation(self, parameters, evaluation, store=True):
+        result = self._cv_result(**evaluation)
+
+        if store and self._trial_store is not None and not result["timed_out"]:
+            self._trial_store.put(
+                self._trial_key(parameters), parameters, evaluation["cv_scores"]
+            )
+        fitness = self._fitness(result)
+        if self._cache is not None:
+            self._cache.put(genome_key(parameters), fitness)
 
-        return [self.criteria_sign * score]
+        self._record(parameters, result)
+        return fitness
+
+    def _cv_result(
+        self,
+        cv_scores,
+        resources=None,
+        raced=False,
+        fit_times=None,
+        score_times=None,
+        peak_memory=None,
+        model_sizes=None,
+        timed_out=False,
+    ):
+        """
+        Summary of the evaluation of a candidate
+
+        Parameters
+        ----------
+        cv_scores: array
+            Score of each evaluated cv split
+        resources: int, default=None
+            Resources used in the evaluation, if ``None``, it used all of them
+        raced: bool, default=False
+            Whether the evaluation was stopped before scoring all the cv splits
+        fit_times: array, default=None
+            Fit time of each evaluated cv split, if it was measured
+        score_times: array, default=None
+            Score time of each evaluated cv split, if it was measured
+        peak_memory: float, default=None
+            Peak memory in bytes of the evaluation, if it was measured
+        model_sizes: array, default=None
+            Size in bytes of the fitted estimator of each evaluated cv split, if it was measured
+        timed_out: bool, default=False
+            Whether the evaluation was stopped because it took longer than the timeout
+
+        Returns
+        -------
+            Dictionary with the cv_scores (``None`` if the evaluation was not complete
+            or didn't use all the resources), the average score, the resources,
+            if the candidate was raced, the fit and score times, the peak memory,
+            the model sizes and if the evaluation timed out
+        """
+        resources = self._max_resources if resources is None else resources
+        complete = not raced and resources == self._max_resources
+        return {
+            "cv_scores": cv_scores if complete else None,
+            "score": np.mean(cv_scores),
+            "resources": resources,
+            "raced": raced,
+            "fit_times": fit_times,
+            "score_times": score_times,
+            "peak_memory": peak_memory,
+            "model_sizes": model_sizes,
+            "timed_out": timed_out,
+        }
+
+    def _cross_validate(self, candidates):
+        """
+        Cross-validates the candidates with all the resources, racing them if specified
+
+        Parameters
+        ----------
+        candidates: list of dict
+            Hyperparameters of each candidate
+
+        Yields
+        -------
+            The result of each candidate, in the same order as the candidates,
+            until the budget of the search runs out
+        """
+        if self.racing is not None:
+            yield from self._race(candidates)
+        else:
+            for evaluation in self._evaluate_candidates(candidates):
+                yield self._cv_result(**evaluation)
+
+    def _race(self, candidates):
+        """
+        Scores the candidates one cv split at a time, a candidate stops being evaluated
+        when the statistical test set in ``racing`` shows that its average score can't
+        reach the fitness of the worst individual in the current population
+
+        Parameters
+        ----------
+        candidates: list of dict
+            Hyperparameters of each candidate
+
+        Returns
+        -------
+            List with the result of each candidate, ``None`` for the ones whose
+            evaluation wasn't completed because the budget of the search ran out
+        """
+        threshold = self._selection_threshold()
+        evaluations = [[] for _ in candidates]
+        fold_scores = [[] for _ in candidates]
+        raced = [False] * len(candidates)
+        running = list(range(len(candidates)))
+
+        for n_fold, fold in enumerate(self._folds):
+            if not running:
+                break
+
+            for n, evaluation in zip(
+                running,
+                self._evaluate_candidates(
+                    [candidates[n] for n in running], folds=[fold]
+                ),
+            ):
+                evaluations[n].append(evaluation)
+                fold_scores[n].append(evaluation["cv_scores"][0])
+
+            if self._out_of_budget():
+                break
+
+            # There is nothing to save after the last cv split
+            if threshold is None or n_fold == len(self._folds) - 1:
+                continue
+
+            for n in running:
+                raced[n] = self._is_hopeless(fold_scores[n], threshold)
+            running = [n for n in running if not raced[n]]
+
+        return [
+            (
+                self._cv_result(
+                    **concatenate_evaluations(candidate_evaluations),
+                    raced=candidate_raced,
+                )
+                if candidate_raced or len(candidate_evaluations) == len(self._folds)
+                else None
+            )
+            for candidate_evaluations, candidate_raced in zip(evaluations, raced)
+        ]
+
+    def _selection_threshold(self):
+        """
+        Returns
+        -------
+            The worst fitness in the current population, ``None`` if it hasn't been evaluated
+        """
+        if isinstance(self._pop, ArrayPopulation):
+            fitnesses = self._pop.scores()[self._pop.evaluated()].tolist()
+        else:
+            fitnesses = [
+                ind.fitness.values[0] for ind in self._pop if ind.fitness.valid
+            ]
+        if not fitnesses:
+            return None
+        return min(fitnesses)
+
+    def _is_hopeless(self, fold_scores, threshold):
+        """
+        Parameters
+        ----------
+        fold_scores: list
+            Scores of the evaluated cv splits
+        threshold: float
+            Fitness that the candidate should reach
+
+        Returns
+        -------
+            ``True`` if the upper confidence bound of the candidate average fitness
+            is lower than the threshold
+        """
+        fitnesses = self.criteria_sign * np.array(fold_scores, dtype=float)
+        n_folds = len(fitnesses)
+
+        if self.racing == RacingTests.t_test.value:
+            if n_folds < 2:
+                return False
+            margin = (
+                stats.t.ppf(1 - self.racing_alpha, n_folds - 1)
+                * np.std(fitnesses, ddof=1)
+                / np.sqrt(n_folds)
+            )
+        else:
+            margin = self.racing_score_range * np.sqrt(
+                np.log(1 / self.racing_alpha) / (2 * n_folds)
+            )
+
+        return bool(np.mean(fitnesses) + margin < threshold)
+
+    def _successive_halving(self, candidates):
+        """
+        Evaluates the candidates with an increasing amount of resources, in each rung
+        only the best ``1 / halving_factor`` candidates are promoted to the next one,
+        the last rung uses all the resources.
+        The score of the eliminated candidates is bounded by the worst score of the
+        promoted ones, so they can't outperform them in the selection.
+
+        Parameters
+        ----------
+        candidates: list of dict
+            Hyperparameters of each candidate
+
+        Returns
+        -------
+            List with the result of each candidate. If the budget of the search runs out,
+            the candidates keep the result of the last rung they were evaluated in,
+            ``None`` if they weren't evaluated
+        """
+
+        results = [None] * len(candidates)
+        promoted = list(range(len(candidates)))
+
+        for budget in self._halving_budgets:
+            if len(promoted) <= 1:
+                break
+
+            if self.resource == "n_samples":
+                rung_candidates = [candidates[n] for n in promoted]
+                rung_folds = self._halving_folds[budget]
+            else:
+                rung_candidates = [
+                    {**candidates[n], self.resource: budget} for n in promoted
+                ]
+                rung_folds = self._folds
+
+            for n, evaluation in zip(
+                promoted, self._evaluate_candidates(rung_candidates, rung_folds)
+            ):
+                results[n] = self._cv_result(**evaluation, resources=budget)
+
+            if self._out_of_budget():
+                promoted = []
+                break
+
+            # nan scores are sorted as the worst ones
+            rung_scores = np.array([results[n]["score"] for n in promoted])
+            n_promoted = int(np.ceil(len(promoted) / self.halving_factor))
+            ranking = np.argsort(-self.criteria_sign * rung_scores, kind="stable")
+            promoted = [promoted[i] for i in sorted(ranking[:n_promoted])]
+
+        if self.resource == "n_samples":
+            rung_candidates = [candidates[n] for n in promoted]
+        else:
+            rung_candidates = [
+                {**candidates[n], self.resource: self._max_resources} for n in promoted
+            ]
+
+        for n, result in zip(promoted, self._cross_validate(rung_candidates)):
+            results[n] = result
+
+        complete = [
+            result
+            for result in results
+            if result is not None and result["resources"] == self._max_resources
+        ]
+        worst_promoted = np.nanmin(
+            [self.criteria_sign * result["score"] for result in complete] + [np.inf]
+        )
+        for result in results:
+            if (
+                result is not None
+                and result["resources"] != self._max_resources
+                and self.criteria_sign * result["score"] > worst_promoted
+            ):
+                result["score"] = self.criteria_sign * worst_promoted
+
+        return results
+
+    def _set_halving_rungs(self):
+        """
+        Computes the resources of each rung of the successive halving evaluation,
+        and the subsampled cv folds if the resource is the number of samples
+        """
+
+        if self.resource == "n_samples":
+            self._max_resources = min(len(fold.train) for fold in self._folds)
+        else:
+            self._max_resources = self.max_resources
+
+        self._halving_budgets = []
+        budget = self.min_resources
+        while budget < self._max_resources:
+            self._halving_budgets.append(int(budget))
+            budget *= self.halving_factor
+
+        self._halving_folds = {}
+        if self.resource == "n_samples":
+            stratify = self.y_ if is_classifier(self.estimator) else None
+            for budget in self._halving_budgets:
+                self._halving_folds[budget] = [
+                    fold.subsample(budget, stratify=stratify, random_state=n)
+                    for n, fold in enumerate(self._folds)
+                ]
+
+    def _evaluate_candidates(self, candidates, folds=None):
+        """
+        Fits and scores every candidate in every cross-validation split
+        using the executor or a single joblib Parallel call.
+
+        Parameters
+        ----------
+        candidates: list of dict
+            Hyperparameters of each candidate
+        folds: list of :class:`~sklearn_genetic.utils.cv_scores.Fold`, default=None
+            The cv folds to use, if ``None``, the folds of the whole training data are used
+
+        Yields
+        -------
+        evaluation: dict
+            Test score, fit and score times of each split and peak memory, yielded
+            for each candidate in order as soon as all its splits are scored.
+            When the budget of the search runs out, or it's interrupted with a
+            :class:`KeyboardInterrupt`, the remaining candidates are not yielded
+            and their queued fits are cancelled
+        """
+
+        if not candidates:
+            return
+
+        folds = self._folds if folds is None else folds
+
+        try:
+            if self._executor is not None:
+                yield from self._map_executor(candidates, folds)
+            else:
+                yield from self._map_joblib(candidates, folds)
+        except KeyboardInterrupt:
+            if self._budget is None:
+                raise
+            print("INFO: The search was interrupted")
+            self._budget.interrupt()
+
+    def _map_executor(self, candidates, folds):
+        """
+        Evaluates the candidates with the executor until the deadline of the budget passes
+        """
+        timeout = None if self._budget is None else self._budget.remaining_time()
+        try:
+            for evaluation in self._executor.map(
+                candidates, self._fold_indices(folds), timeout=timeout
+            ):
+                yield as_evaluation(evaluation)
+                if self._out_of_budget():
+                    return
+        except futures.TimeoutError:
+            return
+
+    def _map_joblib(self, candidates, folds):
+        """
+        Evaluates the candidates with a single joblib Parallel call, the budget is checked
+        after each fit and the candidate whose splits are not all scored is discarded
+        """
+        tasks = (
+            delayed(fit_and_score)(
+                self.estimator,
+                fold,
+                self.scorer_,
+                parameters,
+                self.error_score,
+                self._warm_start,
+                Objectives.model_size.value in self._objectives,
+            )
+            for parameters in candidates
+            for fold in folds
+        )
+
+        try:
+            parallel = Parallel(
+                n_jobs=self.n_jobs,
+                pre_dispatch=self.pre_dispatch,
+                return_as="generator",
+            )
+        except TypeError:  # pragma: no cover
+            # joblib < 1.3 can't stream the results
+            parallel = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)
+
+        n_splits = len(folds)
+        candidate_results = []
+        for result in parallel(tasks):
+            candidate_results.append(result)
+            if len(candidate_results) == n_splits:
+                yield evaluation_result(candidate_results)
+                candidate_results = []
+            if self._out_of_budget():
+                return
+
+    def _release_joblib_workers(self):
+        """
+        Sends a cleanup task to each joblib worker, so they release the models cached for
+        the warm start of this search. The pool stays alive for the other joblib users.
+        """
+        n_workers = effective_n_jobs(self.n_jobs)
+        Parallel(n_jobs=self.n_jobs, batch_size=1)(
+            delayed(release_in_worker)(self._warm_start) for _ in range(n_workers)
+        )
+
+    def _out_of_budget(self):
+        """
+        Returns
+        -------
+            ``True`` if the budget of the search is exhausted
+        """
+        return self._budget is not None and self._budget.exhausted()
+
+    def _fold_indices(self, folds):
+        """
+        Position of the folds in the list of folds sent to the executor
+        """
+        return [self._fold_ids[id(fold)] for fold in folds]
+
+    def _start_executor(self):
+        """
+        Sets the executor of the fit and sends it all the folds the candidates
+        can be evaluated on
+        """
+        self._executor = check_executor(self.executor)
+        if self.fit_timeout is not None:
+            self._executor = TimeoutExecutor(
+                n_jobs=self.n_jobs, timeout=self.fit_timeout
+            )
+        elif (
+            self._executor is None
+            and self.algorithm == Algorithms.asyncSteadyState.value
+        ):
+            self._executor = ProcessExecutor(n_jobs=self.n_jobs)
+
+        if self._executor is None:
+            return
+
+        folds = list(self._folds)
+        if self._halving_folds:
+            for rung_folds in self._halving_folds.values():
+                folds.extend(rung_folds)
+        self._fold_ids = {id(fold): n for n, fold in enumerate(folds)}
+
+        self._executor.start(
+            self.estimator,
+            folds,
+            self.scorer_,
+            self.error_score,
+            self._warm_start,
+            Objectives.model_size.value in self._objectives,
+        )
+
+    def _share_data(self):
+        """
+        Dumps the data and the fit params in memory-mapped files if ``shared_data`` is set
+
+        Returns
+        -------
+            The data, target and fit params used to build the cv folds
+        """
+        if not self.shared_data:
+            self._temp_folder = None
+            return self.X_, self.y_, self._fit_params
+
+        self._temp_folder = tempfile.mkdtemp(
+            prefix="sklearn_genetic_", dir=self.temp_folder
+        )
+
+        # The precomputed partitions of each fold are shared instead of the whole data
+        if self.precompute_folds:
+            return self.X_, self.y_, self._fit_params
+
+        return (
+            to_memmap(self.X_, self._temp_folder, "X"),
+            to_memmap(self.y_, self._temp_folder, "y"),
+            {
+                key: to_memmap(value, self._temp_folder, f"fit_param_{key}")
+                for key, value in self._fit_params.items()
+            },
+        )
+
+    def _release_shared_data(self):
+        """
+        Removes the memory-mapped files and the folds that reference them
+        """
+        self._folds = None
+        self._halving_folds = None
+        shutil.rmtree(self._temp_folder, ignore_errors=True)
+        self._temp_folder = None
+
+    def _get_checkpoint(self, logbook):
+        """
+        State of the evolution after the last completed generation
+
+        Parameters
+        ----------
+        logbook: Logbook object
+            Statistics of the completed generations
+
+        Returns
+        -------
+            Dictionary with everything needed to resume the optimization
+        """
+        population = self._pop
+        if isinstance(population, ArrayPopulation):
+            population = population.to_individuals()
+
+        return {
+            "algorithm": self.algorithm,
+            "parameters": self.space.parameters,
+            "population": [(list(ind), ind.fitness.values) for ind in population],
+            "hof": [(list(ind), ind.fitness.values) for ind in self._hof],
+            "logbook": logbook,
+            "parameters_logbook": self.logbook,
+            "cv_results": self._cv_results,
+            "cache": self._cache,
+            "random_state": random.getstate(),
+            "numpy_random_state": np.random.get_state(),
+        }
+
+    def _load_checkpoint(self, path):
+        """
+        Restores the state of the evolution saved by
+        :class:`~sklearn_genetic.callbacks.ModelCheckpoint`
+
+        Parameters
+        ----------
+        path: str
+            Location of the checkpoint
+
+        Returns
+        -------
+            The logbook of the completed generations
+        """
+        if self.algorithm == Algorithms.asyncSteadyState.value:
+            raise ValueError(
+                "resume_from is not supported by the asyncSteadyState algorithm"
+            )
+
+        checkpoint = load(path)
+        if (
+            checkpoint["algorithm"] != self.algorithm
+            or checkpoint["parameters"] != self.space.parameters
+        ):
+            raise ValueError(
+                "The checkpoint was created with a different algorithm or param_grid"
+            )
+
+        def to_individual(values, fitness):
+            individual = self._individual_class(values)
+            individual.fitness.values = fitness
+            return individual
+
+        self._pop[:] = [
+            to_individual(values, fitness)
+            for values, fitness in checkpoint["population"]
+        ]
+
+        # Inserting from the worst individual keeps the order of the ties
+        self._hof.clear()
+        for values, fitness in reversed(checkpoint["hof"]):
+            self._hof.insert(to_individual(values, fitness))
+
+        self.logbook = checkpoint["parameters_logbook"]
+        self._cv_results = checkpoint["cv_results"]
+        if self._cache is not None and checkpoint["cache"] is not None:
+            self._cache = checkpoint["cache"]
+
+        random.setstate(checkpoint["random_state"])
+        np.random.set_state(checkpoint["numpy_random_state"])
+
+        return checkpoint["logbook"]
+
+    def _trial_key(self, parameters):
+        """
+        Identifier of the candidate in the trial store, it depends on the fingerprint
+        of the current fit and the hyperparameters
+        """
+        return joblib_hash([self._fingerprint, genome_key(parameters)])
+
+    def _fit_fingerprint(self):
+        """
+        Fingerprint of the data, cv splits, scorer and estimator (without the tuned hyperparameters)
+        used to identify the trials that can be reused from the trial store
+        """
+        estimator_params = {
+            key: value
+            for key, value in self.estimator.get_params().items()
+            if key not in self.space.parameters
+        }
+        return joblib_hash(
+            [
+                self.X_,
+                self.y_,
+                [(fold.train, fold.test) for fold in self._folds],
+                self._fit_params,
+                self.scorer_,
+                self.error_score,
+                type(self.estimator).__module__,
+                type(self.estimator).__qualname__,
+                estimator_params,
+            ]
+        )
 
     @if_delegate_has_method(delegate="estimator")
-    def fit(self, X, y, callbacks=None):
+    def fit(self, X, y, callbacks=None, resume_from=None, **fit_params):
         """
         Main method of GASearchCV, starts the optimization
         procedure with the hyperparameters of the given estimator
@@ -391,28 +1849,123 @@ class GASearchCV(BaseSearchCV):
             One or a list of the callbacks methods available in
             :class:`~sklearn_genetic.callbacks`.
             The callback is evaluated after fitting the estimators from the generation 1.
+        resume_from: str, default=None
+            Path of a checkpoint saved by :class:`~sklearn_genetic.callbacks.ModelCheckpoint`,
+            the optimization continues from the generation after the checkpoint with its
+            population, hall of fame, logbooks, fitness cache and random states, so with the same
+            data and a deterministic estimator it gives the same result as an uninterrupted run.
+            It's not supported by the ``'asyncSteadyState'`` algorithm.
+        **fit_params : dict of str -> object
+            Parameters passed to the ``fit`` method of the estimator,
+            like ``sample_weight``. The ones with one value per sample
+            are sliced according to each cv split.
 
         """
 
-        self.X_ = X
-        self.y_ = y
+        # The deadline of the search starts counting now
+        self._budget = Budget(self.max_time, self.max_evaluations)
+
+        self.X_, self.y_ = indexable(X, y)
 
         # Make sure the callbacks are valid
         self.callbacks = check_callback(callbacks)
         self.scorer_ = check_scoring(self.estimator, scoring=self.scoring)
 
+        # The same cv splits are used to evaluate all the individuals
+        self._fit_params = fit_params
+        X, y, fold_fit_params = self._share_data()
+        cv = check_cv(self.cv, self.y_, classifier=is_classifier(self.estimator))
+        self._folds = [
+            Fold(X, y, train, test, fold_fit_params)
+            for train, test in cv.split(self.X_, self.y_)
+        ]
+        if self.precompute_folds:
+            for n, fold in enumerate(self._folds):
+                fold.materialize(self.estimator)
+                if self._temp_folder is not None:
+                    fold.share(self._temp_folder, f"fold_{n}")
+
+        if self.min_resources is not None:
+            self._set_halving_rungs()
+
+        if self.warm_start_params is not None:
+            self._warm_start = WarmStart(
+                self.warm_start_params, self.warm_start_cache_size
+            )
+
+        self._trial_store = check_trial_store(self.trial_store)
+        if self._trial_store is not None:
+            self._fingerprint = self._fit_fingerprint()
+
+        self._cv_results = CVResults(self.space.parameters, len(self._folds))
+
         # Set the DEAPs necessary methods
         self._register()
 
+        # The algorithm records the statistics of each generation in the logbook,
+        # so they are kept if the search is interrupted
+        self._resumed = resume_from is not None
+        if self._resumed:
+            logbook = self._load_checkpoint(resume_from)
+        else:
+            logbook = tools.Logbook()
+
         self._initial_training_time = datetime.utcnow()
 
+        # The generational algorithms keep the vectorized population as an array
+        if self._vectorized():
+            self._pop = ArrayPopulation.from_individuals(
+                self.space, self._pop, self._individual_class
+            )
+
+        self._start_executor()
+
+        # The candidates are evaluated with joblib in the processes of its reusable pool
+        joblib_workers = self._executor is None and effective_n_jobs(self.n_jobs) > 1
+
         # Optimization routine from the selected evolutionary algorithm
-        pop, log, n_gen = self._select_algorithm(
-            pop=self._pop, stats=self._stats, hof=self._hof
-        )
+        try:
+            pop, log, n_gen = self._select_algorithm(
+                pop=self._pop, stats=self._stats, hof=self._hof, logbook=logbook
+            )
+        except KeyboardInterrupt:
+            # The search finishes with the candidates evaluated so far
+            print("INFO: The search was interrupted")
+            self._budget.interrupt()
+            log, n_gen = logbook, len(logbook)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            if self._temp_folder is not None:
+                self._release_shared_data()
+            if self._warm_start is not None:
+                clear_model_cache(self._warm_start)
+                if joblib_workers:
+                    self._release_joblib_workers()
+            if self.log_config is not None:
+                # Waits for the fits that are still being logged
+                self.log_config.close()
+            if self._trial_store is not None:
+                self._trial_store.close()
+
+        if isinstance(self._pop, ArrayPopulation):
+            self._pop = self._pop.to_individuals()
 
         # Update the _n_iterations value as the algorithm could stop earlier due a callback
         self._n_iterations = n_gen
+        self.budget_exhausted_ = self._budget.exhausted()
+
+        if not len(self._hof):
+            if self._budget.interrupted:
+                raise KeyboardInterrupt
+            raise ValueError(
+                "The budget of the search ran out before any candidate was evaluated"
+            )
+
+        if self._cache is not None:
+            self.cache_hits_ = self._cache.hits
+            self.cache_misses_ = self._cache.misses
 
         # hof keeps the best params according to the fitness value
         # The best one is in the position 0
@@ -425,6 +1978,21 @@ class GASearchCV(BaseSearchCV):
             for k in range(len(self._hof))
         }
 
+        if self._objectives:
+            self.pareto_front_ = [
+                {
+                    "params": self.hof[k],
+                    "score": self.criteria_sign * self._hof[k].fitness.values[0],
+                    **{
+                        objective: -value
+                        for objective, value in zip(
+                            self._objectives, self._hof[k].fitness.values[1:]
+                        )
+                    },
+                }
+                for k in range(len(self._hof))
+            ]
+
         self.history = {
             "gen": log.select("gen"),
             "fitness": log.select("fitness"),
@@ -432,19 +2000,20 @@ class GASearchCV(BaseSearchCV):
             "fitness_max": log.select("fitness_max"),
             "fitness_min": log.select("fitness_min"),
         }
+        for phase in PHASES:
+            self.history[f"{phase}_time"] = log.select(f"{phase}_time")
 
         # Imitate the logic of scikit-learn refit parameter
         if self.refit:
+            if self.min_resources is not None and self.resource != "n_samples":
+                self.estimator.set_params(**{self.resource: self._max_resources})
             self.estimator.set_params(**self.best_params_)
-            self.estimator.fit(self.X_, self.y_)
+            self.estimator.fit(self.X_, self.y_, **self._fit_params)
             self.best_estimator_ = self.estimator
 
-        del self.creator.FitnessMax
-        del self.creator.Individual
-
         return self
 
-    def _select_algorithm(self, pop, stats, hof):
+    def _select_algorithm(self, pop, stats, hof, logbook=None):
         """
         It selects the algorithm to run from the sklearn_genetic.algorithms module
         based in the parameter self.algorithm.
@@ -454,6 +2023,9 @@ class GASearchCV(BaseSearchCV):
         pop: pop object from DEAP
         stats: stats object from DEAP
         hof: hof object from DEAP
+        logbook: logbook object from DEAP, default=None
+            Logbook to record the generations in, with the completed ones
+            when the optimization is resumed
 
         Returns
         -------
@@ -479,6 +2051,8 @@ class GASearchCV(BaseSearchCV):
                 callbacks=self.callbacks,
                 verbose=self.verbose,
                 estimator=self,
+                logbook=logbook,
+                budget=self._budget,
             )
 
         elif self.algorithm == Algorithms.eaMuPlusLambda.value:
@@ -496,6 +2070,8 @@ class GASearchCV(BaseSearchCV):
                 callbacks=self.callbacks,
                 verbose=self.verbose,
                 estimator=self,
+                logbook=logbook,
+                budget=self._budget,
             )
 
         elif self.algorithm == Algorithms.eaMuCommaLambda.value:
@@ -512,6 +2088,26 @@ class GASearchCV(BaseSearchCV):
                 callbacks=self.callbacks,
                 verbose=self.verbose,
                 estimator=self,
+                logbook=logbook,
+                budget=self._budget,
+            )
+
+        elif self.algorithm == Algorithms.asyncSteadyState.value:
+            pop, log, gen = eaAsyncSteadyState(
+                pop,
+                self.toolbox,
+                mu=self.population_size,
+                cxpb=self.crossover_probability,
+                stats=stats,
+                mutpb=self.mutation_probability,
+                ngen=self.generations,
+                n_in_flight=self._executor.n_workers,
+                halloffame=hof,
+                callbacks=self.callbacks,
+                verbose=self.verbose,
+                estimator=self,
+                budget=self._budget,
+                logbook=logbook,
             )
 
         else:
@@ -525,6 +2121,18 @@ class GASearchCV(BaseSearchCV):
     def _run_search(self, evaluate_candidates):
         pass  # noqa
 
+    @property
+    def cv_results_(self):
+        if self._cv_results is None:
+            return None
+        return self._cv_results.to_dict(self.criteria_sign)
+
+    @property
+    def best_index_(self):
+        if self._cv_results is None:
+            return None
+        return self._cv_results.best_index(self.criteria_sign)
+
     @property
     def _fitted(self):
         try:
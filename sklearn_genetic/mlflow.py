@@ -1,12 +1,28 @@
 import logging
+import numbers
+import os
+import queue
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)  # noqa
 
 # Check if mlflow is installed as an extra requirement
 try:
     import mlflow
+    from mlflow.entities import Metric, Param, RunTag
+    from mlflow.tracking import MlflowClient
+    from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID, MLFLOW_RUN_NAME
 except ModuleNotFoundError:  # noqa
-    logger = logging.getLogger(__name__)  # noqa
     logger.error("MLflow not found, pip install mlflow to use MLflowConfig")  # noqa
 
+# Maximum number of entities of each kind sent in a single log_batch request,
+# which accepts up to 1000 entities in total
+MAX_METRICS_PER_BATCH = 800
+MAX_PARAMS_PER_BATCH = 100
+MAX_TAGS_PER_BATCH = 100
+
 
 class MLflowConfig:
     """
@@ -21,6 +37,8 @@ class MLflowConfig:
         save_models=False,
         registry_uri=None,
         tags=None,
+        run_per_generation=False,
+        asynchronous=True,
     ):
         """
 
@@ -38,20 +56,38 @@ class MLflowConfig:
             Address of local or remote model registry server.
         tags: dict, default=None
             Dictionary of tag_name: String -> value.
+        run_per_generation: bool, default=False
+            If ``True``, the fits of each generation are logged in a single run,
+            using the position of the fit in the generation as the step of its metrics:
+            the score and the numeric hyperparameters are logged as metrics and all
+            the hyperparameters as the tag ``parameters.<step>``.
+            If ``False``, each fit is logged in its own nested run.
+            It's not supported by the ``asyncSteadyState`` algorithm, which has no generations.
+        asynchronous: bool, default=True
+            If ``True``, the fits are logged by a background thread, which groups the
+            pending params and metrics in ``log_batch`` requests and uploads the models,
+            so the latency of the tracking server doesn't delay the evaluations.
+            :class:`~sklearn_genetic.GASearchCV` waits for the pending logs at the end of ``fit``.
+            The errors of the background thread are logged instead of raised.
+            If ``False``, each fit is logged as soon as it's evaluated and the errors are raised.
 
         """
-        self.client = mlflow.tracking.MlflowClient()
         self.tracking_uri = tracking_uri
         self.experiment = experiment
         self.run_name = run_name
         self.save_models = save_models
         self.tags = tags
         self.registry_uri = registry_uri
+        self.run_per_generation = run_per_generation
+        self.asynchronous = asynchronous
 
         mlflow.set_registry_uri(self.registry_uri)
         mlflow.set_tracking_uri(self.tracking_uri)
         mlflow.set_experiment(self.experiment)
 
+        self.client = MlflowClient(
+            tracking_uri=self.tracking_uri, registry_uri=self.registry_uri
+        )
         self.experiment_id = mlflow.get_experiment_by_name(
             self.experiment
         ).experiment_id
@@ -59,6 +95,13 @@ class MLflowConfig:
         if self.tags is not None:
             mlflow.set_tags(self.tags)
 
+        self._queue = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._step = 0
+        self._generation_runs = {}
+
     def create_run(self, parameters, score, estimator):
         """
         Parameters
@@ -71,15 +114,175 @@ class MLflowConfig:
             The current sklearn estimator that is being fitted
 
         """
+        active_run = mlflow.active_run()
+        with self._lock:
+            entry = {
+                "parameters": parameters,
+                "score": score,
+                "estimator": estimator if self.save_models else None,
+                "timestamp": int(time.time() * 1000),
+                "parent_run_id": active_run.info.run_id if active_run else None,
+                "generation": self._generation if self.run_per_generation else None,
+                "step": self._step,
+            }
+            self._step += 1
+        self._put(("fit", entry))
+
+    def end_generation(self):
+        """
+        Finishes the run of the current generation, the next fits are logged in a new one.
+        It has no effect if ``run_per_generation=False``.
+        """
+        if not self.run_per_generation:
+            return
+        with self._lock:
+            generation = self._generation
+            self._generation += 1
+            self._step = 0
+        self._put(("end", generation))
+
+    def flush(self):
+        """
+        Waits until all the pending fits are logged
+        """
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self):
+        """
+        Logs the pending fits, finishes the open runs and stops the background thread
+        """
+        self.end_generation()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+        self._queue = None
+        self._thread = None
+        self._generation = 0
+        self._step = 0
+
+    def _put(self, item):
+        if not self.asynchronous:
+            self._process([item])
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(
+                    target=self._consume, args=(self._queue,), daemon=True
+                )
+                self._thread.start()
+        self._queue.put(item)
+
+    def _consume(self, items_queue):
+        while True:
+            items = [items_queue.get()]
+            # Group everything that was queued while the last batch was sent
+            while True:
+                try:
+                    items.append(items_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in items
+            # The errors can't reach the search from this thread, they are logged instead
+            try:
+                self._process([item for item in items if item is not None])
+            except Exception:
+                logger.error("Could not log the fits in MLflow", exc_info=True)
+            for _ in items:
+                items_queue.task_done()
+            if stop:
+                break
+
+    def _process(self, items):
+        fits = [entry for command, entry in items if command == "fit"]
+        self._log_single_runs([entry for entry in fits if entry["generation"] is None])
+        self._log_generation_runs(
+            [entry for entry in fits if entry["generation"] is not None]
+        )
+        for command, generation in items:
+            if command == "end" and generation in self._generation_runs:
+                self.client.set_terminated(self._generation_runs.pop(generation))
+
+    def _create_run(self, run_name, parent_run_id):
+        tags = {MLFLOW_RUN_NAME: run_name}
+        if parent_run_id is not None:
+            tags[MLFLOW_PARENT_RUN_ID] = parent_run_id
+        return self.client.create_run(self.experiment_id, tags=tags).info.run_id
+
+    def _log_single_runs(self, entries):
+        for entry in entries:
+            run_id = self._create_run(self.run_name, entry["parent_run_id"])
+            self._log_batch(
+                run_id,
+                metrics=[Metric("score", entry["score"], entry["timestamp"], 0)],
+                params=[
+                    Param(parameter, str(value))
+                    for parameter, value in entry["parameters"].items()
+                ],
+            )
+            if entry["estimator"] is not None:
+                self._log_model(run_id, entry["estimator"], "model")
+            self.client.set_terminated(run_id)
+
+    def _log_generation_runs(self, entries):
+        runs = {}
+        for entry in entries:
+            generation = entry["generation"]
+            if generation not in self._generation_runs:
+                self._generation_runs[generation] = self._create_run(
+                    f"{self.run_name}-generation-{generation}", entry["parent_run_id"]
+                )
+            runs.setdefault(generation, []).append(entry)
+
+        for generation, generation_entries in runs.items():
+            run_id = self._generation_runs[generation]
+            metrics, tags = [], []
+            for entry in generation_entries:
+                timestamp, step = entry["timestamp"], entry["step"]
+                metrics.append(Metric("score", entry["score"], timestamp, step))
+                metrics.extend(
+                    Metric(parameter, value, timestamp, step)
+                    for parameter, value in entry["parameters"].items()
+                    if isinstance(value, numbers.Real) and not isinstance(value, bool)
+                )
+                tags.append(RunTag(f"parameters.{step}", str(entry["parameters"])))
+            self._log_batch(run_id, metrics=metrics, tags=tags)
+
+            for entry in generation_entries:
+                if entry["estimator"] is not None:
+                    self._log_model(
+                        run_id, entry["estimator"], f"model-{entry['step']}"
+                    )
 
-        with mlflow.start_run(
-            experiment_id=self.experiment_id, nested=True, run_name=self.run_name
-        ):
+    def _log_batch(self, run_id, metrics=(), params=(), tags=()):
+        """Logs the entities in as few requests as the limits of ``log_batch`` allow"""
+        metrics, params, tags = list(metrics), list(params), list(tags)
+        while metrics or params or tags:
+            self.client.log_batch(
+                run_id,
+                metrics=metrics[:MAX_METRICS_PER_BATCH],
+                params=params[:MAX_PARAMS_PER_BATCH],
+                tags=tags[:MAX_TAGS_PER_BATCH],
+            )
+            metrics = metrics[MAX_METRICS_PER_BATCH:]
+            params = params[MAX_PARAMS_PER_BATCH:]
+            tags = tags[MAX_TAGS_PER_BATCH:]
 
-            for parameter, value in parameters.items():
-                mlflow.log_param(key=parameter, value=value)
+    def _log_model(self, run_id, estimator, artifact_path):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, artifact_path)
+            mlflow.sklearn.save_model(estimator, path)
+            self.client.log_artifacts(run_id, path, artifact_path)
 
-            mlflow.log_metric(key="score", value=score)
+    def __getstate__(self):
+        # The background thread and its queue can't be copied
+        state = self.__dict__.copy()
+        state.update(_queue=None, _thread=None, _lock=None)
+        return state
 
-            if self.save_models:
-                mlflow.sklearn.log_model(estimator, "model")
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -11,6 +11,7 @@ class Algorithms(ExtendedEnum):
     eaSimple = "eaSimple"
     eaMuPlusLambda = "eaMuPlusLambda"
     eaMuCommaLambda = "eaMuCommaLambda"
+    asyncSteadyState = "asyncSteadyState"
 
 
 class Criteria(ExtendedEnum):
@@ -18,8 +19,29 @@ class Criteria(ExtendedEnum):
     min = "min"
 
 
+class Objectives(ExtendedEnum):
+    fit_time = "fit_time"
+    predict_time = "predict_time"
+    model_size = "model_size"
+
+
+class ParetoSelection(ExtendedEnum):
+    nsga2 = "NSGA2"
+    spea2 = "SPEA2"
+
+
+class RacingTests(ExtendedEnum):
+    t_test = "t-test"
+    hoeffding = "hoeffding"
+
+
 class Metrics(ExtendedEnum):
     fitness = "fitness"
     fitness_std = "fitness_std"
     fitness_max = "fitness_max"
     fitness_min = "fitness_min"
+
+
+class LogFormats(ExtendedEnum):
+    jsonl = "jsonl"
+    parquet = "parquet"
@@ -7,11 +7,20 @@ class BaseDimension(ABC):
     """
 
     @abstractmethod
-    def sample(self):
+    def sample(self, size=None):
         """
-        Sample a random value from the assigned distribution
+        Sample a random value, or an array of ``size`` values, from the assigned distribution
         """
 
         raise NotImplementedError(
             "The sample method must be defined according each data type handler"
         )  # pragma: no cover
+
+    def encode(self, value):
+        """
+        Numeric representation of a value of the hyperparameter, used to fit surrogate models
+        """
+
+        raise NotImplementedError(
+            "The encode method must be defined according each data type handler"
+        )  # pragma: no cover
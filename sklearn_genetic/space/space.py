@@ -1,5 +1,4 @@
 import numpy as np
-from scipy import stats
 
 from .space_parameters import (
     IntegerDistributions,
@@ -47,13 +46,27 @@ class Integer(BaseDimension):
         self.upper = upper
         self.distribution = distribution
 
-        if self.distribution == IntegerDistributions.uniform.value:
-            self.rvs = stats.randint.rvs
+    def sample(self, size=None):
+        """Sample random values from the assigned distribution
 
-    def sample(self):
-        """Sample a random value from the assigned distribution"""
+        Parameters
+        ----------
+        size: int, default=None
+            Number of values to sample, if ``None``, a single value is returned
+
+        Returns
+        -------
+            A value or an array with ``size`` values drawn in a single call
+        """
+
+        return np.random.randint(self.lower, self.upper + 1, size=size)
+
+    def encode(self, value):
+        """Scale the value to the [0, 1] interval"""
 
-        return self.rvs(self.lower, self.upper + 1)
+        if self.upper == self.lower:
+            return [0.0]
+        return [(value - self.lower) / (self.upper - self.lower)]
 
 
 class Continuous(BaseDimension):
@@ -94,15 +107,34 @@ class Continuous(BaseDimension):
         self.upper = upper
         self.distribution = distribution
 
-        if self.distribution == ContinuousDistributions.uniform.value:
-            self.rvs = stats.uniform.rvs
-        elif self.distribution == ContinuousDistributions.log_uniform.value:
-            self.rvs = stats.loguniform.rvs
+    def sample(self, size=None):
+        """Sample random values from the assigned distribution
 
-    def sample(self):
-        """Sample a random value from the assigned distribution"""
+        Parameters
+        ----------
+        size: int, default=None
+            Number of values to sample, if ``None``, a single value is returned
 
-        return self.rvs(self.lower, self.upper)
+        Returns
+        -------
+            A value or an array with ``size`` values drawn in a single call
+        """
+
+        if self.distribution == ContinuousDistributions.log_uniform.value:
+            return np.exp(
+                np.random.uniform(np.log(self.lower), np.log(self.upper), size=size)
+            )
+        return np.random.uniform(self.lower, self.upper, size=size)
+
+    def encode(self, value):
+        """Scale the value to the [0, 1] interval, in logarithmic scale for the log-uniform distribution"""
+
+        lower, upper = self.lower, self.upper
+        if self.distribution == ContinuousDistributions.log_uniform.value:
+            value, lower, upper = np.log(value), np.log(lower), np.log(upper)
+        if upper == lower:
+            return [0.0]
+        return [(value - lower) / (upper - lower)]
 
 
 class Categorical(BaseDimension):
@@ -147,13 +179,84 @@ class Categorical(BaseDimension):
         self.choices = choices
         self.distribution = distribution
 
-        if self.distribution == CategoricalDistributions.choice.value:
-            self.rvs = np.random.choice
+        # Object array so the choices can be indexed without converting its type,
+        # it's filled one by one to keep choices like tuples as single elements
+        self._values = np.empty(len(choices), dtype=object)
+        for index, choice in enumerate(choices):
+            self._values[index] = choice
+
+        if self.priors is not None:
+            self._probabilities, self._aliases = alias_table(self.priors)
+
+    def sample(self, size=None):
+        """Sample random values from the assigned distribution
+
+        Parameters
+        ----------
+        size: int, default=None
+            Number of values to sample, if ``None``, a single value is returned
+
+        Returns
+        -------
+            A value or an array with ``size`` values drawn in a single call
+        """
+
+        indices = self._sample_indices(size)
+        if size is None:
+            return self.choices[int(indices)]
+        return self._values[indices]
+
+    def _sample_indices(self, size=None):
+        """Sample the positions of the choices instead of its values"""
+
+        indices = np.random.randint(len(self.choices), size=size)
+        if self.priors is not None:
+            # Alias method: keep the drawn choice with its probability, otherwise take its alias
+            keep = np.random.random_sample(size=size) < self._probabilities[indices]
+            indices = np.where(keep, indices, self._aliases[indices])
+        return indices
 
-    def sample(self):
-        """Sample a random value from the assigned distribution"""
+    def encode(self, value):
+        """One-hot encoding of the value"""
 
-        return self.rvs(self.choices, p=self.priors)
+        return [float(value == choice) for choice in self.choices]
+
+
+def alias_table(priors):
+    """
+    Builds the tables of the alias method (Vose's algorithm), that samples
+    from a discrete distribution in constant time per value
+
+    Parameters
+    ----------
+    priors: list
+        Probability of each element
+
+    Returns
+    -------
+    probabilities, aliases: tuple
+        Arrays with the probability of keeping each element once it's drawn
+        uniformly, and the element taken instead when it's not kept
+    """
+    n = len(priors)
+    scaled = np.asarray(priors, dtype=float) * n
+    probabilities = np.ones(n)
+    aliases = np.arange(n)
+
+    small = [index for index in range(n) if scaled[index] < 1.0]
+    large = [index for index in range(n) if scaled[index] >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probabilities[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] = scaled[more] + scaled[less] - 1.0
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+
+    # The remaining elements have probability one, up to rounding errors
+    return probabilities, aliases
 
 
 def check_space(param_grid: dict = None):
@@ -218,6 +321,49 @@ class Space(object):
         """
         return list(self.param_grid.keys())
 
+    def sample_population(self, n):
+        """
+        Parameters
+        ----------
+        n: int
+            Number of individuals to sample
+
+        Returns
+        -------
+        An object array of shape (n, dimensions), each row is a random individual with
+        one value per hyperparameter, in the same order as :attr:`parameters`.
+        The values of each hyperparameter are drawn in a single vectorized call.
+        """
+        population = np.empty((n, self.dimensions), dtype=object)
+        for gen, parameter in enumerate(self.parameters):
+            population[:, gen] = self.param_grid[parameter].sample(size=n)
+        return population
+
+    def encode(self, individuals):
+        """
+        Parameters
+        ----------
+        individuals: list
+            Each individual is a list with one value per hyperparameter,
+            in the same order as :attr:`parameters`
+
+        Returns
+        -------
+        A numeric array with one row per individual, where the integer and continuous
+        hyperparameters are scaled to the [0, 1] interval and the categorical ones are one-hot encoded
+        """
+        return np.array(
+            [
+                [
+                    code
+                    for parameter, value in zip(self.parameters, individual)
+                    for code in self.param_grid[parameter].encode(value)
+                ]
+                for individual in individuals
+            ],
+            dtype=float,
+        )
+
     def __len__(self):
         return self.dimensions
 
@@ -1,6 +1,7 @@
 import pytest
+import numpy as np
 
-from ..space import Categorical, Integer, Continuous, Space
+from ..space import Categorical, Integer, Continuous, Space, alias_table
 from ..base import BaseDimension
 
 
@@ -146,3 +147,84 @@ def test_wrong_dimension():
         FakeDimension().sample()
 
     assert any([str(excinfo.value) == i for i in possible_messages])
+
+
+def test_space_encode():
+    space = Space(
+        {
+            "max_depth": Integer(2, 12),
+            "alpha": Continuous(1e-4, 1, distribution="log-uniform"),
+            "l1_ratio": Continuous(0, 0.5),
+            "criterion": Categorical(["gini", "entropy"]),
+        }
+    )
+    encoded = space.encode([[2, 1e-4, 0.25, "entropy"], [7, 1e-2, 0.5, "gini"]])
+
+    assert encoded.shape == (2, 5)
+    assert encoded.tolist()[0] == [0.0, 0.0, 0.5, 0.0, 1.0]
+    assert encoded[1] == pytest.approx([0.5, 0.5, 1.0, 1.0, 0.0])
+
+    assert Integer(3, 3).encode(3) == [0.0]
+
+
+@pytest.mark.parametrize(
+    "data_object, parameters",
+    [
+        (Continuous, {"lower": 0.01, "upper": 0.5, "distribution": "log-uniform"}),
+        (Continuous, {"lower": 0.2, "upper": 0.5, "distribution": "uniform"}),
+        (Integer, {"lower": 5, "upper": 20, "distribution": "uniform"}),
+    ],
+)
+def test_sample_size(data_object, parameters):
+    my_variable = data_object(**parameters)
+    values = my_variable.sample(size=1000)
+
+    assert values.shape == (1000,)
+    assert values.min() >= parameters["lower"]
+    assert values.max() <= parameters["upper"]
+
+
+def test_sample_categorical_priors():
+    np.random.seed(0)
+    priors = [0.2, 0.1, 0.7]
+    my_categorical = Categorical(choices=["car", "byc", "house"], priors=priors)
+    values = my_categorical.sample(size=20000)
+
+    assert values.shape == (20000,)
+    frequencies = [np.mean(values == choice) for choice in ["car", "byc", "house"]]
+    assert frequencies == pytest.approx(priors, abs=0.02)
+
+    probabilities, aliases = alias_table([0.5, 0.25, 0.25, 0.0])
+    # Each element keeps its probability through the column of the table it was drawn from
+    # and the columns where it's the alias
+    recovered = [
+        (
+            probabilities[i]
+            + sum(1 - probabilities[j] for j in range(4) if aliases[j] == i)
+        )
+        / 4
+        for i in range(4)
+    ]
+    assert recovered == pytest.approx([0.5, 0.25, 0.25, 0.0])
+
+    # Choices that are sequences are sampled as single values
+    my_categorical = Categorical(choices=[(10,), (10, 10)])
+    assert my_categorical.sample() in [(10,), (10, 10)]
+    assert all(value in [(10,), (10, 10)] for value in my_categorical.sample(size=10))
+
+
+def test_sample_population():
+    space = Space(
+        {
+            "max_depth": Integer(2, 12),
+            "alpha": Continuous(1e-4, 1, distribution="log-uniform"),
+            "criterion": Categorical(["gini", "entropy"], priors=[0.4, 0.6]),
+        }
+    )
+    population = space.sample_population(50)
+
+    assert population.shape == (50, 3)
+    for max_depth, alpha, criterion in population:
+        assert 2 <= max_depth <= 12
+        assert 1e-4 <= alpha <= 1
+        assert criterion in ["gini", "entropy"]
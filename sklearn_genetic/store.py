@@ -0,0 +1,132 @@
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class BaseTrialStore(ABC):
+    """
+    Base class of the stores that persist the cross-validation scores of the evaluated
+    hyperparameters, so they can be reused across different calls of
+    :meth:`~sklearn_genetic.GASearchCV.fit`
+    """
+
+    @abstractmethod
+    def get(self, key):
+        """
+        Parameters
+        ----------
+        key: str
+            Unique identifier of the trial, it depends on the data, the cv splits, the scorer,
+            the estimator and the hyperparameters
+
+        Returns
+        -------
+        cv_scores: list or None
+            Score of each cv split, ``None`` if the trial is not in the store
+        """
+
+    @abstractmethod
+    def put(self, key, parameters, cv_scores):
+        """
+        Parameters
+        ----------
+        key: str
+            Unique identifier of the trial
+        parameters: dict
+            Evaluated hyperparameters
+        cv_scores: list
+            Score of each cv split
+        """
+
+    def close(self):
+        """
+        Release the resources held by the store
+        """
+
+
+class SQLiteTrialStore(BaseTrialStore):
+    """
+    Stores the trials in a SQLite database file.
+    Each trial is committed as soon as it's evaluated using a write-ahead log,
+    so an interrupted search only loses the fits that were running.
+    """
+
+    def __init__(self, path="sklearn_genetic_trials.db"):
+        """
+        Parameters
+        ----------
+        path: str, default="sklearn_genetic_trials.db"
+            Location of the SQLite database file, it's created if it doesn't exist
+        """
+        self.path = path
+        self._connection = None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS trials ("
+                "key TEXT PRIMARY KEY, parameters TEXT, cv_scores TEXT, created_at TEXT)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def get(self, key):
+        row = self.connection.execute(
+            "SELECT cv_scores FROM trials WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put(self, key, parameters, cv_scores):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO trials VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    json.dumps(parameters, default=str),
+                    json.dumps([float(score) for score in cv_scores]),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM trials").fetchone()[0]
+
+    def __getstate__(self):
+        # The sqlite connection can't be pickled, it's re-opened when needed
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        return state
+
+
+def check_trial_store(trial_store):
+    """
+    Parameters
+    ----------
+    trial_store: str, BaseTrialStore or None
+        Path of a SQLite file or a trial store instance
+
+    Returns
+    -------
+        A :class:`~sklearn_genetic.store.BaseTrialStore` instance or ``None``
+    """
+    if trial_store is None or isinstance(trial_store, BaseTrialStore):
+        return trial_store
+    elif isinstance(trial_store, str):
+        return SQLiteTrialStore(trial_store)
+    else:
+        raise ValueError(
+            "trial_store should be either a path to a SQLite file or an instance of "
+            "store.BaseTrialStore"
+        )
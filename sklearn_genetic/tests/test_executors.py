@@ -0,0 +1,410 @@
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError
+from multiprocessing import Pipe
+
+import pytest
+import numpy as np
+from sklearn.datasets import load_digits
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.utils.validation import check_is_fitted
+
+from .. import GASearchCV
+from ..space import Integer, Categorical
+from ..executors import (
+    SerialExecutor,
+    ThreadExecutor,
+    ProcessExecutor,
+    TimeoutExecutor,
+    RemoteExecutor,
+    check_authkey,
+    check_executor,
+    parse_address,
+)
+from ..utils.cv_scores import Fold
+from ..utils.warm_start import WarmStart, _model_cache
+from ..worker import handle, main, serve
+
+data = load_digits()
+y = data["target"]
+X = data["data"]
+
+X_train, X_test, y_train, y_test = train_test_split(
+    X, y, test_size=0.33, random_state=42
+)
+
+AUTHKEY = "test-key"
+
+
+class SlowClassifier(DecisionTreeClassifier):
+    """
+    Decision tree whose fit hangs when ``max_depth`` is 100 or more
+    """
+
+    def fit(self, X, y, **kwargs):
+        if self.max_depth is not None and self.max_depth >= 100:
+            time.sleep(60)
+        return super().fit(X, y, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def workers():
+    processes = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "sklearn_genetic.worker",
+                "--port",
+                "0",
+                "--authkey",
+                AUTHKEY,
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(2)
+    ]
+    # Each worker prints the free port it's listening on
+    addresses = [
+        process.stdout.readline().strip().split(" ")[-1] for process in processes
+    ]
+    yield addresses
+    for process in processes:
+        process.terminate()
+        process.wait()
+
+
+def get_executor(name, addresses):
+    if name == "serial":
+        return SerialExecutor()
+    elif name == "thread":
+        return ThreadExecutor(n_jobs=2)
+    elif name == "process":
+        return ProcessExecutor(n_jobs=2)
+    elif name == "timeout":
+        return TimeoutExecutor(n_jobs=2, timeout=60)
+    return RemoteExecutor(addresses, authkey=AUTHKEY)
+
+
+@pytest.mark.parametrize("name", ["serial", "thread", "process", "timeout", "remote"])
+def test_executor_scores(name, workers):
+    clf = DecisionTreeClassifier(random_state=42)
+    cv = StratifiedKFold(n_splits=3)
+    folds = [
+        Fold(X_train, y_train, train, test)
+        for train, test in cv.split(X_train, y_train)
+    ]
+    scorer = check_scoring(clf, scoring="accuracy")
+    candidates = [{"max_depth": depth} for depth in [2, 4, 8]]
+
+    executor = get_executor(name, workers)
+    executor.start(clf, folds, scorer)
+    results = list(executor.map(candidates))
+    fold_results = list(executor.map(candidates, folds=[2, 0]))
+    executor.shutdown()
+
+    for parameters, evaluation, fold_evaluation in zip(
+        candidates, results, fold_results
+    ):
+        expected = cross_val_score(
+            clf.set_params(**parameters), X_train, y_train, cv=cv, scoring="accuracy"
+        )
+        assert np.allclose(evaluation["cv_scores"], expected)
+        assert np.allclose(fold_evaluation["cv_scores"], expected[[2, 0]])
+        assert len(evaluation["fit_times"]) == 3
+        assert len(fold_evaluation["score_times"]) == 2
+        assert np.isnan(evaluation["peak_memory"]) or evaluation["peak_memory"] > 0
+
+
+@pytest.mark.parametrize(
+    "name, algorithm, min_resources, racing",
+    [
+        ("serial", "eaSimple", None, None),
+        ("thread", "eaMuPlusLambda", 100, None),
+        ("process", "eaMuCommaLambda", None, "hoeffding"),
+        ("timeout", "eaSimple", 100, None),
+        ("remote", "eaMuPlusLambda", None, None),
+        ("remote", "asyncSteadyState", None, None),
+    ],
+)
+def test_executor_search(name, algorithm, min_resources, racing, workers):
+    executor = get_executor(name, workers)
+    population_size = 4
+    generations = 2
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=population_size,
+        generations=generations,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        algorithm=algorithm,
+        min_resources=min_resources,
+        racing=racing,
+        executor=executor,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    assert check_is_fitted(evolved_estimator) is None
+    assert evolved_estimator._executor is None
+    assert len(evolved_estimator.logbook.chapters["parameters"]) > population_size
+
+    # The executor can be reused in other fits
+    evolved_estimator.fit(X_train, y_train)
+    assert check_is_fitted(evolved_estimator) is None
+
+
+@pytest.mark.parametrize(
+    "executor, precompute_folds",
+    [
+        (None, False),
+        (None, True),
+        (ProcessExecutor(n_jobs=2), False),
+        (ProcessExecutor(n_jobs=2), True),
+    ],
+)
+def test_shared_data(executor, precompute_folds, tmp_path):
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=4,
+        generations=2,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        n_jobs=2,
+        executor=executor,
+        precompute_folds=precompute_folds,
+        shared_data=True,
+        temp_folder=str(tmp_path),
+    )
+    evolved_estimator.fit(X_train, y_train, sample_weight=np.ones(len(y_train)))
+
+    assert check_is_fitted(evolved_estimator) is None
+    assert evolved_estimator._temp_folder is None
+    assert evolved_estimator._folds is None
+    # The memory-mapped files are removed at the end of the fit
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_remote_executor_error(workers):
+    clf = DecisionTreeClassifier()
+    folds = [Fold(X_train, y_train, np.arange(100), np.arange(100, 200))]
+    scorer = check_scoring(clf, scoring="accuracy")
+
+    executor = RemoteExecutor(workers, authkey=AUTHKEY)
+    executor.start(clf, folds, scorer, error_score="raise")
+    future = executor.submit({"max_depth": -1})
+    with pytest.raises(ValueError):
+        future.result()
+    executor.shutdown()
+
+
+def test_timeout_executor():
+    clf = SlowClassifier(random_state=42)
+    folds = [Fold(X_train, y_train, np.arange(300), np.arange(300, 600))] * 2
+    scorer = check_scoring(clf, scoring="accuracy")
+    candidates = [{"max_depth": 4}, {"max_depth": 100}, {"max_depth": 8}]
+
+    executor = TimeoutExecutor(n_jobs=2, timeout=2)
+    executor.start(clf, folds, scorer, error_score=-1)
+    start = time.monotonic()
+    results = list(executor.map(candidates))
+    assert time.monotonic() - start < 30
+
+    assert [evaluation["timed_out"] for evaluation in results] == [False, True, False]
+    assert np.all(results[1]["cv_scores"] == -1)
+    assert np.sum(results[1]["fit_times"]) == pytest.approx(2)
+    assert np.all(results[0]["cv_scores"] > 0)
+
+    # The terminated process is replaced by a new one
+    assert not executor.submit({"max_depth": 4}).result()["timed_out"]
+    executor.shutdown()
+
+    executor.start(clf, folds, scorer, error_score="raise")
+    future = executor.submit({"max_depth": 100})
+    with pytest.raises(TimeoutError):
+        future.result()
+    executor.shutdown()
+
+
+def test_process_executor_shutdown():
+    clf = SlowClassifier(random_state=42)
+    folds = [Fold(X_train, y_train, np.arange(300), np.arange(300, 600))]
+    scorer = check_scoring(clf, scoring="accuracy")
+
+    executor = ProcessExecutor(n_jobs=1)
+    executor.start(clf, folds, scorer)
+    futures = [executor.submit({"max_depth": 100}) for _ in range(5)]
+    time.sleep(1)
+
+    # The running fit is not waited for and the pending ones are cancelled
+    start = time.monotonic()
+    executor.shutdown()
+    assert time.monotonic() - start < 30
+    assert futures[-1].cancelled()
+
+
+def test_remote_executor_shutdown(workers):
+    clf = SlowClassifier(random_state=42)
+    folds = [Fold(X_train, y_train, np.arange(300), np.arange(300, 600))]
+    scorer = check_scoring(clf, scoring="accuracy")
+
+    executor = RemoteExecutor(workers, authkey=AUTHKEY, poll_interval=0.1)
+    executor.start(clf, folds, scorer)
+    futures = [executor.submit({"max_depth": 100}) for _ in range(4)]
+    time.sleep(1)
+
+    # The running fits are abandoned and the pending ones are cancelled
+    start = time.monotonic()
+    executor.shutdown()
+    assert time.monotonic() - start < 30
+    assert all(future.done() for future in futures)
+    assert futures[-1].cancelled()
+    for future in futures:
+        with pytest.raises(CancelledError):
+            future.result()
+
+
+def test_fit_timeout():
+    evolved_estimator = GASearchCV(
+        SlowClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=4,
+        generations=2,
+        param_grid={
+            "max_depth": Categorical([4, 100]),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        n_jobs=2,
+        cache_size=10,
+        error_score=0,
+        fit_timeout=2,
+    )
+    start = time.monotonic()
+    evolved_estimator.fit(X_train, y_train)
+    assert time.monotonic() - start < 60
+
+    assert check_is_fitted(evolved_estimator) is None
+    assert evolved_estimator._executor is None
+    assert evolved_estimator.best_params_["max_depth"] == 4
+    for record in evolved_estimator.logbook.chapters["parameters"]:
+        assert record["timed_out"] == (record["max_depth"] == 100)
+        assert (record["score"] == 0) == record["timed_out"]
+
+
+@pytest.mark.parametrize(
+    "parameters, message",
+    [
+        (
+            {"fit_timeout": 0},
+            "fit_timeout must be a positive number or None, got 0 instead",
+        ),
+        (
+            {"fit_timeout": 10, "executor": SerialExecutor()},
+            "fit_timeout can't be used with an executor, "
+            "use a TimeoutExecutor as the executor instead",
+        ),
+    ],
+)
+def test_wrong_fit_timeout(parameters, message):
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid={"max_depth": Integer(2, 4)},
+            **parameters,
+        )
+    assert str(excinfo.value) == message
+
+
+def test_wrong_executor():
+    assert parse_address("localhost:6000") == ("localhost", 6000)
+    assert parse_address(("localhost", "6000")) == ("localhost", 6000)
+
+    executor = SerialExecutor()
+    assert check_executor(executor) is executor
+    assert check_executor(None) is None
+
+    with pytest.raises(Exception) as excinfo:
+        check_executor(4)
+    assert (
+        str(excinfo.value)
+        == "executor should be either None or an instance of executors.BaseExecutor"
+    )
+
+
+def test_worker_releases_warm_start():
+    clf = RandomForestClassifier(n_estimators=5, random_state=42)
+    folds = [Fold(X_train, y_train, np.arange(300), np.arange(300, 600))]
+    scorer = check_scoring(clf, scoring="accuracy")
+    warm_start = WarmStart(["n_estimators"])
+
+    connection, worker_connection = Pipe()
+    thread = threading.Thread(target=handle, args=(worker_connection,))
+    thread.start()
+    connection.send(("start", (clf, folds, scorer, np.nan, warm_start, False)))
+    connection.send(("evaluate", ({"n_estimators": 5}, None)))
+    assert connection.recv()[0] == "result"
+    assert len(_model_cache) > 0
+
+    connection.send(("close", None))
+    thread.join()
+    assert not any(key[0] == warm_start.key for key, _ in _model_cache._data)
+
+    # The models are also released when the executor abandons a running evaluation
+    connection, worker_connection = Pipe()
+    thread = threading.Thread(target=handle, args=(worker_connection,))
+    thread.start()
+    connection.send(("start", (clf, folds, scorer, np.nan, warm_start, False)))
+    connection.send(("evaluate", ({"n_estimators": 5}, None)))
+    connection.close()
+    thread.join()
+    assert not any(key[0] == warm_start.key for key, _ in _model_cache._data)
+
+
+def test_wrong_authkey(monkeypatch):
+    assert check_authkey("secret") == b"secret"
+    for authkey in ["", b"", None, 4]:
+        with pytest.raises(ValueError) as excinfo:
+            check_authkey(authkey)
+        assert str(excinfo.value) == "authkey must be a non empty bytes or str secret"
+
+    with pytest.raises(TypeError):
+        RemoteExecutor(["localhost:6000"])
+    with pytest.raises(ValueError):
+        serve(port=0, verbose=False)
+
+    # The worker doesn't start without a key
+    monkeypatch.delenv("SKLEARN_GENETIC_AUTHKEY", raising=False)
+    with pytest.raises(SystemExit):
+        main(["--port", "0"])
+
+
+def test_worker_evaluate_before_start():
+    connection, worker_connection = Pipe()
+    thread = threading.Thread(target=handle, args=(worker_connection,))
+    thread.start()
+
+    connection.send(("evaluate", ({"max_depth": 4}, None)))
+    status, error = connection.recv()
+    assert status == "error"
+    assert isinstance(error, RuntimeError)
+
+    # The worker keeps handling the connection
+    connection.send(("close", None))
+    thread.join()
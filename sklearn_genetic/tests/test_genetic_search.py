@@ -1,11 +1,21 @@
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import numpy as np
+from joblib import Parallel, delayed
 from sklearn.datasets import load_digits, load_boston
 from sklearn.linear_model import SGDClassifier
 from sklearn.tree import DecisionTreeClassifier
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.utils.validation import check_is_fitted
 from sklearn.tree import DecisionTreeRegressor
 from sklearn.cluster import KMeans
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.linear_model import LinearRegression
 from sklearn.metrics import accuracy_score
 
 from .. import GASearchCV
@@ -16,6 +26,9 @@ from ..callbacks import (
     ConsecutiveStopping,
     TimerStopping,
 )
+from ..callbacks.base import BaseCallback
+from ..executors import ThreadExecutor
+from ..utils.population import ArrayPopulation
 
 data = load_digits()
 label_names = data["target_names"]
@@ -381,7 +394,8 @@ def test_wrong_algorithm():
         evolved_estimator.fit(X_train, y_train)
     assert (
         str(excinfo.value)
-        == "The algorithm genetic is not supported, please select one from ['eaSimple', 'eaMuPlusLambda', 'eaMuCommaLambda']"
+        == "The algorithm genetic is not supported, please select one from "
+        "['eaSimple', 'eaMuPlusLambda', 'eaMuCommaLambda', 'asyncSteadyState']"
     )
 
 
@@ -402,3 +416,972 @@ def test_no_param_grid():
         )
 
     assert str(excinfo.value) == "param_grid can not be empty"
+
+
+def test_evaluate_population_batch():
+    clf = DecisionTreeClassifier(random_state=42)
+    evolved_estimator = GASearchCV(
+        clf,
+        cv=3,
+        scoring="accuracy",
+        population_size=4,
+        generations=2,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        n_jobs=-1,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    individuals = [[3, "gini"], [10, "entropy"], [3, "gini"]]
+    fitnesses = evolved_estimator.evaluate_population(individuals)
+
+    assert len(fitnesses) == len(individuals)
+    for individual, fitness in zip(individuals, fitnesses):
+        expected = cross_val_score(
+            DecisionTreeClassifier(
+                random_state=42, max_depth=individual[0], criterion=individual[1]
+            ),
+            X_train,
+            y_train,
+            cv=3,
+            scoring="accuracy",
+        )
+        assert fitness == [np.mean(expected)]
+
+    assert evolved_estimator.evaluate(individuals[1]) == fitnesses[1]
+    assert evolved_estimator.logbook.chapters["parameters"][-1]["max_depth"] == 10
+
+
+def test_fitness_cache():
+    clf = DecisionTreeClassifier(random_state=42)
+    evolved_estimator = GASearchCV(
+        clf,
+        cv=2,
+        scoring="accuracy",
+        population_size=6,
+        generations=5,
+        param_grid={
+            "max_depth": Integer(2, 4),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        cache_size=50,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    # There are only 6 possible combinations, so most of the individuals are repeated
+    assert evolved_estimator.cache_misses_ <= 6
+    assert evolved_estimator.cache_hits_ > 0
+    assert (
+        len(evolved_estimator.logbook.chapters["parameters"])
+        == evolved_estimator.cache_misses_
+    )
+
+    evolved_estimator = GASearchCV(
+        clf,
+        cv=2,
+        param_grid={
+            "max_depth": Integer(2, 4),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+    )
+    evolved_estimator.fit(X_train, y_train)
+    assert not hasattr(evolved_estimator, "cache_hits_")
+
+
+def test_precompute_folds_fit_params():
+    sample_weight = np.linspace(0.5, 1.5, len(y_train))
+    results = []
+    for precompute_folds in [False, True]:
+        evolved_estimator = GASearchCV(
+            DecisionTreeClassifier(random_state=42),
+            cv=3,
+            scoring="accuracy",
+            population_size=4,
+            generations=2,
+            param_grid={
+                "max_depth": Integer(2, 20),
+                "criterion": Categorical(["gini", "entropy"]),
+            },
+            verbose=False,
+            precompute_folds=precompute_folds,
+        )
+        evolved_estimator.fit(X_train, y_train, sample_weight=sample_weight)
+        assert all(
+            fold.materialized == precompute_folds for fold in evolved_estimator._folds
+        )
+        results.append(evolved_estimator.evaluate_population([[5, "gini"]]))
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize(
+    "resource, min_resources, max_resources",
+    [("n_samples", 60, None), ("max_iter", 2, 50)],
+)
+def test_successive_halving(resource, min_resources, max_resources):
+    clf = SGDClassifier(loss="log", fit_intercept=True, random_state=42)
+    evolved_estimator = GASearchCV(
+        clf,
+        cv=3,
+        scoring="accuracy",
+        population_size=9,
+        generations=3,
+        param_grid={
+            "l1_ratio": Continuous(0, 1),
+            "alpha": Continuous(1e-4, 1, distribution="log-uniform"),
+            "average": Categorical([True, False]),
+        },
+        verbose=False,
+        min_resources=min_resources,
+        max_resources=max_resources,
+        resource=resource,
+        halving_factor=3,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    records = evolved_estimator.logbook.chapters["parameters"]
+    full_resources = evolved_estimator._max_resources
+    assert len(evolved_estimator._halving_budgets) >= 1
+    assert {record["resources"] for record in records} <= {
+        *evolved_estimator._halving_budgets,
+        full_resources,
+    }
+
+    # The first generation keeps 1/3 of the population on each rung
+    first_generation = records[: evolved_estimator.population_size]
+    n_full = sum(record["resources"] == full_resources for record in first_generation)
+    assert 1 <= n_full < evolved_estimator.population_size
+
+    # The eliminated individuals can't outperform the ones evaluated with all the resources
+    worst_full = min(
+        record["score"]
+        for record in first_generation
+        if record["resources"] == full_resources
+    )
+    assert all(record["score"] <= worst_full for record in first_generation)
+
+    assert check_is_fitted(evolved_estimator) is None
+    if resource != "n_samples":
+        assert evolved_estimator.best_estimator_.get_params()[resource] == max_resources
+
+
+@pytest.mark.parametrize(
+    "parameters, message",
+    [
+        (
+            {"min_resources": 10, "halving_factor": 1},
+            "halving_factor must be greater than 1, got 1 instead",
+        ),
+        (
+            {"min_resources": 10, "resource": "max_depth"},
+            "The resource max_depth can not be part of the param_grid",
+        ),
+        (
+            {"min_resources": 10, "resource": "min_samples_split"},
+            "max_resources must be set when the resource is an estimator parameter",
+        ),
+    ],
+)
+def test_wrong_successive_halving(parameters, message):
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid={
+                "max_depth": Integer(2, 4),
+                "criterion": Categorical(["gini", "entropy"]),
+            },
+            **parameters,
+        )
+    assert str(excinfo.value) == message
+
+
+@pytest.mark.parametrize("racing", ["t-test", "hoeffding"])
+def test_racing(racing):
+    clf = DecisionTreeClassifier(random_state=42)
+    evolved_estimator = GASearchCV(
+        clf,
+        cv=5,
+        scoring="accuracy",
+        population_size=4,
+        generations=2,
+        param_grid={
+            "max_depth": Integer(1, 20),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        racing=racing,
+        racing_alpha=0.05,
+        racing_score_range=0.2,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    records = evolved_estimator.logbook.chapters["parameters"]
+    assert all(isinstance(record["raced"], bool) for record in records)
+    # The initial population has no threshold to race against
+    assert not any(
+        record["raced"] for record in records[: evolved_estimator.population_size]
+    )
+
+    # A stump can't reach the accuracy of the deep trees in the population
+    for ind in evolved_estimator._pop:
+        ind.fitness.values = (0.7,)
+    results = evolved_estimator._race(
+        [
+            {"max_depth": 1, "criterion": "gini"},
+            {"max_depth": 15, "criterion": "gini"},
+        ]
+    )
+    assert results[0]["raced"]
+    assert results[0]["cv_scores"] is None
+    assert results[0]["score"] < 0.7
+    assert not results[1]["raced"]
+    assert len(results[1]["cv_scores"]) == 5
+
+    expected = cross_val_score(
+        DecisionTreeClassifier(random_state=42, max_depth=15),
+        X_train,
+        y_train,
+        cv=5,
+        scoring="accuracy",
+    )
+    assert np.allclose(results[1]["cv_scores"], expected)
+
+
+def test_wrong_racing():
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid={
+                "max_depth": Integer(2, 4),
+                "criterion": Categorical(["gini", "entropy"]),
+            },
+            racing="anova",
+        )
+    assert (
+        str(excinfo.value)
+        == "racing must be one of ['t-test', 'hoeffding'] or None, got anova instead"
+    )
+
+
+@pytest.mark.parametrize(
+    "callback, cache_size",
+    [(None, None), (None, 100), (ThresholdStopping(threshold=0.01), None)],
+)
+def test_async_steady_state(callback, cache_size):
+    clf = DecisionTreeClassifier(random_state=42)
+    population_size = 5
+    generations = 3
+    evolved_estimator = GASearchCV(
+        clf,
+        cv=2,
+        scoring="accuracy",
+        population_size=population_size,
+        generations=generations,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "min_samples_split": Integer(2, 30),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        algorithm="asyncSteadyState",
+        n_jobs=2,
+        keep_top_k=2,
+        cache_size=cache_size,
+    )
+    evolved_estimator.fit(X_train, y_train, callbacks=callback)
+
+    assert check_is_fitted(evolved_estimator) is None
+    assert 1 <= len(evolved_estimator.hof) <= 2
+    assert len(evolved_estimator._pop) <= population_size
+    assert evolved_estimator._executor is None
+
+    n_records = len(evolved_estimator.history["gen"])
+    assert len(evolved_estimator) == n_records
+    if callback is None:
+        # One record per completed evaluation
+        assert n_records == population_size * (generations + 1)
+        if cache_size is None:
+            assert len(evolved_estimator.logbook.chapters["parameters"]) == n_records
+    else:
+        # The algorithm stops at the first record, the other completed evaluations are discarded
+        assert n_records == 1
+
+    # The best individual is always kept in the population
+    best_fitness = max(ind.fitness.values[0] for ind in evolved_estimator._pop)
+    assert evolved_estimator.history["fitness_max"][-1] == best_fitness
+
+
+def test_wrong_async_steady_state():
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid={
+                "max_depth": Integer(2, 4),
+                "criterion": Categorical(["gini", "entropy"]),
+            },
+            algorithm="asyncSteadyState",
+            racing="t-test",
+        )
+    assert (
+        str(excinfo.value)
+        == "The asyncSteadyState algorithm doesn't support successive halving nor racing"
+    )
+
+
+@pytest.mark.parametrize("min_resources, n_jobs", [(None, 1), (None, 2), (5, 1)])
+def test_warm_start(min_resources, n_jobs):
+    param_grid = {
+        "max_depth": Integer(2, 4),
+        "criterion": Categorical(["gini", "entropy"]),
+    }
+    if min_resources is None:
+        param_grid["n_estimators"] = Integer(5, 15)
+
+    evolved_estimator = GASearchCV(
+        RandomForestClassifier(random_state=0),
+        cv=2,
+        scoring="accuracy",
+        population_size=4,
+        generations=3,
+        param_grid=param_grid,
+        verbose=False,
+        n_jobs=n_jobs,
+        min_resources=min_resources,
+        max_resources=15,
+        resource="n_estimators",
+        warm_start_params=["n_estimators"],
+        warm_start_cache_size=20,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    assert check_is_fitted(evolved_estimator) is None
+    assert not evolved_estimator.best_estimator_.warm_start
+    assert (
+        evolved_estimator.best_estimator_.n_estimators
+        == evolved_estimator.best_params_.get("n_estimators", 15)
+    )
+
+    # The joblib workers released the models of the search and are still alive
+    owner = evolved_estimator._warm_start.key
+    cached = Parallel(n_jobs=n_jobs, batch_size=1)(
+        delayed(count_cached_models)(owner) for _ in range(2 * n_jobs)
+    )
+    assert [n_models for _, n_models in cached] == [0] * (2 * n_jobs)
+
+
+def count_cached_models(owner):
+    """
+    Returns
+    -------
+        The id of the process and its number of cached models with the owner
+    """
+    from sklearn_genetic.utils.warm_start import _model_cache
+
+    return os.getpid(), sum(key[0] == owner for key, _ in list(_model_cache._data))
+
+
+def test_wrong_warm_start():
+    param_grid = {
+        "max_depth": Integer(2, 4),
+        "criterion": Categorical(["gini", "entropy"]),
+    }
+
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid=param_grid,
+            warm_start_params=["max_depth"],
+        )
+    assert (
+        str(excinfo.value)
+        == "The estimator DecisionTreeClassifier doesn't support warm_start"
+    )
+
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            RandomForestClassifier(),
+            param_grid=param_grid,
+            warm_start_params=["n_estimators"],
+        )
+    assert (
+        str(excinfo.value)
+        == "The warm start parameter n_estimators must be part of the param_grid "
+        "or be the resource of the successive halving"
+    )
+
+
+@pytest.mark.parametrize(
+    "surrogate, algorithm, vectorized",
+    [
+        (RandomForestRegressor(n_estimators=10, random_state=0), "eaSimple", False),
+        (RandomForestRegressor(n_estimators=10, random_state=0), "eaSimple", True),
+        (
+            RandomForestRegressor(n_estimators=10, random_state=0),
+            "eaMuPlusLambda",
+            False,
+        ),
+        (GaussianProcessRegressor(), "eaMuCommaLambda", False),
+        (GaussianProcessRegressor(), "eaMuCommaLambda", True),
+        (LinearRegression(), "asyncSteadyState", False),
+    ],
+)
+def test_surrogate(surrogate, algorithm, vectorized):
+    population_size = 6
+    generations = 4
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=2,
+        scoring="accuracy",
+        population_size=population_size,
+        generations=generations,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "min_samples_split": Integer(2, 30),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        algorithm=algorithm,
+        n_jobs=2,
+        surrogate=surrogate,
+        surrogate_candidates=4,
+        vectorized=vectorized,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    assert check_is_fitted(evolved_estimator) is None
+    assert len(evolved_estimator) == len(evolved_estimator.history["gen"])
+    assert evolved_estimator._surrogate_n_samples >= 5
+    check_is_fitted(evolved_estimator._surrogate)
+
+
+def test_wrong_surrogate():
+    param_grid = {
+        "max_depth": Integer(2, 4),
+        "criterion": Categorical(["gini", "entropy"]),
+    }
+
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid=param_grid,
+            surrogate=DecisionTreeClassifier(),
+        )
+    assert (
+        str(excinfo.value)
+        == "surrogate must be a scikit-learn regressor, got DecisionTreeClassifier() instead"
+    )
+
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid=param_grid,
+            surrogate=LinearRegression(),
+            surrogate_candidates=0,
+        )
+    assert (
+        str(excinfo.value)
+        == "surrogate_candidates must be a positive integer, got 0 instead"
+    )
+
+
+@pytest.mark.parametrize(
+    "algorithm, elitism",
+    [
+        ("eaSimple", True),
+        ("eaSimple", False),
+        ("eaMuPlusLambda", True),
+        ("eaMuCommaLambda", True),
+        ("asyncSteadyState", True),
+    ],
+)
+def test_vectorized(algorithm, elitism):
+    population_size = 8
+    generations = 3
+
+    class PopulationCallback(BaseCallback):
+        """
+        Records the type of the population after each generation
+        """
+
+        def __init__(self):
+            self.types = []
+
+        def on_step(self, record=None, logbook=None, estimator=None):
+            self.types.append(type(estimator._pop))
+
+    callback = PopulationCallback()
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=2,
+        scoring="accuracy",
+        population_size=population_size,
+        generations=generations,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "min_weight_fraction_leaf": Continuous(0, 0.1),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        algorithm=algorithm,
+        elitism=elitism,
+        vectorized=True,
+    )
+    evolved_estimator.fit(X_train, y_train, callbacks=callback)
+
+    assert check_is_fitted(evolved_estimator) is None
+    # The generational algorithms keep the population as an array until the end of the fit
+    expected = list if algorithm == "asyncSteadyState" else ArrayPopulation
+    assert set(callback.types) == {expected}
+    assert all(ind.fitness.valid for ind in evolved_estimator._pop)
+    assert len(evolved_estimator) == len(evolved_estimator.history["gen"])
+    assert isinstance(evolved_estimator.best_params_["max_depth"], int)
+    assert evolved_estimator.best_params_["criterion"] in ["gini", "entropy"]
+    for parameters in evolved_estimator.logbook.chapters["parameters"]:
+        assert 2 <= parameters["max_depth"] <= 20
+        assert 0 <= parameters["min_weight_fraction_leaf"] <= 0.1
+
+
+def test_concurrent_searches():
+    param_grids = [
+        {"max_depth": Integer(2, 20), "criterion": Categorical(["gini", "entropy"])},
+        {"min_samples_split": Integer(2, 30), "max_depth": Integer(2, 5)},
+        {"min_weight_fraction_leaf": Continuous(0, 0.1), "max_depth": Integer(2, 8)},
+        {
+            "criterion": Categorical(["gini", "entropy"]),
+            "splitter": Categorical(["best", "random"]),
+        },
+    ]
+
+    def search(param_grid):
+        evolved_estimator = GASearchCV(
+            DecisionTreeClassifier(random_state=42),
+            cv=2,
+            scoring="accuracy",
+            population_size=4,
+            generations=3,
+            param_grid=param_grid,
+            verbose=False,
+        )
+        return evolved_estimator.fit(X_train, y_train)
+
+    # The searches share the process, each one with its own individuals
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        estimators = list(pool.map(search, param_grids * 2))
+
+    for evolved_estimator, param_grid in zip(estimators, param_grids * 2):
+        assert check_is_fitted(evolved_estimator) is None
+        assert list(evolved_estimator.best_params_) == list(param_grid)
+        assert len(evolved_estimator) == len(evolved_estimator.history["gen"])
+
+    # The fitted estimator and its hall of fame can be pickled
+    restored = pickle.loads(pickle.dumps(estimators[0]))
+    assert restored.best_params_ == estimators[0].best_params_
+    assert list(restored._hof[0]) == list(estimators[0]._hof[0])
+    assert restored._hof[0].fitness.values == estimators[0]._hof[0].fitness.values
+
+
+class CVResultsRows(BaseCallback):
+    def __init__(self):
+        self.n_rows = []
+
+    def on_step(self, record=None, logbook=None, estimator=None):
+        # The results are available while the search is running
+        self.n_rows.append(len(estimator.cv_results_["params"]))
+        return False
+
+    def __call__(self, record=None, logbook=None, estimator=None):
+        return self.on_step(record, logbook, estimator)
+
+
+def test_cv_results():
+
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=4,
+        generations=3,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+    )
+    assert evolved_estimator.cv_results_ is None
+    assert evolved_estimator.best_index_ is None
+
+    callback = CVResultsRows()
+    evolved_estimator.fit(X_train, y_train, callbacks=callback)
+    cv_results = evolved_estimator.cv_results_
+    records = evolved_estimator.logbook.chapters["parameters"]
+
+    n_rows = callback.n_rows
+    assert n_rows == sorted(n_rows) and n_rows[-1] == len(records)
+    assert cv_results["params"] == [
+        {"max_depth": record["max_depth"], "criterion": record["criterion"]}
+        for record in records
+    ]
+    assert np.allclose(cv_results["mean_test_score"], records.select("score"))
+    assert np.allclose(
+        cv_results["split1_test_score"], [record["cv_scores"][1] for record in records]
+    )
+    best_index = evolved_estimator.best_index_
+    assert cv_results["rank_test_score"][best_index] == 1
+    assert (
+        cv_results["mean_test_score"][best_index]
+        == evolved_estimator._hof[0].fitness.values[0]
+    )
+
+
+@pytest.mark.parametrize(
+    "algorithm, racing",
+    [
+        ("eaSimple", None),
+        ("eaMuPlusLambda", "hoeffding"),
+        ("eaMuCommaLambda", None),
+        ("asyncSteadyState", None),
+    ],
+)
+def test_timing_instrumentation(algorithm, racing):
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=4,
+        generations=2,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        algorithm=algorithm,
+        racing=racing,
+        n_jobs=2 if algorithm == "asyncSteadyState" else None,
+        verbose=False,
+    )
+    evolved_estimator.fit(X_train, y_train, callbacks=DeltaThreshold(threshold=-1))
+
+    history = evolved_estimator.history
+    for phase in [
+        "variation",
+        "evaluation",
+        "hall_of_fame",
+        "selection",
+        "stats",
+        "callbacks",
+    ]:
+        times = history[f"{phase}_time"]
+        assert len(times) == len(history["gen"])
+        assert all(time >= 0 for time in times)
+    assert sum(history["evaluation_time"]) > 0
+
+    records = evolved_estimator.logbook.chapters["parameters"]
+    for record in records:
+        n_folds = len(record["fit_times"])
+        assert 1 <= n_folds <= 3
+        assert len(record["score_times"]) == n_folds
+        assert record["fit_time"] == pytest.approx(sum(record["fit_times"]))
+        assert record["score_time"] == pytest.approx(sum(record["score_times"]))
+        assert np.isnan(record["peak_memory"]) or record["peak_memory"] > 0
+
+    cv_results = evolved_estimator.cv_results_
+    assert not np.isnan(cv_results["mean_fit_time"]).any()
+    assert not np.isnan(cv_results["mean_score_time"]).any()
+
+
+@pytest.mark.parametrize(
+    "algorithm, pareto_selection, objectives, cache_size, vectorized",
+    [
+        ("eaMuPlusLambda", "NSGA2", ["fit_time", "predict_time"], None, False),
+        ("eaMuPlusLambda", "SPEA2", ["model_size"], 10, False),
+        ("eaMuCommaLambda", "NSGA2", ["fit_time", "model_size"], None, True),
+    ],
+)
+def test_multi_objective(
+    algorithm, pareto_selection, objectives, cache_size, vectorized
+):
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=6,
+        generations=3,
+        param_grid={
+            "max_depth": Integer(1, 30),
+            "min_samples_split": Integer(2, 50),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        algorithm=algorithm,
+        objectives=objectives,
+        pareto_selection=pareto_selection,
+        cache_size=cache_size,
+        vectorized=vectorized,
+        verbose=False,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    assert check_is_fitted(evolved_estimator) is None
+    front = evolved_estimator.pareto_front_
+    assert len(front) == len(evolved_estimator.hof) >= 1
+    assert front[0]["params"] == evolved_estimator.best_params_
+    assert [solution["score"] for solution in front] == sorted(
+        (solution["score"] for solution in front), reverse=True
+    )
+
+    # No solution of the front is better than other in every objective
+    for solution in front:
+        assert set(solution) == {"params", "score", *objectives}
+        for other in front:
+            assert not (
+                other["score"] > solution["score"]
+                and all(other[name] < solution[name] for name in objectives)
+            )
+
+    for ind in evolved_estimator._pop:
+        assert len(ind.fitness.values) == len(objectives) + 1
+
+    records = evolved_estimator.logbook.chapters["parameters"]
+    assert all(
+        ("model_size" in record) == ("model_size" in objectives) for record in records
+    )
+    if "model_size" in objectives:
+        assert all(record["model_size"] > 0 for record in records)
+
+
+@pytest.mark.parametrize(
+    "parameters, message",
+    [
+        (
+            {"objectives": ["latency"]},
+            "objectives must be a list with values of "
+            "['fit_time', 'predict_time', 'model_size'], got latency instead",
+        ),
+        (
+            {"objectives": ["fit_time"], "pareto_selection": "NSGA3"},
+            "pareto_selection must be one of ['NSGA2', 'SPEA2'], got NSGA3 instead",
+        ),
+        (
+            {"objectives": ["fit_time"], "algorithm": "eaSimple"},
+            "The multi-objective search is only supported by the "
+            "eaMuPlusLambda and eaMuCommaLambda algorithms",
+        ),
+        (
+            {"objectives": ["fit_time"], "racing": "t-test"},
+            "The multi-objective search doesn't support successive halving, "
+            "racing, surrogate pre-screening nor a trial store",
+        ),
+    ],
+)
+def test_wrong_multi_objective(parameters, message):
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid={
+                "max_depth": Integer(2, 4),
+                "criterion": Categorical(["gini", "entropy"]),
+            },
+            **parameters,
+        )
+    assert str(excinfo.value) == message
+
+
+class InterruptedClassifier(DecisionTreeClassifier):
+    """
+    Decision tree whose fit raises a KeyboardInterrupt, like a Ctrl+C,
+    once it has been fitted ``max_fits`` times
+    """
+
+    max_fits = 0
+    n_fits = 0
+
+    def fit(self, X, y, **kwargs):
+        InterruptedClassifier.n_fits += 1
+        if InterruptedClassifier.n_fits > InterruptedClassifier.max_fits:
+            raise KeyboardInterrupt
+        return super().fit(X, y, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "algorithm, options",
+    [
+        ("eaSimple", {}),
+        ("eaMuPlusLambda", {"racing": "t-test"}),
+        ("eaMuCommaLambda", {"min_resources": 50, "cache_size": 10}),
+        ("asyncSteadyState", {"n_jobs": 2}),
+    ],
+)
+def test_max_evaluations(algorithm, options):
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=6,
+        generations=10,
+        param_grid={
+            "max_depth": Integer(2, 30),
+            "min_samples_split": Integer(2, 50),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        algorithm=algorithm,
+        max_evaluations=15,
+        verbose=False,
+        **options,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    assert check_is_fitted(evolved_estimator) is None
+    assert evolved_estimator.budget_exhausted_
+    assert len(evolved_estimator.logbook.chapters["parameters"]) == 15
+    assert len(evolved_estimator.cv_results_["params"]) == 15
+    assert all(ind.fitness.valid for ind in evolved_estimator._pop)
+
+
+@pytest.mark.parametrize("executor", [None, ThreadExecutor(n_jobs=2)])
+def test_max_time(executor):
+    generations = 1000
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=6,
+        generations=generations,
+        param_grid={
+            "max_depth": Integer(2, 30),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        executor=executor,
+        max_time=1,
+        verbose=False,
+    )
+    start = time.monotonic()
+    evolved_estimator.fit(X_train, y_train)
+
+    assert time.monotonic() - start < 10
+    assert check_is_fitted(evolved_estimator) is None
+    assert evolved_estimator.budget_exhausted_
+    assert evolved_estimator._n_iterations < generations + 1
+    assert evolved_estimator.best_params_ == evolved_estimator.hof[0]
+
+
+def test_keyboard_interrupt():
+    # The first generation and part of the second one are evaluated
+    InterruptedClassifier.max_fits = 3 * 6 + 10
+    InterruptedClassifier.n_fits = 0
+
+    evolved_estimator = GASearchCV(
+        InterruptedClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=6,
+        generations=5,
+        param_grid={
+            "max_depth": Integer(2, 30),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        algorithm="eaMuPlusLambda",
+        refit=False,
+        verbose=False,
+    )
+    evolved_estimator.fit(X_train, y_train)
+
+    assert evolved_estimator.budget_exhausted_
+    assert evolved_estimator._n_iterations == 2
+    # Only the candidates with all their cv splits scored are recorded
+    assert len(evolved_estimator.logbook.chapters["parameters"]) == 6 + 3
+    assert evolved_estimator.best_params_ == evolved_estimator.hof[0]
+    assert len(evolved_estimator.history["gen"]) == 2
+
+
+@pytest.mark.parametrize(
+    "parameters, message",
+    [
+        ({"max_time": 0}, "max_time must be a positive number or None, got 0 instead"),
+        (
+            {"max_time": "1h"},
+            "max_time must be a positive number or None, got 1h instead",
+        ),
+        (
+            {"max_evaluations": 0},
+            "max_evaluations must be a positive integer or None, got 0 instead",
+        ),
+        (
+            {"max_evaluations": 2.5},
+            "max_evaluations must be a positive integer or None, got 2.5 instead",
+        ),
+    ],
+)
+def test_wrong_budget(parameters, message):
+    with pytest.raises(Exception) as excinfo:
+        GASearchCV(
+            DecisionTreeClassifier(),
+            param_grid={"max_depth": Integer(2, 4)},
+            **parameters,
+        )
+    assert str(excinfo.value) == message
+
+
+class InterruptingCallback(BaseCallback):
+    """
+    Interrupts the search at the end of the second generation
+    """
+
+    def on_step(self, record=None, logbook=None, estimator=None):
+        if len(logbook) == 2:
+            raise KeyboardInterrupt
+
+
+@pytest.mark.parametrize("algorithm", ["eaSimple", "asyncSteadyState"])
+def test_keyboard_interrupt_between_evaluations(algorithm):
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=3,
+        scoring="accuracy",
+        population_size=6,
+        generations=5,
+        param_grid={
+            "max_depth": Integer(2, 30),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        algorithm=algorithm,
+        verbose=False,
+    )
+    evolved_estimator.fit(X_train, y_train, callbacks=InterruptingCallback())
+
+    # The search finishes with the generations recorded until the interruption
+    assert evolved_estimator.budget_exhausted_
+    assert evolved_estimator._n_iterations == 2
+    assert len(evolved_estimator.history["gen"]) == 2
+    assert evolved_estimator.best_params_ == evolved_estimator.hof[0]
+    assert check_is_fitted(evolved_estimator) is None
+
+
+def test_budget_without_evaluations():
+    InterruptedClassifier.max_fits = 0
+    InterruptedClassifier.n_fits = 0
+
+    evolved_estimator = GASearchCV(
+        InterruptedClassifier(),
+        cv=3,
+        param_grid={"max_depth": Integer(2, 30)},
+        verbose=False,
+    )
+    with pytest.raises(KeyboardInterrupt):
+        evolved_estimator.fit(X_train, y_train)
+
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(),
+        cv=3,
+        param_grid={"max_depth": Integer(2, 30)},
+        max_time=1e-9,
+        verbose=False,
+    )
+    with pytest.raises(Exception) as excinfo:
+        evolved_estimator.fit(X_train, y_train)
+    assert (
+        str(excinfo.value)
+        == "The budget of the search ran out before any candidate was evaluated"
+    )
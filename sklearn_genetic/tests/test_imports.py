@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+import sklearn_genetic
+
+
+def imported_modules(statement):
+    """Runs the statement in a new interpreter and returns the top level modules it loaded"""
+    code = f"{statement}\nimport sys\nprint(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return {name.split(".")[0] for name in output.split()}
+
+
+@pytest.mark.parametrize(
+    "statement, heavy_modules",
+    [
+        (
+            "import sklearn_genetic",
+            {"deap", "scipy", "sklearn", "pandas", "seaborn", "mlflow"},
+        ),
+        ("import sklearn_genetic.worker", {"deap", "pandas", "seaborn", "mlflow"}),
+        ("from sklearn_genetic import LogbookSaver", {"deap", "sklearn", "pandas"}),
+    ],
+)
+def test_lazy_imports(statement, heavy_modules):
+    assert imported_modules(statement) & heavy_modules == set()
+
+
+def test_public_api():
+    for name in sklearn_genetic.__all__:
+        assert getattr(sklearn_genetic, name) is not None
+        assert name in dir(sklearn_genetic)
+
+    from sklearn_genetic import GASearchCV
+    from sklearn_genetic.genetic_search import GASearchCV as GASearchCV_
+
+    assert GASearchCV is GASearchCV_
+
+    with pytest.raises(Exception) as excinfo:
+        sklearn_genetic.GeneticSearch
+    assert (
+        str(excinfo.value)
+        == "module 'sklearn_genetic' has no attribute 'GeneticSearch'"
+    )
@@ -0,0 +1,296 @@
+import importlib.util
+import threading
+from collections import namedtuple
+from types import SimpleNamespace
+
+import pytest
+from sklearn.datasets import load_digits
+from sklearn.model_selection import train_test_split
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.utils.validation import check_is_fitted
+
+from .. import GASearchCV
+from .. import mlflow as mlflow_module
+from ..mlflow import MLflowConfig, MAX_METRICS_PER_BATCH
+from ..space import Integer, Categorical
+
+requires_mlflow = pytest.mark.skipif(
+    importlib.util.find_spec("mlflow") is None, reason="mlflow is not installed"
+)
+
+data = load_digits()
+y = data["target"]
+X = data["data"]
+
+X_train, X_test, y_train, y_test = train_test_split(
+    X, y, test_size=0.33, random_state=42
+)
+
+
+def fit_search(log_config, generations=2, algorithm="eaMuPlusLambda"):
+    evolved_estimator = GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=2,
+        scoring="accuracy",
+        population_size=3,
+        generations=generations,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        algorithm=algorithm,
+        verbose=False,
+        log_config=log_config,
+    )
+    return evolved_estimator.fit(X_train, y_train)
+
+
+def get_runs(log_config):
+    return log_config.client.search_runs([log_config.experiment_id])
+
+
+@requires_mlflow
+@pytest.mark.parametrize("asynchronous", [True, False])
+def test_mlflow_runs(asynchronous, tmp_path):
+    log_config = MLflowConfig(
+        tracking_uri=tmp_path.as_uri(),
+        experiment="Digits",
+        run_name="Decision Tree",
+        save_models=True,
+        asynchronous=asynchronous,
+    )
+    evolved_estimator = fit_search(log_config)
+    assert check_is_fitted(evolved_estimator) is None
+
+    # All the fits are logged by the end of the fit, each one in its own run
+    records = evolved_estimator.logbook.chapters["parameters"]
+    runs = get_runs(log_config)
+    assert len(runs) == len(records)
+    assert sorted(run.data.metrics["score"] for run in runs) == pytest.approx(
+        sorted(record["score"] for record in records)
+    )
+    for run in runs:
+        assert set(run.data.params) == {"max_depth", "criterion"}
+        assert run.info.status == "FINISHED"
+        artifacts = log_config.client.list_artifacts(run.info.run_id)
+        assert [artifact.path for artifact in artifacts] == ["model"]
+
+
+@requires_mlflow
+def test_mlflow_run_per_generation(tmp_path):
+    generations = 3
+    log_config = MLflowConfig(
+        tracking_uri=tmp_path.as_uri(),
+        experiment="Digits",
+        run_name="Decision Tree",
+        run_per_generation=True,
+    )
+    evolved_estimator = fit_search(log_config, generations=generations)
+
+    runs = get_runs(log_config)
+    assert len(runs) == generations + 1
+    n_records = 0
+    for run in runs:
+        assert run.info.status == "FINISHED"
+        history = log_config.client.get_metric_history(run.info.run_id, "score")
+        steps = sorted(metric.step for metric in history)
+        assert steps == list(range(len(steps)))
+        assert len(
+            log_config.client.get_metric_history(run.info.run_id, "max_depth")
+        ) == len(steps)
+        assert set(run.data.tags) >= {f"parameters.{step}" for step in steps}
+        n_records += len(steps)
+
+    assert n_records == len(evolved_estimator.logbook.chapters["parameters"])
+
+    # The config can be used again in another fit
+    fit_search(log_config)
+    assert len(get_runs(log_config)) == generations + 1 + 3
+
+
+@requires_mlflow
+@pytest.mark.parametrize("asynchronous", [True, False])
+def test_mlflow_logging_errors(asynchronous, tmp_path, caplog):
+    log_config = MLflowConfig(
+        tracking_uri=tmp_path.as_uri(),
+        experiment="Digits",
+        run_name="Decision Tree",
+        asynchronous=asynchronous,
+    )
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("The tracking server is not available")
+
+    log_config._log_batch = fail
+
+    if asynchronous:
+        # The background thread can't raise in the search, the error is logged
+        evolved_estimator = fit_search(log_config)
+        assert check_is_fitted(evolved_estimator) is None
+        assert "Could not log the fits in MLflow" in caplog.text
+    else:
+        with pytest.raises(RuntimeError, match="The tracking server is not available"):
+            fit_search(log_config)
+
+
+class FakeClient:
+    """
+    Keeps the runs that :class:`~sklearn_genetic.mlflow.MLflowConfig` logs instead of
+    sending them to a tracking server
+    """
+
+    def __init__(self, tracking_uri=None, registry_uri=None):
+        self.runs = {}
+        self.n_batches = 0
+
+    def create_run(self, experiment_id, tags):
+        run_id = str(len(self.runs))
+        self.runs[run_id] = {
+            "tags": dict(tags),
+            "metrics": [],
+            "params": [],
+            "terminated": False,
+        }
+        return SimpleNamespace(info=SimpleNamespace(run_id=run_id))
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        run = self.runs[run_id]
+        assert not run["terminated"]
+        run["metrics"].extend(metrics)
+        run["params"].extend(params)
+        run["tags"].update((tag.key, tag.value) for tag in tags)
+        self.n_batches += 1
+
+    def set_terminated(self, run_id):
+        self.runs[run_id]["terminated"] = True
+
+
+@pytest.fixture
+def fake_mlflow(monkeypatch):
+    """
+    Replaces mlflow in the module of MLflowConfig, so it's tested without mlflow installed
+    """
+    fake = SimpleNamespace(
+        set_registry_uri=lambda uri: None,
+        set_tracking_uri=lambda uri: None,
+        set_experiment=lambda name: None,
+        get_experiment_by_name=lambda name: SimpleNamespace(experiment_id="0"),
+        set_tags=lambda tags: None,
+        active_run=lambda: None,
+    )
+    entities = {
+        "Metric": namedtuple("Metric", ["key", "value", "timestamp", "step"]),
+        "Param": namedtuple("Param", ["key", "value"]),
+        "RunTag": namedtuple("RunTag", ["key", "value"]),
+        "MlflowClient": FakeClient,
+        "MLFLOW_RUN_NAME": "mlflow.runName",
+        "MLFLOW_PARENT_RUN_ID": "mlflow.parentRunId",
+    }
+    monkeypatch.setattr(mlflow_module, "mlflow", fake, raising=False)
+    for name, value in entities.items():
+        monkeypatch.setattr(mlflow_module, name, value, raising=False)
+
+
+@pytest.mark.parametrize("asynchronous", [True, False])
+@pytest.mark.parametrize("run_per_generation", [True, False])
+def test_mlflow_fake_client(asynchronous, run_per_generation, fake_mlflow):
+    generations = 2
+    log_config = MLflowConfig(
+        tracking_uri="file:///mlruns",
+        experiment="Digits",
+        run_name="Decision Tree",
+        run_per_generation=run_per_generation,
+        asynchronous=asynchronous,
+    )
+    evolved_estimator = fit_search(log_config, generations=generations)
+    records = evolved_estimator.logbook.chapters["parameters"]
+    runs = list(log_config.client.runs.values())
+    assert all(run["terminated"] for run in runs)
+    assert log_config._thread is None
+
+    if not run_per_generation:
+        assert len(runs) == len(records)
+        for run in runs:
+            assert run["tags"]["mlflow.runName"] == "Decision Tree"
+            assert {param.key for param in run["params"]} == {"max_depth", "criterion"}
+            assert [metric.key for metric in run["metrics"]] == ["score"]
+        return
+
+    # Each generation is logged in its own run, with a step per fit
+    assert [run["tags"]["mlflow.runName"] for run in runs] == [
+        f"Decision Tree-generation-{generation}"
+        for generation in range(generations + 1)
+    ]
+    n_records = 0
+    for run in runs:
+        steps = [metric.step for metric in run["metrics"] if metric.key == "score"]
+        assert steps == list(range(len(steps)))
+        assert [
+            metric.step for metric in run["metrics"] if metric.key == "max_depth"
+        ] == steps
+        assert set(run["tags"]) >= {f"parameters.{step}" for step in steps}
+        n_records += len(steps)
+    assert n_records == len(records)
+
+
+def test_mlflow_fake_client_queue(fake_mlflow):
+    log_config = MLflowConfig(
+        tracking_uri="file:///mlruns",
+        experiment="Digits",
+        run_name="Decision Tree",
+        run_per_generation=True,
+    )
+
+    # The fits queued while a batch is sent are grouped in the next one
+    release = threading.Event()
+    client = log_config.client
+    log_batch = client.log_batch
+
+    def slow_log_batch(*args, **kwargs):
+        release.wait(5)
+        log_batch(*args, **kwargs)
+
+    client.log_batch = slow_log_batch
+    for depth in range(5):
+        log_config.create_run({"max_depth": depth}, 0.5, None)
+    release.set()
+    log_config.end_generation()
+    log_config.flush()
+
+    assert client.n_batches <= 2
+    assert len(client.runs) == 1
+    run = client.runs["0"]
+    steps = [metric.step for metric in run["metrics"] if metric.key == "score"]
+    assert steps == list(range(5))
+    assert run["terminated"]
+    log_config.close()
+    assert log_config._thread is None
+
+    # The metrics that don't fit in a request are split in several batches
+    client.n_batches = 0
+    metrics = [
+        mlflow_module.Metric("score", 0.5, 0, step)
+        for step in range(MAX_METRICS_PER_BATCH + 1)
+    ]
+    log_config._log_batch(log_config._create_run("batches", None), metrics=metrics)
+    assert client.n_batches == 2
+
+
+def test_mlflow_async_steady_state_runs(fake_mlflow):
+    log_config = MLflowConfig(
+        tracking_uri="file:///mlruns",
+        experiment="Digits",
+        run_name="Decision Tree",
+        run_per_generation=True,
+    )
+    with pytest.raises(Exception) as excinfo:
+        fit_search(log_config, algorithm="asyncSteadyState")
+    assert str(excinfo.value) == (
+        "The asyncSteadyState algorithm has no generations, "
+        "it doesn't support log_config with run_per_generation=True"
+    )
+
+    log_config.run_per_generation = False
+    evolved_estimator = fit_search(log_config, algorithm="asyncSteadyState")
+    records = evolved_estimator.logbook.chapters["parameters"]
+    assert len(log_config.client.runs) == len(records)
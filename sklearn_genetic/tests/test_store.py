@@ -0,0 +1,118 @@
+import pytest
+import numpy as np
+from sklearn.datasets import load_digits
+from sklearn.model_selection import train_test_split
+from sklearn.tree import DecisionTreeClassifier
+
+from .. import GASearchCV
+from ..space import Integer, Categorical
+from ..callbacks.base import BaseCallback
+from ..store import SQLiteTrialStore, BaseTrialStore, check_trial_store
+from ..utils.cache import genome_key
+
+data = load_digits()
+y = data["target"]
+X = data["data"]
+
+X_train, X_test, y_train, y_test = train_test_split(
+    X, y, test_size=0.33, random_state=42
+)
+
+
+def get_estimator(trial_store):
+    return GASearchCV(
+        DecisionTreeClassifier(random_state=42),
+        cv=2,
+        scoring="accuracy",
+        population_size=4,
+        generations=2,
+        param_grid={
+            "max_depth": Integer(2, 20),
+            "criterion": Categorical(["gini", "entropy"]),
+        },
+        verbose=False,
+        trial_store=trial_store,
+    )
+
+
+def test_sqlite_trial_store(tmp_path):
+    path = str(tmp_path / "trials.db")
+    store = SQLiteTrialStore(path)
+
+    assert store.get("key") is None
+    store.put("key", {"max_depth": np.int64(3), "criterion": "gini"}, [0.5, np.nan])
+    store.close()
+
+    # The trials are persisted in the file
+    store = SQLiteTrialStore(path)
+    cv_scores = store.get("key")
+    assert cv_scores[0] == 0.5
+    assert np.isnan(cv_scores[1])
+    assert len(store) == 1
+
+    assert isinstance(check_trial_store(path), SQLiteTrialStore)
+    assert check_trial_store(store) is store
+    assert check_trial_store(None) is None
+
+    with pytest.raises(Exception) as excinfo:
+        check_trial_store(4)
+    assert (
+        str(excinfo.value)
+        == "trial_store should be either a path to a SQLite file or an instance of "
+        "store.BaseTrialStore"
+    )
+
+
+def test_trial_store_reuse(tmp_path):
+    path = str(tmp_path / "trials.db")
+
+    evolved_estimator = get_estimator(path)
+    evolved_estimator.fit(X_train, y_train)
+
+    n_trials = len(SQLiteTrialStore(path))
+    evaluated = {
+        genome_key({key: record[key] for key in evolved_estimator.space.parameters})
+        for record in evolved_estimator.logbook.chapters["parameters"]
+    }
+    assert n_trials == len(evaluated)
+
+    # A new search with the same data and configuration uses the stored trials
+    second_estimator = get_estimator(path)
+    second_estimator.fit(X_train, y_train)
+    assert second_estimator._fingerprint == evolved_estimator._fingerprint
+
+    candidate = {"max_depth": 3, "criterion": "gini"}
+    second_estimator._trial_store.put(
+        second_estimator._trial_key(candidate), candidate, [42.0, 42.0]
+    )
+    assert second_estimator.evaluate([3, "gini"]) == [42.0]
+
+    # Different data leads to a different fingerprint
+    third_estimator = get_estimator(path)
+    third_estimator.fit(X_test, y_test)
+    assert third_estimator._fingerprint != evolved_estimator._fingerprint
+    assert third_estimator.evaluate([3, "gini"]) != [42.0]
+
+
+def test_trial_store_closed_on_error(tmp_path):
+    class FailingCallback(BaseCallback):
+        def on_step(self, record=None, logbook=None, estimator=None):
+            raise RuntimeError("The search failed")
+
+    store = SQLiteTrialStore(str(tmp_path / "trials.db"))
+    evolved_estimator = get_estimator(store)
+    with pytest.raises(RuntimeError):
+        evolved_estimator.fit(X_train, y_train, callbacks=FailingCallback())
+
+    # The connection is released even if the search fails
+    assert store._connection is None
+    assert len(store) > 0
+
+
+def test_wrong_base_trial_store():
+    class MyTrialStore(BaseTrialStore):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        MyTrialStore()
@@ -1,3 +1,3 @@
-from .logbook import logbook_to_pandas
+from .logbook import EvaluationLog, logbook_to_pandas, read_logbook
 
-__all__ = ["logbook_to_pandas"]
+__all__ = ["EvaluationLog", "logbook_to_pandas", "read_logbook"]
@@ -0,0 +1,73 @@
+import time
+
+"""
+This module contains the budget of a search, the limits of time and evaluations
+that are checked between the evaluations of the candidates
+"""
+
+
+class Budget:
+    """
+    Wall-clock and number of evaluations limits of a search. The deadline starts
+    counting when the budget is created, and the search can also be marked as interrupted,
+    for example by a :class:`KeyboardInterrupt`, which exhausts the budget.
+    """
+
+    def __init__(self, max_time=None, max_evaluations=None):
+        """
+        Parameters
+        ----------
+        max_time: float, default=None
+            Maximum number of seconds of the search, ``None`` means no limit
+        max_evaluations: int, default=None
+            Maximum number of evaluations of the search, ``None`` means no limit
+        """
+        self.max_time = max_time
+        self.max_evaluations = max_evaluations
+        self.n_evaluations = 0
+        self.interrupted = False
+        self._deadline = None if max_time is None else time.monotonic() + max_time
+
+    def add_evaluation(self):
+        """
+        Counts a completed evaluation
+        """
+        self.n_evaluations += 1
+
+    def interrupt(self):
+        """
+        Marks the search as interrupted, the budget is exhausted from now on
+        """
+        self.interrupted = True
+
+    def remaining_time(self):
+        """
+        Returns
+        -------
+            Seconds until the deadline (``0`` if it has passed), ``None`` if there is no time limit
+        """
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def remaining_evaluations(self):
+        """
+        Returns
+        -------
+            Number of evaluations that can still be done, ``None`` if there is no limit
+        """
+        if self.max_evaluations is None:
+            return None
+        return max(self.max_evaluations - self.n_evaluations, 0)
+
+    def exhausted(self):
+        """
+        Returns
+        -------
+            ``True`` if the search was interrupted or any of the limits was reached
+        """
+        return (
+            self.interrupted
+            or self.remaining_time() == 0
+            or self.remaining_evaluations() == 0
+        )
@@ -0,0 +1,108 @@
+from collections import OrderedDict
+
+import numpy as np
+from joblib import hash as joblib_hash
+
+
+def genome_key(parameters):
+    """
+    Canonical and hashable representation of a set of hyperparameters
+
+    Parameters
+    ----------
+    parameters: dict
+        Dictionary with the keys as the hyperparameter name and the value as the current value setting
+
+    Returns
+    -------
+    key: tuple or str
+        Sorted tuple of (name, value) pairs, or a joblib hash of it
+        if any of the values is not hashable
+    """
+    key = tuple(
+        (name, value.item() if isinstance(value, np.generic) else value)
+        for name, value in sorted(parameters.items())
+    )
+    try:
+        hash(key)
+    except TypeError:
+        key = joblib_hash(key)
+    return key
+
+
+class FitnessCache:
+    """
+    In-memory LRU cache of the fitness of the already evaluated hyperparameters
+    """
+
+    def __init__(self, max_size):
+        """
+        Parameters
+        ----------
+        max_size: int
+            Maximum number of hyperparameters combinations to keep,
+            the least recently used one is discarded when the cache is full
+        """
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(
+                f"cache_size must be a positive integer or None, got {max_size} instead"
+            )
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def lookup(self, candidates):
+        """
+        Resolves a batch of candidates against the cache.
+        Only the first occurrence of a not cached candidate counts as a miss,
+        its repetitions in the same batch count as hits.
+
+        Parameters
+        ----------
+        candidates: list of dict
+            Hyperparameters of each candidate
+
+        Returns
+        -------
+        keys: list
+            The genome key of each candidate
+        fitnesses: dict
+            Cached fitness of the candidates found in the cache, indexed by its key
+        pending: dict
+            Distinct candidates that must be evaluated, indexed by its key
+        """
+        keys = [genome_key(parameters) for parameters in candidates]
+        fitnesses = {}
+        pending = {}
+
+        for key, parameters in zip(keys, candidates):
+            if key in self._data:
+                self._data.move_to_end(key)
+                fitnesses[key] = self._data[key]
+                self.hits += 1
+            elif key in pending:
+                self.hits += 1
+            else:
+                pending[key] = parameters
+                self.misses += 1
+
+        return keys, fitnesses, pending
+
+    def put(self, key, fitness):
+        """
+        Parameters
+        ----------
+        key: tuple or str
+            Genome key of the evaluated hyperparameters
+        fitness: list
+            The fitness values achieved by the hyperparameters
+        """
+        self._data[key] = fitness
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,153 @@
+import numpy as np
+from scipy.stats import rankdata
+
+
+class CVResults:
+    """
+    Accumulates the evaluations of a search in the layout of the ``cv_results_``
+    attribute of the scikit-learn searches. Each field is a preallocated numpy array
+    whose capacity doubles when it's full, so adding an evaluation takes constant amortized
+    time and the results can be read at any moment without converting the logbook.
+    """
+
+    def __init__(self, parameters, n_splits, capacity=64):
+        """
+        Parameters
+        ----------
+        parameters: list of str
+            Names of the hyperparameters of the candidates
+        n_splits: int
+            Number of cross-validation splits of each complete evaluation
+        capacity: int, default=64
+            Number of evaluations allocated initially
+        """
+        self.parameters = list(parameters)
+        self.n_splits = n_splits
+        self._n_records = 0
+        self._params = []
+        self._param_values = {
+            name: np.empty(capacity, dtype=object) for name in self.parameters
+        }
+        self._split_scores = np.full((capacity, n_splits), np.nan)
+        self._fields = {
+            name: np.full(capacity, np.nan)
+            for name in [
+                "mean_fit_time",
+                "std_fit_time",
+                "mean_score_time",
+                "std_score_time",
+                "mean_test_score",
+                "std_test_score",
+            ]
+        }
+
+    def add(self, parameters, score, cv_scores=None, fit_times=None, score_times=None):
+        """
+        Parameters
+        ----------
+        parameters: dict
+            Hyperparameters of the evaluated candidate
+        score: float
+            Average cv-score of the candidate
+        cv_scores: array of shape (n_splits,), default=None
+            Score of each split, ``None`` if the evaluation was not complete,
+            in which case the split scores are ``nan``
+        fit_times: array of shape (n_splits,), default=None
+            Time spent fitting the estimator in each split, ``nan`` if it's ``None``
+        score_times: array of shape (n_splits,), default=None
+            Time spent scoring the estimator in each split, ``nan`` if it's ``None``
+        """
+        if self._n_records == len(self._split_scores):
+            self._grow()
+
+        n = self._n_records
+        self._params.append(dict(parameters))
+        for name in self.parameters:
+            self._param_values[name][n] = parameters.get(name)
+
+        if cv_scores is not None:
+            self._split_scores[n] = cv_scores
+            self._fields["std_test_score"][n] = np.std(cv_scores)
+        self._fields["mean_test_score"][n] = score
+
+        for kind, times in [("fit", fit_times), ("score", score_times)]:
+            if times is not None and len(times):
+                self._fields[f"mean_{kind}_time"][n] = np.mean(times)
+                self._fields[f"std_{kind}_time"][n] = np.std(times)
+
+        self._n_records += 1
+
+    def best_index(self, criteria_sign=1):
+        """
+        Parameters
+        ----------
+        criteria_sign: {1, -1}, default=1
+            1 if a higher score is better, -1 otherwise
+
+        Returns
+        -------
+            Position of the evaluation with the best average score, ``None`` if there are no evaluations
+        """
+        if not self._n_records:
+            return None
+        return int(np.argmax(self._ranking_key(criteria_sign)))
+
+    def to_dict(self, criteria_sign=1):
+        """
+        Parameters
+        ----------
+        criteria_sign: {1, -1}, default=1
+            1 if a higher score is better, -1 otherwise
+
+        Returns
+        -------
+            Dictionary with the layout of the ``cv_results_`` of
+            :class:`~sklearn.model_selection.GridSearchCV`, its arrays are views of the
+            accumulated evaluations, so they must not be modified
+        """
+        n = self._n_records
+        results = {
+            name: self._fields[name][:n]
+            for name in [
+                "mean_fit_time",
+                "std_fit_time",
+                "mean_score_time",
+                "std_score_time",
+            ]
+        }
+        for name in self.parameters:
+            values = self._param_values[name][:n]
+            results[f"param_{name}"] = np.ma.MaskedArray(
+                values, mask=[value is None for value in values]
+            )
+        results["params"] = list(self._params)
+        for split in range(self.n_splits):
+            results[f"split{split}_test_score"] = self._split_scores[:n, split]
+        results["mean_test_score"] = self._fields["mean_test_score"][:n]
+        results["std_test_score"] = self._fields["std_test_score"][:n]
+        # The nan scores are ranked last
+        results["rank_test_score"] = rankdata(
+            -self._ranking_key(criteria_sign), method="min"
+        ).astype(np.int32)
+        return results
+
+    def _ranking_key(self, criteria_sign):
+        key = criteria_sign * self._fields["mean_test_score"][: self._n_records]
+        return np.where(np.isnan(key), -np.inf, key)
+
+    def _grow(self):
+        capacity = 2 * max(len(self._split_scores), 1)
+        for name, values in self._param_values.items():
+            grown = np.empty(capacity, dtype=object)
+            grown[: len(values)] = values
+            self._param_values[name] = grown
+        for name, values in self._fields.items():
+            grown = np.full(capacity, np.nan)
+            grown[: len(values)] = values
+            self._fields[name] = grown
+        grown = np.full((capacity, self.n_splits), np.nan)
+        grown[: len(self._split_scores)] = self._split_scores
+        self._split_scores = grown
+
+    def __len__(self):
+        return self._n_records
@@ -0,0 +1,651 @@
+import numbers
+import pickle
+import sys
+import time
+import tracemalloc
+import uuid
+import warnings
+from traceback import format_exc
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.exceptions import FitFailedWarning
+from sklearn.model_selection import train_test_split
+from sklearn.utils import _safe_indexing
+from sklearn.utils.metaestimators import _safe_split
+from sklearn.utils.validation import _num_samples
+
+from .shared import pack, unpack, to_memmap
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows
+    resource = None
+
+"""
+This module contains the functions used to fit and score the candidates
+of each generation over the cross-validation splits
+"""
+
+
+class Fold:
+    """
+    Train and test partitions of the data for one cross-validation split.
+    The partitions are sliced from the full data each time they are requested,
+    unless the fold is materialized, in that case they are sliced only once and reused.
+    """
+
+    def __init__(self, X, y, train, test, fit_params=None):
+        """
+        Parameters
+        ----------
+        X: array-like of shape (n_samples, n_features)
+            The data to fit.
+        y: array-like of shape (n_samples,) or (n_samples, n_outputs)
+            The target variable to try to predict.
+        train: array-like
+            Indices of the training samples
+        test: array-like
+            Indices of the test samples
+        fit_params: dict, default=None
+            Parameters passed to the ``fit`` method of the estimator,
+            the ones with one value per sample are sliced with the train indices
+        """
+        self.X = X
+        self.y = y
+        self.train = train
+        self.test = test
+        self.fit_params = fit_params if fit_params is not None else {}
+        self.key = uuid.uuid4().hex
+        self._partitions = None
+
+    @property
+    def materialized(self):
+        return self._partitions is not None
+
+    def materialize(self, estimator):
+        """
+        Slices the train and test partitions once, as contiguous arrays when the data is a numpy array,
+        and releases the references to the full data
+
+        Parameters
+        ----------
+        estimator: estimator object
+            Estimator used to slice the data (it handles pairwise kernels)
+        """
+        self._partitions = _map_partitions(self._slice(estimator), _contiguous)
+        self.X = None
+        self.y = None
+        self.fit_params = None
+
+    def share(self, folder, name):
+        """
+        Moves the materialized partitions to read-only memory-mapped files, so they are sent
+        to the worker processes by reference instead of being copied
+
+        Parameters
+        ----------
+        folder: str
+            Folder of the memory-mapped files
+        name: str
+            Prefix of the files of this fold
+        """
+        X_train, y_train, X_test, y_test, fit_params = self._partitions
+        self._partitions = (
+            to_memmap(X_train, folder, f"{name}_X_train"),
+            to_memmap(y_train, folder, f"{name}_y_train"),
+            to_memmap(X_test, folder, f"{name}_X_test"),
+            to_memmap(y_test, folder, f"{name}_y_test"),
+            {
+                key: to_memmap(value, folder, f"{name}_{key}")
+                for key, value in fit_params.items()
+            },
+        )
+
+    def get(self, estimator):
+        """
+        Parameters
+        ----------
+        estimator: estimator object
+            Estimator used to slice the data (it handles pairwise kernels)
+
+        Returns
+        -------
+        X_train, y_train, X_test, y_test, fit_params: tuple
+            The partitions of the data and the fit params of the training samples
+        """
+        if self._partitions is not None:
+            return self._partitions
+        return self._slice(estimator)
+
+    def subsample(self, n_samples, stratify=None, random_state=None):
+        """
+        Fold with the same test partition and a random subset of the training samples
+
+        Parameters
+        ----------
+        n_samples: int
+            Number of training samples to keep
+        stratify: array-like, default=None
+            If not ``None``, the training samples are selected in a stratified fashion
+            using this array (indexed as the full data) as the class labels
+        random_state: int, default=None
+            Seed of the random subsample
+
+        Returns
+        -------
+            A new :class:`~sklearn_genetic.utils.cv_scores.Fold`
+        """
+        positions = np.arange(len(self.train))
+        labels = None if stratify is None else _safe_indexing(stratify, self.train)
+        try:
+            positions = train_test_split(
+                positions,
+                train_size=n_samples,
+                stratify=labels,
+                random_state=random_state,
+            )[0]
+        except ValueError:
+            # There are not enough samples to represent all the classes
+            positions = train_test_split(
+                positions, train_size=n_samples, random_state=random_state
+            )[0]
+        positions = np.sort(positions)
+
+        fold = Fold(self.X, self.y, self.train[positions], self.test, self.fit_params)
+
+        if self.materialized:
+            X_train, y_train, X_test, y_test, fit_params = self._partitions
+            fold._partitions = (
+                _safe_indexing(X_train, positions),
+                _safe_indexing(y_train, positions),
+                X_test,
+                y_test,
+                {
+                    key: (
+                        _safe_indexing(value, positions)
+                        if _is_sample_aligned(value, len(self.train))
+                        else value
+                    )
+                    for key, value in fit_params.items()
+                },
+            )
+
+        return fold
+
+    def __getstate__(self):
+        # The data in memory-mapped files is pickled by reference
+        state = self.__dict__.copy()
+        state["X"] = pack(self.X)
+        state["y"] = pack(self.y)
+        if self.fit_params is not None:
+            state["fit_params"] = {
+                key: pack(value) for key, value in self.fit_params.items()
+            }
+        if self._partitions is not None:
+            state["_partitions"] = _map_partitions(self._partitions, pack)
+        return state
+
+    def __setstate__(self, state):
+        state["X"] = unpack(state["X"])
+        state["y"] = unpack(state["y"])
+        if state["fit_params"] is not None:
+            state["fit_params"] = {
+                key: unpack(value) for key, value in state["fit_params"].items()
+            }
+        if state["_partitions"] is not None:
+            state["_partitions"] = _map_partitions(state["_partitions"], unpack)
+        self.__dict__.update(state)
+
+    def _slice(self, estimator):
+        X_train, y_train = _safe_split(estimator, self.X, self.y, self.train)
+        X_test, y_test = _safe_split(estimator, self.X, self.y, self.test, self.train)
+
+        # Only the fit params with one value per sample are sliced
+        n_samples = _num_samples(self.X)
+        fit_params = {
+            key: (
+                _safe_indexing(value, self.train)
+                if _is_sample_aligned(value, n_samples)
+                else value
+            )
+            for key, value in self.fit_params.items()
+        }
+        return X_train, y_train, X_test, y_test, fit_params
+
+
+def _is_sample_aligned(value, n_samples):
+    try:
+        return not isinstance(value, str) and _num_samples(value) == n_samples
+    except TypeError:
+        return False
+
+
+def _map_partitions(partitions, function):
+    X_train, y_train, X_test, y_test, fit_params = partitions
+    return (
+        function(X_train),
+        function(y_train),
+        function(X_test),
+        function(y_test),
+        {key: function(value) for key, value in fit_params.items()},
+    )
+
+
+def _contiguous(data):
+    if isinstance(data, np.ndarray):
+        return np.ascontiguousarray(data)
+    return data
+
+
+def fit_and_score(
+    estimator,
+    fold,
+    scorer,
+    parameters,
+    error_score=np.nan,
+    warm_start=None,
+    model_size=False,
+):
+    """
+    Fits a copy of the estimator with the given parameters in the train partition
+    of the fold and scores it in the test partition
+
+    Parameters
+    ----------
+    estimator: estimator object
+        Unfitted estimator to clone and fit
+    fold: :class:`~sklearn_genetic.utils.cv_scores.Fold`
+        Train and test partitions of the data
+    scorer: callable
+        Scorer with signature ``scorer(estimator, X, y)``
+    parameters: dict
+        Hyperparameters to set in the estimator before fitting it
+    error_score: 'raise' or numeric, default=np.nan
+        Value to assign to the score if an error occurs in estimator fitting.
+    warm_start: :class:`~sklearn_genetic.utils.warm_start.WarmStart`, default=None
+        If set, the training continues from a cached model of the fold when the candidate
+        only differs from it in bigger values of the growable parameters
+    model_size: bool, default=False
+        If ``True``, the size in bytes of the pickled fitted estimator is measured
+
+    Returns
+    -------
+    result: dict
+        Dictionary with the keys ``score``, ``fit_time``, ``score_time``, ``peak_memory``
+        (see :func:`~sklearn_genetic.utils.cv_scores.peak_memory`) and ``model_size``,
+        ``None`` if it's not measured
+    """
+
+    if not isinstance(error_score, numbers.Number) and error_score != "raise":
+        raise ValueError(
+            "error_score must be the string 'raise' or a numeric value. "
+            "(Hint: if using 'raise', please make sure that it has been "
+            "spelled correctly.)"
+        )
+
+    local_estimator, grow = None, True
+    if warm_start is not None:
+        local_estimator, grow = warm_start.lookup(fold, parameters)
+    if local_estimator is None:
+        local_estimator = clone(estimator)
+        local_estimator.set_params(
+            **{key: clone(value, safe=False) for key, value in parameters.items()}
+        )
+
+    X_train, y_train, X_test, y_test, fit_params = fold.get(local_estimator)
+
+    if tracemalloc.is_tracing() and hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    memory_start = memory_usage()
+
+    start_time = time.time()
+    try:
+        if grow:
+            local_estimator.fit(X_train, y_train, **fit_params)
+    except Exception:
+        if error_score == "raise":
+            raise
+        warnings.warn(
+            f"Estimator fit failed. The score on this train-test partition for "
+            f"these parameters will be set to {error_score}. Details: \n{format_exc()}",
+            FitFailedWarning,
+        )
+        return {
+            "score": error_score,
+            "fit_time": time.time() - start_time,
+            "score_time": 0.0,
+            "peak_memory": peak_memory(memory_start),
+            "model_size": np.nan if model_size else None,
+        }
+
+    fit_time = time.time() - start_time
+    if warm_start is not None and grow:
+        warm_start.put(fold, parameters, local_estimator)
+
+    score = scorer(local_estimator, X_test, y_test)
+    score_time = time.time() - start_time - fit_time
+
+    return {
+        "score": score,
+        "fit_time": fit_time,
+        "score_time": score_time,
+        "peak_memory": peak_memory(memory_start),
+        "model_size": (
+            len(pickle.dumps(local_estimator, protocol=pickle.HIGHEST_PROTOCOL))
+            if model_size
+            else None
+        ),
+    }
+
+
+def memory_usage():
+    """
+    Memory of the current process that :func:`~sklearn_genetic.utils.cv_scores.peak_memory`
+    measures the increase from: the memory traced by :mod:`tracemalloc` if it's tracing,
+    otherwise the peak resident set size of the process
+
+    Returns
+    -------
+        The memory in bytes, ``nan`` if it can't be measured
+    """
+    if tracemalloc.is_tracing():
+        return float(tracemalloc.get_traced_memory()[0])
+    if resource is None:  # pragma: no cover
+        return np.nan
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports it in bytes and Linux in kilobytes
+    return float(max_rss if sys.platform == "darwin" else 1024 * max_rss)
+
+
+def peak_memory(start):
+    """
+    Memory added by a fit over the memory of the process when it started.
+    If :mod:`tracemalloc` is tracing, it's the peak of the traced memory since the start
+    minus the memory traced then. Otherwise it's how much the peak resident set size of the
+    process rose, as that peak never decreases, it's ``nan`` when the fit stays below
+    the previous peak, for example because it reuses the memory freed by earlier fits.
+    Both are read without sampling, so they are cheap to measure.
+
+    Parameters
+    ----------
+    start: float
+        The :func:`~sklearn_genetic.utils.cv_scores.memory_usage` when the fit started
+
+    Returns
+    -------
+        The memory increase in bytes, ``nan`` if it can't be measured
+    """
+    if tracemalloc.is_tracing():
+        return float(tracemalloc.get_traced_memory()[1]) - start
+    increase = memory_usage() - start
+    return increase if increase > 0 else np.nan
+
+
+def highest_peak(peaks):
+    """
+    Returns
+    -------
+        The highest of the ``peak_memory`` values that were measured, ``nan`` if there are none
+    """
+    return max((peak for peak in peaks if not np.isnan(peak)), default=np.nan)
+
+
+def evaluation_result(results):
+    """
+    Joins the results of :func:`~sklearn_genetic.utils.cv_scores.fit_and_score`
+    of a candidate in several cv splits
+
+    Parameters
+    ----------
+    results: list of dict
+        Result of each cv split
+
+    Returns
+    -------
+    evaluation: dict
+        Dictionary with the arrays ``cv_scores``, ``fit_times``, ``score_times`` and
+        ``model_sizes`` (``None`` if they were not measured), with a value per split,
+        the highest ``peak_memory`` of the splits and ``timed_out=False``
+    """
+    model_sizes = [result.get("model_size") for result in results]
+    return {
+        "cv_scores": np.array([result["score"] for result in results], dtype=float),
+        "fit_times": np.array([result["fit_time"] for result in results]),
+        "score_times": np.array([result["score_time"] for result in results]),
+        "peak_memory": highest_peak([result["peak_memory"] for result in results]),
+        "model_sizes": (
+            np.array(model_sizes, dtype=float)
+            if all(size is not None for size in model_sizes)
+            else None
+        ),
+        "timed_out": False,
+    }
+
+
+def timeout_evaluation(n_folds, timeout, error_score=np.nan, model_size=False):
+    """
+    Evaluation of a candidate whose fits were stopped because they took longer than the timeout
+
+    Parameters
+    ----------
+    n_folds: int
+        Number of cv splits of the evaluation
+    timeout: float
+        Seconds that the evaluation was running before it was stopped
+    error_score: numeric, default=np.nan
+        Score assigned to each split
+    model_size: bool, default=False
+        If ``True``, the size of the models is set to ``nan``, as they were not fitted
+
+    Returns
+    -------
+    evaluation: dict
+        Dictionary like the ones of :func:`~sklearn_genetic.utils.cv_scores.evaluation_result`,
+        the timeout is split evenly in the fit times and ``timed_out`` is ``True``
+    """
+    warnings.warn(
+        f"The evaluation took longer than {timeout} seconds and it was stopped. "
+        f"The score on each train-test partition for these parameters will be set to {error_score}.",
+        FitFailedWarning,
+    )
+    return {
+        "cv_scores": np.full(n_folds, error_score, dtype=float),
+        "fit_times": np.full(n_folds, timeout / n_folds),
+        "score_times": np.zeros(n_folds),
+        "peak_memory": np.nan,
+        "model_sizes": np.full(n_folds, np.nan) if model_size else None,
+        "timed_out": True,
+    }
+
+
+def as_evaluation(value):
+    """
+    Parameters
+    ----------
+    value: dict or array-like
+        Evaluation of a candidate returned by an executor, a dictionary like the ones of
+        :func:`~sklearn_genetic.utils.cv_scores.evaluation_result`, or only the score of each split
+
+    Returns
+    -------
+        The evaluation as a dictionary, the times and memory are ``None`` if they were not measured
+    """
+    if isinstance(value, dict):
+        return value
+    return {
+        "cv_scores": np.asarray(value, dtype=float),
+        "fit_times": None,
+        "score_times": None,
+        "peak_memory": None,
+        "model_sizes": None,
+        "timed_out": False,
+    }
+
+
+def concatenate_evaluations(evaluations):
+    """
+    Joins the evaluations of a candidate in different groups of cv splits
+
+    Parameters
+    ----------
+    evaluations: list of dict
+        Evaluations returned by :func:`~sklearn_genetic.utils.cv_scores.as_evaluation`
+
+    Returns
+    -------
+        The evaluation of all the splits, the times and memory are ``None``
+        if any of the evaluations didn't measure them, it's ``timed_out``
+        if any of the evaluations timed out
+    """
+    result = {
+        "cv_scores": np.concatenate(
+            [[]] + [evaluation["cv_scores"] for evaluation in evaluations]
+        ).astype(float)
+    }
+    for name in ["fit_times", "score_times", "model_sizes"]:
+        values = [evaluation.get(name) for evaluation in evaluations]
+        measured = all(value is not None for value in values)
+        result[name] = np.concatenate([[]] + values) if measured else None
+    peaks = [evaluation["peak_memory"] for evaluation in evaluations]
+    measured = all(peak is not None for peak in peaks)
+    result["peak_memory"] = highest_peak(peaks) if measured else None
+    result["timed_out"] = any(
+        evaluation.get("timed_out", False) for evaluation in evaluations
+    )
+    return result
+
+
+def cross_validate(
+    estimator,
+    folds,
+    scorer,
+    parameters,
+    error_score=np.nan,
+    warm_start=None,
+    model_size=False,
+):
+    """
+    Fits and scores a candidate in each one of the cv folds
+
+    Parameters
+    ----------
+    estimator: estimator object
+        Unfitted estimator to clone and fit
+    folds: list of :class:`~sklearn_genetic.utils.cv_scores.Fold`
+        The cv folds
+    scorer: callable
+        Scorer with signature ``scorer(estimator, X, y)``
+    parameters: dict
+        Hyperparameters to set in the estimator before fitting it
+    error_score: 'raise' or numeric, default=np.nan
+        Value to assign to the score if an error occurs in estimator fitting.
+    warm_start: :class:`~sklearn_genetic.utils.warm_start.WarmStart`, default=None
+        Settings of the warm-started training, if ``None``, each fold is trained from scratch
+    model_size: bool, default=False
+        If ``True``, the size of the fitted estimator of each split is measured
+
+    Returns
+    -------
+    evaluation: dict
+        Dictionary with the ``cv_scores``, ``fit_times``, ``score_times`` and ``model_sizes``
+        of each split and the ``peak_memory`` of the evaluation
+    """
+    return evaluation_result(
+        [
+            fit_and_score(
+                estimator,
+                fold,
+                scorer,
+                parameters,
+                error_score,
+                warm_start,
+                model_size,
+            )
+            for fold in folds
+        ]
+    )
+
+
+def select_folds(folds, indices=None):
+    """
+    Parameters
+    ----------
+    folds: list of :class:`~sklearn_genetic.utils.cv_scores.Fold`
+        The cv folds
+    indices: list of int, default=None
+        Position of the folds to select, if ``None``, all of them are selected
+
+    Returns
+    -------
+        List with the selected folds
+    """
+    if indices is None:
+        return folds
+    return [folds[n] for n in indices]
+
+
+# Data of the search kept by each worker process of a process pool
+_worker_data = {}
+
+
+def init_worker(
+    estimator, folds, scorer, error_score=np.nan, warm_start=None, model_size=False
+):
+    """
+    Initializer of the worker processes, it keeps the data of the search in the worker
+    so each task only has to send the hyperparameters to evaluate
+
+    Parameters
+    ----------
+    estimator: estimator object
+        Unfitted estimator to clone and fit
+    folds: list of :class:`~sklearn_genetic.utils.cv_scores.Fold`
+        The cv folds
+    scorer: callable
+        Scorer with signature ``scorer(estimator, X, y)``
+    error_score: 'raise' or numeric, default=np.nan
+        Value to assign to the score if an error occurs in estimator fitting.
+    warm_start: :class:`~sklearn_genetic.utils.warm_start.WarmStart`, default=None
+        Settings of the warm-started training
+    model_size: bool, default=False
+        If ``True``, the size of the fitted estimators is measured
+    """
+    _worker_data.update(
+        estimator=estimator,
+        folds=folds,
+        scorer=scorer,
+        error_score=error_score,
+        warm_start=warm_start,
+        model_size=model_size,
+    )
+
+
+def cross_validate_in_worker(parameters, folds=None):
+    """
+    Cross-validates the hyperparameters with the data set by
+    :func:`~sklearn_genetic.utils.cv_scores.init_worker`
+
+    Parameters
+    ----------
+    parameters: dict
+        Hyperparameters to set in the estimator
+    folds: list of int, default=None
+        Position of the folds to use, if ``None``, all of them are used
+
+    Returns
+    -------
+    evaluation: dict
+        Scores, times and peak memory of the evaluation,
+        see :func:`~sklearn_genetic.utils.cv_scores.cross_validate`
+    """
+    return cross_validate(
+        _worker_data["estimator"],
+        select_folds(_worker_data["folds"], folds),
+        _worker_data["scorer"],
+        parameters,
+        _worker_data["error_score"],
+        _worker_data["warm_start"],
+        _worker_data["model_size"],
+    )
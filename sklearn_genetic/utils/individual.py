@@ -0,0 +1,66 @@
+from deap import base
+
+"""
+This module contains the individual and fitness types of the searches. They are defined once
+here, instead of with :mod:`deap.creator`, so the searches don't share (and delete) global state
+and any number of them can run at the same time in a process
+"""
+
+
+class FitnessMax(base.Fitness):
+    """
+    Fitness of an individual with a single score to maximize
+    """
+
+    weights = (1.0,)
+
+
+class Individual(list):
+    """
+    Values of the hyperparameters of a candidate, in the same order as the space
+    parameters, with its fitness
+    """
+
+    fitness_class = FitnessMax
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.fitness = self.fitness_class()
+
+
+class FitnessMulti(base.Fitness):
+    """
+    Fitness with any number of objectives, all of them maximized: the values are stored
+    as they are given, so the objectives to minimize, like the fit time, must be negated
+    """
+
+    weights = ()
+
+    def getValues(self):
+        return self.wvalues
+
+    def setValues(self, values):
+        self.wvalues = tuple(values)
+
+    def delValues(self):
+        self.wvalues = ()
+
+    values = property(getValues, setValues, delValues)
+
+
+class MultiObjectiveIndividual(Individual):
+    """
+    Individual of the multi-objective searches, its fitness has the cv-score
+    followed by the negated cost of each objective
+    """
+
+    fitness_class = FitnessMulti
+
+
+def score_fitness(individual):
+    """
+    Returns
+    -------
+        The first value of the fitness of the individual, the cv-score with the criteria sign
+    """
+    return individual.fitness.values[0]
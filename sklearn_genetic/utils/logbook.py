@@ -1,7 +1,495 @@
-import pandas as pd
+import bz2
+import gzip
+import json
+import lzma
+import numbers
+import os
+
+import numpy as np
+
+from ..space import Categorical
+
+"""
+This module contains the log of the evaluations of a search, it keeps a numpy column per field
+instead of a dictionary per evaluation, so it uses a fraction of the memory and it can be
+exported or analyzed without rebuilding the records
+"""
+
+
+class EvaluationLog:
+    """
+    Columnar log of the evaluated candidates. Each field (hyperparameter, score, cv scores...)
+    is stored in a typed numpy column whose capacity doubles when it's full, so appending a
+    record takes amortized constant time. The categorical hyperparameters are stored as the
+    position of the choice and the fields with a sequence of numbers, like the ``cv_scores``,
+    as a 2D column.
+
+    It's a sequence of records like the chapters of a :class:`deap.tools.Logbook`: each
+    position returns a dictionary with the fields of the record, the ``None`` values are not stored.
+    """
+
+    def __init__(self, space=None, capacity=64):
+        """
+        Parameters
+        ----------
+        space: :class:`~sklearn_genetic.space.Space`, default=None
+            Search space of the hyperparameters, used to store the categorical ones as codes
+        capacity: int, default=64
+            Number of records allocated before the first one is appended
+        """
+        self.space = space
+        self._capacity = capacity
+        self._n_records = 0
+        self._fields = []
+        self._data = {}
+        self._valid = {}
+        self._lengths = {}
+        self.categories = {}
+        # Number of records discarded from the beginning of the log
+        self.offset = 0
+
+    def record(self, **fields):
+        """
+        Appends a record
+
+        Parameters
+        ----------
+        fields: dict
+            Values of the fields of the record
+        """
+        if self._n_records == self._capacity:
+            self._grow(2 * self._capacity)
+
+        row = self._n_records
+        for name, value in fields.items():
+            if name not in self._fields:
+                self._fields.append(name)
+            if value is None:
+                continue
+            if name not in self._data:
+                self._add_column(name, value)
+            self._set(name, row, value)
+
+        self._n_records += 1
+
+    def discard(self, n_records):
+        """
+        Removes the oldest records, for example once they are saved elsewhere,
+        so the memory used by a long search stays bounded
+
+        Parameters
+        ----------
+        n_records: int
+            Number of records to remove from the beginning of the log
+        """
+        n_records = min(n_records, self._n_records)
+        if n_records <= 0:
+            return
+
+        remaining = self._n_records - n_records
+        for columns in [self._data, self._valid, self._lengths]:
+            for column in columns.values():
+                column[:remaining] = column[n_records : self._n_records]
+                if column.dtype == object:
+                    # Release the references of the discarded values
+                    column[remaining : self._n_records] = None
+        self._n_records = remaining
+        self.offset += n_records
+
+    @property
+    def fields(self):
+        """
+        Returns
+        -------
+            Names of the fields, in the order they were first recorded
+        """
+        return list(self._fields)
+
+    def column(self, name):
+        """
+        Parameters
+        ----------
+        name: str
+            Name of the field
+
+        Returns
+        -------
+            A view (not a copy) of the stored column, with a row per record.
+            The categorical fields return the position of the choice in :attr:`categories`,
+            the records without the field are ``nan``, ``-1``, ``False`` or ``None``
+            according to the type of the column
+        """
+        if name not in self._data:
+            if name in self._fields:
+                return np.full(self._n_records, None, dtype=object)
+            raise KeyError(name)
+        return self._data[name][: self._n_records]
+
+    def select(self, *names):
+        """
+        Same as :meth:`deap.tools.Logbook.select`, a list with the values of
+        each field, ``None`` for the records without it
+
+        Parameters
+        ----------
+        names: str
+            Names of the fields
+
+        Returns
+        -------
+            The list of values, or a tuple with a list per name if there are several names
+        """
+        values = [
+            [self._value(name, row) for row in range(self._n_records)] for name in names
+        ]
+        return values[0] if len(names) == 1 else tuple(values)
+
+    def to_pandas(self):
+        """
+        Returns
+        -------
+            A :class:`pandas.DataFrame` with a column per field, built from the stored columns.
+            The categorical fields are :class:`pandas.Categorical` and each position of
+            a sequence field is a column named ``<field>_<position>``
+        """
+        import pandas as pd
+
+        columns = {}
+        for name in self._fields:
+            for column_name, values in self._export_columns(name):
+                if name in self.categories:
+                    values = self._pandas_categorical(pd, name, values)
+                columns[column_name] = values
+        return pd.DataFrame(columns, index=pd.RangeIndex(self._n_records))
+
+    def to_arrow(self):
+        """
+        Returns
+        -------
+            A :class:`pyarrow.Table` with a column per field, the numeric columns share
+            the memory of the stored ones. The categorical fields are dictionary arrays and
+            the sequence fields fixed size list arrays
+        """
+        import pyarrow as pa
+
+        arrays = {}
+        for name in self._fields:
+            if name not in self._data:
+                arrays[name] = pa.nulls(self._n_records)
+                continue
+
+            values = self.column(name)
+            mask = ~self._valid[name][: self._n_records]
+            mask = mask if mask.any() else None
+            if name in self.categories:
+                arrays[name] = pa.DictionaryArray.from_arrays(
+                    pa.array(values, mask=mask),
+                    pa.array([str(choice) for choice in self.categories[name]]),
+                )
+            elif values.ndim == 2:
+                arrays[name] = pa.FixedSizeListArray.from_arrays(
+                    pa.array(values.ravel()), values.shape[1]
+                )
+            else:
+                arrays[name] = pa.array(values, mask=mask)
+        return pa.table(arrays)
+
+    def _export_columns(self, name):
+        if name not in self._data:
+            yield name, self.column(name)
+            return
+
+        values = self.column(name)
+        valid = self._valid[name][: self._n_records]
+        if values.ndim == 2:
+            for position in range(values.shape[1]):
+                yield f"{name}_{position}", values[:, position]
+        elif valid.all() or name in self.categories:
+            yield name, values
+        elif values.dtype.kind in "iub":
+            yield name, np.where(valid, values, np.nan)
+        else:
+            yield name, values
+
+    def _pandas_categorical(self, pd, name, codes):
+        try:
+            return pd.Categorical.from_codes(codes, categories=self.categories[name])
+        except (TypeError, ValueError):
+            # The choices are not hashable or unique, like lists
+            return self.select(name)
+
+    def _add_column(self, name, value):
+        dimension = None
+        if self.space is not None and name in self.space.parameters:
+            dimension = self.space[name]
+
+        if isinstance(dimension, Categorical):
+            self.categories[name] = dimension.choices
+            self._data[name] = np.full(self._capacity, -1, dtype=np.int32)
+        elif isinstance(value, (bool, np.bool_)):
+            self._data[name] = np.zeros(self._capacity, dtype=bool)
+        elif isinstance(value, numbers.Integral):
+            self._data[name] = np.zeros(self._capacity, dtype=np.int64)
+        elif isinstance(value, numbers.Real):
+            self._data[name] = np.full(self._capacity, np.nan)
+        elif _is_numeric_sequence(value):
+            self._data[name] = np.full((self._capacity, len(value)), np.nan)
+            self._lengths[name] = np.zeros(self._capacity, dtype=np.int32)
+        else:
+            self._data[name] = np.full(self._capacity, None, dtype=object)
+        self._valid[name] = np.zeros(self._capacity, dtype=bool)
+
+    def _set(self, name, row, value):
+        column = self._data[name]
+
+        if name in self.categories:
+            try:
+                column[row] = self.categories[name].index(value)
+            except ValueError:
+                # A value out of the choices, the codes are replaced by the values
+                self._to_object(name)
+                self._data[name][row] = value
+        elif name in self._lengths:
+            if not _is_numeric_sequence(value):
+                self._to_object(name)
+                self._data[name][row] = value
+            else:
+                if len(value) > column.shape[1]:
+                    self._data[name] = column = _resize(
+                        column, (len(column), len(value)), np.nan
+                    )
+                column[row] = np.nan
+                column[row, : len(value)] = value
+                self._lengths[name][row] = len(value)
+        elif column.dtype == object:
+            column[row] = value
+        elif column.dtype == bool and isinstance(value, (bool, np.bool_)):
+            column[row] = value
+        elif column.dtype.kind == "i" and isinstance(value, numbers.Integral):
+            column[row] = value
+        elif column.dtype.kind in "if" and isinstance(value, numbers.Real):
+            if column.dtype.kind == "i":
+                # A float in a column of integers
+                self._data[name] = column = self._to_float(name)
+            column[row] = value
+        else:
+            self._to_object(name)
+            self._data[name][row] = value
+
+        self._valid[name][row] = True
+
+    def _value(self, name, row):
+        if name not in self._data or not self._valid[name][row]:
+            return None
+        value = self._data[name][row]
+        if name in self.categories:
+            return self.categories[name][value]
+        if name in self._lengths:
+            return value[: self._lengths[name][row]].tolist()
+        return value.item() if isinstance(value, np.generic) else value
+
+    def _to_float(self, name):
+        column = self._data[name].astype(float)
+        column[~self._valid[name]] = np.nan
+        return column
+
+    def _to_object(self, name):
+        values = np.full(self._capacity, None, dtype=object)
+        for row in np.flatnonzero(self._valid[name]):
+            values[row] = self._value(name, row)
+        self._data[name] = values
+        self.categories.pop(name, None)
+        self._lengths.pop(name, None)
+
+    def _grow(self, capacity):
+        for name, column in self._data.items():
+            fill = (
+                -1
+                if name in self.categories
+                else (
+                    None
+                    if column.dtype == object
+                    else np.nan if column.dtype.kind == "f" else 0
+                )
+            )
+            self._data[name] = _resize(column, (capacity, *column.shape[1:]), fill)
+            self._valid[name] = _resize(self._valid[name], (capacity,), False)
+            if name in self._lengths:
+                self._lengths[name] = _resize(self._lengths[name], (capacity,), 0)
+        self._capacity = capacity
+
+    def __len__(self):
+        return self._n_records
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(self._n_records))]
+
+        if index < 0:
+            index += self._n_records
+        if not 0 <= index < self._n_records:
+            raise IndexError("record index out of range")
+        return {
+            name: self._value(name, index)
+            for name in self._fields
+            if name in self._data and self._valid[name][index]
+        }
+
+    def __iter__(self):
+        for row in range(self._n_records):
+            yield self[row]
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(
+                record == other_record for record, other_record in zip(self, other)
+            )
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __txt__(self, startindex):
+        """Lines of the table printed by :class:`deap.tools.Logbook`"""
+        fields = [name for name in self._fields if name in self._data]
+        rows = [
+            [
+                "" if value is None else str(value)
+                for value in (self._value(name, row) for name in fields)
+            ]
+            for row in range(startindex, self._n_records)
+        ]
+        if startindex == 0:
+            rows.insert(0, fields)
+        widths = [
+            max([len(row[position]) for row in rows] or [0])
+            for position in range(len(fields))
+        ]
+        return [
+            "\t".join(value.ljust(width) for value, width in zip(row, widths))
+            for row in rows
+        ]
+
+    def __str__(self):
+        return "\n".join(self.__txt__(0))
+
+    def __getstate__(self):
+        # Only the used rows are stored
+        state = self.__dict__.copy()
+        state["_capacity"] = max(self._n_records, 1)
+        for attribute in ["_data", "_valid", "_lengths"]:
+            state[attribute] = {
+                name: column[: state["_capacity"]].copy()
+                for name, column in getattr(self, attribute).items()
+            }
+        return state
+
+
+def _is_numeric_sequence(value):
+    return (
+        isinstance(value, (list, tuple, np.ndarray))
+        and np.ndim(value) == 1
+        and all(
+            isinstance(item, numbers.Real) and not isinstance(item, (bool, np.bool_))
+            for item in value
+        )
+    )
+
+
+def _resize(array, shape, fill):
+    resized = np.full(shape, fill, dtype=array.dtype)
+    resized[tuple(slice(0, size) for size in array.shape)] = array
+    return resized
+
+
+def read_logbook(path, space=None):
+    """
+    Reads the evaluations written by :class:`~sklearn_genetic.callbacks.LogbookStreamer`
+
+    Parameters
+    ----------
+    path: str
+        The JSON lines file, optionally compressed with gzip, bz2 or xz,
+        or the folder with the Parquet files
+    space: :class:`~sklearn_genetic.space.Space`, default=None
+        Search space of the hyperparameters, used to store the categorical ones as codes
+
+    Returns
+    -------
+        A :class:`deap.tools.Logbook` whose ``parameters`` chapter is an
+        :class:`EvaluationLog` with all the evaluations, like the ``logbook`` of
+        :class:`~sklearn_genetic.GASearchCV`
+    """
+    from deap.tools import Logbook
+
+    log = EvaluationLog(space)
+    if os.path.isdir(path):
+        import pyarrow.parquet as pq
+
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".parquet"):
+                for record in pq.read_table(os.path.join(path, name)).to_pylist():
+                    log.record(**record)
+    else:
+        with open_log_file(path, "rt") as file:
+            for line in file:
+                if line.strip():
+                    log.record(**json.loads(line))
+
+    logbook = Logbook()
+    logbook.header = ["parameters"]
+    logbook.chapters["parameters"] = log
+    return logbook
+
+
+def open_log_file(path, mode, compression=None):
+    """
+    Opens a text file, compressed according to ``compression`` or,
+    if it's ``None``, to the extension of the path
+
+    Parameters
+    ----------
+    path: str
+        Path of the file
+    mode: str
+        Mode of :func:`open`, in text mode
+    compression: {"gzip", "bz2", "xz"}, default=None
+        Compression of the file
+
+    Returns
+    -------
+        The file object
+    """
+    if compression is None:
+        extensions = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+        compression = extensions.get(os.path.splitext(path)[1])
+
+    if compression == "gzip":
+        return gzip.open(path, mode)
+    if compression == "bz2":
+        return bz2.open(path, mode)
+    if compression == "xz":
+        return lzma.open(path, mode)
+    return open(path, mode)
 
 
 def logbook_to_pandas(logbook):
+    """
+    Parameters
+    ----------
+    logbook: :class:`deap.tools.Logbook`
+        The ``logbook`` of a fitted :class:`~sklearn_genetic.GASearchCV`
+
+    Returns
+    -------
+        A :class:`pandas.DataFrame` with a row per evaluated set of hyperparameters
+    """
     data = logbook.chapters["parameters"]
+    if isinstance(data, EvaluationLog):
+        return data.to_pandas()
+
+    # pandas is only needed here, it's not imported with the rest of the package
+    import pandas as pd
+
     df = pd.DataFrame(data)
     return df
@@ -0,0 +1,393 @@
+import numpy as np
+
+from ..space import Categorical, Integer
+
+"""
+This module contains the array representation of a population and the genetic operators
+that breed it, each operator works over all the individuals with a few vectorized calls
+"""
+
+
+class ArrayPopulation:
+    """
+    Population stored as a numeric matrix with one row per individual and one column per
+    hyperparameter, the categorical values are stored as the position of the choice.
+    The fitness is kept in a parallel array, with ``nan`` for the individuals not evaluated yet
+    and a column per value when the fitness has several objectives.
+
+    The generational algorithms keep it through the whole evolution when the toolbox has the
+    vectorized operators, so ``population + other`` concatenates two populations and
+    ``population[:] = other`` replaces all the individuals, as they do with lists.
+    """
+
+    def __init__(self, space, genes, fitness=None, individual_class=None):
+        """
+        Parameters
+        ----------
+        space: :class:`~sklearn_genetic.space.Space`
+            Search space of the hyperparameters
+        genes: array of shape (n_individuals, n_hyperparameters)
+            Numeric values of the hyperparameters
+        fitness: array of shape (n_individuals,) or (n_individuals, n_objectives), default=None
+            Fitness of each individual, if ``None``, none of them is evaluated
+        individual_class: type, default=None
+            Class of the individuals built by :meth:`to_individuals`
+        """
+        self.space = space
+        self.genes = np.asarray(genes, dtype=float)
+        self.fitness = (
+            np.full(len(self.genes), np.nan)
+            if fitness is None
+            else np.asarray(fitness, dtype=float)
+        )
+        self.individual_class = individual_class
+
+    @classmethod
+    def from_individuals(cls, space, individuals, individual_class=None):
+        """
+        Parameters
+        ----------
+        space: :class:`~sklearn_genetic.space.Space`
+            Search space of the hyperparameters
+        individuals: list of Individual objects
+            Lists with one value per hyperparameter and a ``fitness`` attribute
+        individual_class: type, default=None
+            Class of the individuals built by :meth:`to_individuals`,
+            if ``None``, the class of the given individuals
+
+        Returns
+        -------
+            The :class:`ArrayPopulation` with the same values and fitness
+        """
+        if individual_class is None and individuals:
+            individual_class = type(individuals[0])
+
+        genes = np.empty((len(individuals), space.dimensions))
+        for gen, parameter in enumerate(space.parameters):
+            dimension = space[parameter]
+            values = [individual[gen] for individual in individuals]
+            if isinstance(dimension, Categorical):
+                values = [dimension.choices.index(value) for value in values]
+            genes[:, gen] = values
+
+        n_values = max(
+            (len(ind.fitness.values) for ind in individuals if ind.fitness.valid),
+            default=1,
+        )
+        fitness = np.full((len(individuals), n_values), np.nan)
+        for row, individual in enumerate(individuals):
+            if individual.fitness.valid:
+                fitness[row] = individual.fitness.values
+        return cls(
+            space, genes, fitness[:, 0] if n_values == 1 else fitness, individual_class
+        )
+
+    def values(self):
+        """
+        Returns
+        -------
+            List with the hyperparameters values of each individual,
+            in the same order as the space parameters
+        """
+        columns = []
+        for gen, parameter in enumerate(self.space.parameters):
+            dimension = self.space[parameter]
+            column = self.genes[:, gen]
+            if isinstance(dimension, Categorical):
+                columns.append(
+                    [dimension.choices[code] for code in column.astype(int).tolist()]
+                )
+            elif isinstance(dimension, Integer):
+                columns.append(column.astype(int).tolist())
+            else:
+                columns.append(column.tolist())
+        return [list(values) for values in zip(*columns)]
+
+    def to_individuals(self, individual_class=None):
+        """
+        Parameters
+        ----------
+        individual_class: type, default=None
+            Class of the individuals, like :class:`~sklearn_genetic.utils.individual.Individual`,
+            if ``None``, the ``individual_class`` of the population
+
+        Returns
+        -------
+            List with an individual per row, the evaluated ones keep its fitness
+        """
+        individual_class = individual_class or self.individual_class
+        individuals = []
+        for values, fitness in zip(self.values(), self.fitness):
+            individual = individual_class(values)
+            fitness = np.atleast_1d(fitness)
+            if not np.isnan(fitness).any():
+                individual.fitness.values = tuple(fitness.tolist())
+            individuals.append(individual)
+        return individuals
+
+    def to_parameters(self):
+        """
+        Returns
+        -------
+            List with the dictionary of hyperparameters of each individual
+        """
+        parameters = self.space.parameters
+        return [dict(zip(parameters, values)) for values in self.values()]
+
+    def take(self, rows):
+        """
+        Parameters
+        ----------
+        rows: array
+            Positions of the individuals, they can be repeated
+
+        Returns
+        -------
+            A new :class:`ArrayPopulation` with a copy of the individuals in those positions
+        """
+        rows = np.asarray(rows, dtype=int)
+        return ArrayPopulation(
+            self.space, self.genes[rows], self.fitness[rows], self.individual_class
+        )
+
+    def evaluated(self):
+        """
+        Returns
+        -------
+            Boolean array, ``True`` for the individuals with a valid fitness
+        """
+        if self.fitness.ndim == 1:
+            return ~np.isnan(self.fitness)
+        return ~np.isnan(self.fitness).any(axis=1)
+
+    def scores(self):
+        """
+        Returns
+        -------
+            Array with the first value of the fitness of each individual,
+            the cv-score with the criteria sign
+        """
+        if self.fitness.ndim == 1:
+            return self.fitness
+        return self.fitness[:, 0]
+
+    def set_fitness(self, rows, fitnesses):
+        """
+        Parameters
+        ----------
+        rows: array
+            Positions of the evaluated individuals
+        fitnesses: list of tuple
+            Fitness values of each individual, ``None`` keeps it not evaluated
+        """
+        evaluated = [
+            (row, values) for row, values in zip(rows, fitnesses) if values is not None
+        ]
+        if not evaluated:
+            return
+
+        rows, values = zip(*evaluated)
+        values = np.array(values, dtype=float)
+        if self.fitness.ndim == 1 and values.shape[1] > 1:
+            # The population wasn't evaluated yet, the fitness gets a column per objective
+            fitness = np.full((len(self), values.shape[1]), np.nan)
+            fitness[:, 0] = self.fitness
+            self.fitness = fitness
+        self.fitness[list(rows)] = values if self.fitness.ndim > 1 else values[:, 0]
+
+    def __add__(self, other):
+        return ArrayPopulation(
+            self.space,
+            np.concatenate([self.genes, other.genes]),
+            np.concatenate([self.fitness, other.fitness]),
+            self.individual_class,
+        )
+
+    def __setitem__(self, key, other):
+        if key != slice(None):
+            raise TypeError(
+                "Only all the individuals of the population can be replaced"
+            )
+        self.genes, self.fitness = other.genes, other.fitness
+
+    def __len__(self):
+        return len(self.genes)
+
+
+def sel_tournament(fitness, k, tournsize):
+    """
+    Selects the best of ``tournsize`` randomly chosen individuals, ``k`` times
+
+    Parameters
+    ----------
+    fitness: array of shape (n_individuals,)
+        Fitness of the individuals
+    k: int
+        Number of individuals to select
+    tournsize: int
+        Number of individuals participating in each tournament
+
+    Returns
+    -------
+        Array with the positions of the selected individuals
+    """
+    aspirants = np.random.randint(len(fitness), size=(k, tournsize))
+    winners = np.argmax(fitness[aspirants], axis=1)
+    return aspirants[np.arange(k), winners]
+
+
+def sel_roulette(fitness, k):
+    """
+    Selects ``k`` individuals with a probability proportional to its fitness
+
+    Parameters
+    ----------
+    fitness: array of shape (n_individuals,)
+        Fitness of the individuals, it must be non negative
+    k: int
+        Number of individuals to select
+
+    Returns
+    -------
+        Array with the positions of the selected individuals
+    """
+    cumulative = np.cumsum(fitness)
+    spins = np.random.random_sample(k) * cumulative[-1]
+    positions = np.searchsorted(cumulative, spins, side="right")
+    return np.minimum(positions, len(fitness) - 1)
+
+
+def two_point_masks(n, size):
+    """
+    Draws the crossover points of ``n`` two point crossovers, like :func:`deap.tools.cxTwoPoint`
+
+    Parameters
+    ----------
+    n: int
+        Number of crossovers
+    size: int
+        Number of hyperparameters of the individuals
+
+    Returns
+    -------
+        Boolean array of shape (n, size), ``True`` in the genes that are swapped
+    """
+    if size < 2:
+        return np.zeros((n, size), dtype=bool)
+
+    first = np.random.randint(1, size + 1, size=n)
+    second = np.random.randint(1, size, size=n)
+    second = np.where(second >= first, second + 1, second)
+    lower, upper = np.minimum(first, second), np.maximum(first, second)
+    genes = np.arange(size)
+    return (genes >= lower[:, None]) & (genes < upper[:, None])
+
+
+def mutate(population, rows):
+    """
+    Changes a randomly selected hyperparameter of some individuals by a new sample
+    of its distribution, the samples of each hyperparameter are drawn at once
+
+    Parameters
+    ----------
+    population: :class:`ArrayPopulation`
+        The population, it's modified in place
+    rows: array
+        Positions of the individuals to mutate
+    """
+    rows = np.asarray(rows, dtype=int)
+    genes = np.random.randint(population.space.dimensions, size=len(rows))
+    for gen, parameter in enumerate(population.space.parameters):
+        dimension = population.space[parameter]
+        selected = rows[genes == gen]
+        if not len(selected):
+            continue
+        if isinstance(dimension, Categorical):
+            population.genes[selected, gen] = dimension._sample_indices(len(selected))
+        else:
+            population.genes[selected, gen] = dimension.sample(size=len(selected))
+    population.fitness[rows] = np.nan
+
+
+def var_and(population, cxpb, mutpb):
+    """
+    Vectorized version of :func:`deap.algorithms.varAnd`, the consecutive individuals
+    are mated with probability ``cxpb`` and then each one is mutated with probability ``mutpb``
+
+    Parameters
+    ----------
+    population: :class:`ArrayPopulation`
+        The selected individuals, it's not modified
+    cxpb: float
+        The probability of mating two individuals
+    mutpb: float
+        The probability of mutating an individual
+
+    Returns
+    -------
+        The offspring as a new :class:`ArrayPopulation`
+    """
+    offspring = population.take(np.arange(len(population)))
+    n, size = offspring.genes.shape
+
+    pairs = np.flatnonzero(np.random.random_sample(n // 2) < cxpb)
+    first, second = 2 * pairs, 2 * pairs + 1
+    masks = two_point_masks(len(pairs), size)
+    first_genes, second_genes = offspring.genes[first], offspring.genes[second]
+    offspring.genes[first] = np.where(masks, second_genes, first_genes)
+    offspring.genes[second] = np.where(masks, first_genes, second_genes)
+    offspring.fitness[first] = np.nan
+    offspring.fitness[second] = np.nan
+
+    mutate(offspring, np.flatnonzero(np.random.random_sample(n) < mutpb))
+    return offspring
+
+
+def var_or(population, lambda_, cxpb, mutpb):
+    """
+    Vectorized version of :func:`deap.algorithms.varOr`, each offspring is either the crossover
+    of two random individuals, a mutation of one, or a copy of one
+
+    Parameters
+    ----------
+    population: :class:`ArrayPopulation`
+        The parents, it's not modified
+    lambda_: int
+        The number of children to produce
+    cxpb: float
+        The probability of mating two individuals
+    mutpb: float
+        The probability of mutating an individual
+
+    Returns
+    -------
+        The offspring as a new :class:`ArrayPopulation`
+    """
+    if cxpb + mutpb > 1.0:
+        raise ValueError(
+            "The sum of the crossover and mutation probabilities must be smaller "
+            "or equal to 1.0."
+        )
+
+    n, size = population.genes.shape
+    operations = np.random.random_sample(lambda_)
+    parents = np.random.randint(n, size=lambda_)
+    offspring = population.take(parents)
+
+    # The first child of the crossover with a different individual
+    crossed = np.flatnonzero(operations < cxpb)
+    if n > 1:
+        mates = (parents[crossed] + np.random.randint(1, n, size=len(crossed))) % n
+    else:
+        mates = parents[crossed]
+    masks = two_point_masks(len(crossed), size)
+    offspring.genes[crossed] = np.where(
+        masks, population.genes[mates], offspring.genes[crossed]
+    )
+    offspring.fitness[crossed] = np.nan
+
+    mutate(
+        offspring,
+        np.flatnonzero((operations >= cxpb) & (operations < cxpb + mutpb)),
+    )
+    return offspring
@@ -0,0 +1,101 @@
+import mmap
+import os
+
+import numpy as np
+
+"""
+This module contains the functions used to share the data of a fit with the worker processes
+through memory-mapped files, so each worker attaches to the same data instead of receiving a copy
+"""
+
+
+def to_memmap(data, folder, name):
+    """
+    Dumps a numpy array into a file and opens it as a read-only memory map
+
+    Parameters
+    ----------
+    data: array-like
+        The data to share
+    folder: str
+        Folder of the memory-mapped files
+    name: str
+        Name of the file, without extension
+
+    Returns
+    -------
+        A read-only :class:`numpy.memmap` with the data if it's a numpy array
+        without python objects, otherwise the data is returned as it is
+    """
+    if not isinstance(data, np.ndarray) or data.dtype.hasobject:
+        return data
+
+    path = os.path.join(folder, f"{name}.npy")
+    np.save(path, data, allow_pickle=False)
+    return np.load(path, mmap_mode="r")
+
+
+def is_file_backed(data):
+    """
+    Parameters
+    ----------
+    data: object
+
+    Returns
+    -------
+        ``True`` if the data is a memory map of a whole file, which can be pickled by reference
+    """
+    return (
+        isinstance(data, np.memmap)
+        and data.filename is not None
+        and isinstance(data.base, mmap.mmap)
+    )
+
+
+class MemmapReference:
+    """
+    Picklable reference to a memory-mapped file, used to send the memory maps
+    to other processes without copying its data
+    """
+
+    def __init__(self, data):
+        """
+        Parameters
+        ----------
+        data: :class:`numpy.memmap`
+            Memory map of a whole file
+        """
+        self.filename = data.filename
+        self.dtype = data.dtype
+        self.shape = data.shape
+        self.offset = data.offset
+        self.order = "F" if data.flags.f_contiguous and data.ndim > 1 else "C"
+
+    def open(self):
+        """
+        Returns
+        -------
+            A read-only :class:`numpy.memmap` attached to the referenced file
+        """
+        return np.memmap(
+            self.filename,
+            dtype=self.dtype,
+            mode="r",
+            offset=self.offset,
+            shape=self.shape,
+            order=self.order,
+        )
+
+
+def pack(data):
+    """
+    Replaces the memory maps of whole files by a reference before pickling them
+    """
+    return MemmapReference(data) if is_file_backed(data) else data
+
+
+def unpack(data):
+    """
+    Attaches the unpickled references to their memory-mapped files
+    """
+    return data.open() if isinstance(data, MemmapReference) else data
@@ -0,0 +1,38 @@
+import time
+
+from ..budget import Budget
+
+
+def test_budget_evaluations():
+    budget = Budget(max_evaluations=2)
+    assert budget.remaining_time() is None
+    assert budget.remaining_evaluations() == 2
+    assert not budget.exhausted()
+
+    budget.add_evaluation()
+    assert budget.remaining_evaluations() == 1
+    assert not budget.exhausted()
+
+    budget.add_evaluation()
+    assert budget.remaining_evaluations() == 0
+    assert budget.exhausted()
+
+
+def test_budget_time():
+    budget = Budget(max_time=0.1)
+    assert budget.remaining_evaluations() is None
+    assert 0 < budget.remaining_time() <= 0.1
+    assert not budget.exhausted()
+
+    time.sleep(0.15)
+    assert budget.remaining_time() == 0
+    assert budget.exhausted()
+
+
+def test_budget_interrupt():
+    budget = Budget()
+    assert not budget.exhausted()
+
+    budget.interrupt()
+    assert budget.interrupted
+    assert budget.exhausted()
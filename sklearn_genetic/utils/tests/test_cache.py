@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+
+from ..cache import FitnessCache, genome_key
+
+
+def test_genome_key():
+    assert genome_key({"a": 1, "b": "gini"}) == genome_key({"b": "gini", "a": 1})
+    assert genome_key({"a": np.int64(1)}) == genome_key({"a": 1})
+    assert genome_key({"a": 1}) != genome_key({"a": 2})
+
+    # Unhashable values fall back to a joblib hash
+    assert isinstance(genome_key({"a": [1, 2]}), str)
+    assert genome_key({"a": [1, 2]}) == genome_key({"a": [1, 2]})
+
+
+def test_fitness_cache_lookup():
+    cache = FitnessCache(max_size=10)
+    candidates = [{"a": 1}, {"a": 2}, {"a": 1}]
+
+    keys, scores, pending = cache.lookup(candidates)
+    assert scores == {}
+    assert list(pending.values()) == [{"a": 1}, {"a": 2}]
+    assert cache.misses == 2
+    assert cache.hits == 1
+
+    for key in pending:
+        cache.put(key, 0.5)
+
+    keys, scores, pending = cache.lookup(candidates)
+    assert pending == {}
+    assert [scores[key] for key in keys] == [0.5, 0.5, 0.5]
+    assert cache.hits == 4
+    assert len(cache) == 2
+
+
+def test_fitness_cache_lru():
+    cache = FitnessCache(max_size=2)
+    cache.put(genome_key({"a": 1}), 0.1)
+    cache.put(genome_key({"a": 2}), 0.2)
+
+    # Using {"a": 1} makes {"a": 2} the least recently used
+    cache.lookup([{"a": 1}])
+    cache.put(genome_key({"a": 3}), 0.3)
+
+    keys, scores, pending = cache.lookup([{"a": 1}, {"a": 2}, {"a": 3}])
+    assert len(cache) == 2
+    assert list(pending.values()) == [{"a": 2}]
+
+
+@pytest.mark.parametrize("max_size", [0, -1, 2.5, "10"])
+def test_wrong_cache_size(max_size):
+    with pytest.raises(Exception) as excinfo:
+        FitnessCache(max_size)
+    assert (
+        str(excinfo.value)
+        == f"cache_size must be a positive integer or None, got {max_size} instead"
+    )
@@ -0,0 +1,71 @@
+import numpy as np
+
+from ..cv_results import CVResults
+
+
+def get_results(n_records=10):
+    results = CVResults(["max_depth", "criterion"], n_splits=3, capacity=2)
+    for n in range(n_records):
+        cv_scores = np.array([n, n + 1, n + 2]) / 10
+        results.add(
+            {"max_depth": n + 2, "criterion": ["gini", "entropy"][n % 2]},
+            np.mean(cv_scores),
+            cv_scores=cv_scores,
+            fit_times=[0.1, 0.2, 0.3],
+            score_times=[0.01, 0.01, 0.01],
+        )
+    return results
+
+
+def test_cv_results():
+    results = get_results()
+    cv_results = results.to_dict()
+
+    assert len(results) == 10
+    assert list(cv_results) == [
+        "mean_fit_time",
+        "std_fit_time",
+        "mean_score_time",
+        "std_score_time",
+        "param_max_depth",
+        "param_criterion",
+        "params",
+        "split0_test_score",
+        "split1_test_score",
+        "split2_test_score",
+        "mean_test_score",
+        "std_test_score",
+        "rank_test_score",
+    ]
+    assert all(len(column) == 10 for column in cv_results.values())
+    assert cv_results["params"][1] == {"max_depth": 3, "criterion": "entropy"}
+    assert cv_results["param_max_depth"].tolist() == list(range(2, 12))
+    assert cv_results["split2_test_score"][0] == 0.2
+    assert np.allclose(cv_results["mean_test_score"], np.arange(1, 11) / 10)
+    assert np.allclose(cv_results["mean_fit_time"], 0.2)
+    assert cv_results["rank_test_score"].dtype == np.int32
+    assert cv_results["rank_test_score"].tolist() == list(range(10, 0, -1))
+    assert results.best_index() == 9
+
+    # With minimization the lowest score is the best
+    assert results.to_dict(criteria_sign=-1)["rank_test_score"][0] == 1
+    assert results.best_index(criteria_sign=-1) == 0
+
+
+def test_cv_results_incomplete():
+    results = get_results(2)
+    # Raced evaluation, without times and with a missing hyperparameter
+    results.add({"max_depth": 5}, 0.9)
+    results.add({"max_depth": 6, "criterion": "gini"}, np.nan)
+    cv_results = results.to_dict()
+
+    assert np.isnan(cv_results["split0_test_score"][2])
+    assert np.isnan(cv_results["std_test_score"][2])
+    assert np.isnan(cv_results["mean_fit_time"][2])
+    assert cv_results["mean_test_score"][2] == 0.9
+    assert cv_results["param_criterion"].mask.tolist() == [False, False, True, False]
+    # The nan scores are ranked last
+    assert cv_results["rank_test_score"].tolist() == [3, 2, 1, 4]
+    assert results.best_index() == 2
+
+    assert CVResults(["max_depth"], n_splits=3).best_index() is None
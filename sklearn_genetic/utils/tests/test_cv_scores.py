@@ -0,0 +1,177 @@
+import tracemalloc
+
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.datasets import load_digits
+from sklearn.metrics import check_scoring
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.exceptions import FitFailedWarning
+
+from ..cv_scores import (
+    Fold,
+    as_evaluation,
+    concatenate_evaluations,
+    cross_validate,
+    fit_and_score,
+    memory_usage,
+    peak_memory,
+    timeout_evaluation,
+)
+
+data = load_digits()
+y = data["target"]
+X = data["data"]
+sample_weight = np.linspace(0.5, 1.5, len(y))
+
+train = np.arange(0, len(y), 2)
+test = np.arange(1, len(y), 2)
+
+
+@pytest.mark.parametrize("data", [X, pd.DataFrame(X)])
+def test_fold_materialize(data):
+    estimator = DecisionTreeClassifier()
+    fold = Fold(data, y, train, test, {"sample_weight": sample_weight, "check": True})
+    X_train, y_train, X_test, y_test, fit_params = fold.get(estimator)
+
+    assert len(X_train) == len(train)
+    assert len(X_test) == len(test)
+    assert np.array_equal(fit_params["sample_weight"], sample_weight[train])
+    assert fit_params["check"] is True
+
+    fold.materialize(estimator)
+    assert fold.materialized
+    assert fold.X is None
+
+    partitions = fold.get(estimator)
+    assert np.array_equal(np.asarray(partitions[0]), np.asarray(X_train))
+    assert np.array_equal(partitions[3], y_test)
+    assert np.array_equal(partitions[4]["sample_weight"], sample_weight[train])
+    if isinstance(data, np.ndarray):
+        assert partitions[0].flags["C_CONTIGUOUS"]
+
+
+def test_fit_and_score():
+    estimator = DecisionTreeClassifier(random_state=0)
+    scorer = check_scoring(estimator, scoring="accuracy")
+    fold = Fold(X, y, train, test)
+
+    result = fit_and_score(estimator, fold, scorer, {"max_depth": 4})
+    expected = DecisionTreeClassifier(random_state=0, max_depth=4).fit(
+        X[train], y[train]
+    )
+    assert result["score"] == expected.score(X[test], y[test])
+    assert result["fit_time"] >= 0
+    assert result["score_time"] >= 0
+    assert np.isnan(result["peak_memory"]) or result["peak_memory"] > 0
+    assert result["model_size"] is None
+
+    result = fit_and_score(estimator, fold, scorer, {"max_depth": 4}, model_size=True)
+    assert result["model_size"] > 0
+
+    with pytest.warns(FitFailedWarning):
+        result = fit_and_score(estimator, fold, scorer, {"max_depth": -1})
+    assert np.isnan(result["score"])
+
+    with pytest.raises(ValueError):
+        fit_and_score(estimator, fold, scorer, {"max_depth": -1}, error_score="raise")
+
+    with pytest.raises(Exception) as excinfo:
+        fit_and_score(estimator, fold, scorer, {}, error_score="ignore")
+    assert str(excinfo.value).startswith(
+        "error_score must be the string 'raise' or a numeric value."
+    )
+
+
+@pytest.mark.parametrize("materialize", [False, True])
+def test_fold_subsample(materialize):
+    estimator = DecisionTreeClassifier()
+    fold = Fold(X, y, train, test, {"sample_weight": sample_weight})
+    if materialize:
+        fold.materialize(estimator)
+
+    subsample = fold.subsample(100, stratify=y, random_state=0)
+    X_train, y_train, X_test, y_test, fit_params = subsample.get(estimator)
+
+    assert len(subsample.train) == 100
+    assert set(subsample.train) <= set(train)
+    assert np.array_equal(subsample.test, test)
+    assert len(X_train) == len(y_train) == len(fit_params["sample_weight"]) == 100
+    assert np.array_equal(y_train, y[subsample.train])
+    assert np.array_equal(fit_params["sample_weight"], sample_weight[subsample.train])
+    assert len(X_test) == len(test)
+
+    # All the classes are represented in the stratified subsample
+    assert set(y_train) == set(y)
+
+    # Falls back to a random subsample if there are not enough samples per class
+    subsample = fold.subsample(5, stratify=y, random_state=0)
+    assert len(subsample.train) == 5
+
+
+def test_peak_memory():
+    # The peak resident set size didn't rise
+    assert memory_usage() > 0
+    assert np.isnan(peak_memory(memory_usage()))
+
+    tracemalloc.start()
+    try:
+        start = memory_usage()
+        buffer = bytearray(10**7)
+        del buffer
+        assert peak_memory(start) >= 10**7
+
+        estimator = DecisionTreeClassifier(random_state=0)
+        scorer = check_scoring(estimator, scoring="accuracy")
+        result = fit_and_score(estimator, Fold(X, y, train, test), scorer, {})
+        assert result["peak_memory"] > 0
+    finally:
+        tracemalloc.stop()
+
+
+def test_cross_validate_evaluation():
+    estimator = DecisionTreeClassifier(random_state=0)
+    scorer = check_scoring(estimator, scoring="accuracy")
+    folds = [Fold(X, y, train, test), Fold(X, y, test, train)]
+
+    evaluation = cross_validate(estimator, folds, scorer, {"max_depth": 4})
+    assert len(evaluation["cv_scores"]) == 2
+    assert (
+        evaluation["cv_scores"][0]
+        == fit_and_score(estimator, folds[0], scorer, {"max_depth": 4})["score"]
+    )
+    assert len(evaluation["fit_times"]) == len(evaluation["score_times"]) == 2
+    assert np.all(evaluation["fit_times"] >= 0)
+    assert np.isnan(evaluation["peak_memory"]) or evaluation["peak_memory"] > 0
+
+    joined = concatenate_evaluations([evaluation, evaluation])
+    assert np.array_equal(joined["cv_scores"], np.tile(evaluation["cv_scores"], 2))
+    assert len(joined["fit_times"]) == 4
+    assert joined["peak_memory"] == evaluation["peak_memory"] or np.isnan(
+        joined["peak_memory"]
+    )
+
+    # An executor that only returns the scores doesn't measure the times
+    scores = as_evaluation([0.5, 0.7])
+    assert np.array_equal(scores["cv_scores"], [0.5, 0.7])
+    assert scores["fit_times"] is None
+    joined = concatenate_evaluations([evaluation, scores])
+    assert len(joined["cv_scores"]) == 4
+    assert joined["fit_times"] is None
+    assert joined["peak_memory"] is None
+    assert not joined["timed_out"]
+
+
+def test_timeout_evaluation():
+    with pytest.warns(FitFailedWarning):
+        evaluation = timeout_evaluation(3, 6.0, error_score=-1, model_size=True)
+    assert evaluation["timed_out"]
+    assert np.array_equal(evaluation["cv_scores"], [-1, -1, -1])
+    assert np.array_equal(evaluation["fit_times"], [2.0, 2.0, 2.0])
+    assert np.all(np.isnan(evaluation["model_sizes"]))
+
+    with pytest.warns(FitFailedWarning):
+        timed_out = timeout_evaluation(1, 6.0)
+    joined = concatenate_evaluations([as_evaluation([0.5, 0.7]), timed_out])
+    assert joined["timed_out"]
+    assert np.isnan(joined["cv_scores"][-1])
@@ -0,0 +1,162 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+from deap.tools import Logbook
+
+from ...space import Categorical, Continuous, Integer, Space
+from ..logbook import EvaluationLog, logbook_to_pandas, open_log_file, read_logbook
+
+space = Space(
+    {
+        "max_depth": Integer(2, 20),
+        "alpha": Continuous(1e-4, 1),
+        "criterion": Categorical(["gini", "entropy"]),
+    }
+)
+
+
+def get_log(n_records=100):
+    log = EvaluationLog(space, capacity=4)
+    for n in range(n_records):
+        log.record(
+            max_depth=n % 19 + 2,
+            alpha=n / n_records,
+            criterion=["gini", "entropy"][n % 2],
+            score=n / 10,
+            cv_scores=[n / 10, n / 10] if n % 3 else None,
+        )
+    return log
+
+
+def test_evaluation_log():
+    log = get_log()
+
+    assert len(log) == 100
+    assert log.fields == ["max_depth", "alpha", "criterion", "score", "cv_scores"]
+    assert log[1] == {
+        "max_depth": 3,
+        "alpha": 0.01,
+        "criterion": "entropy",
+        "score": 0.1,
+        "cv_scores": [0.1, 0.1],
+    }
+    # The None values are not stored
+    assert "cv_scores" not in log[-1]
+    assert log[-2:] == [log[98], log[99]]
+    assert list(log)[50] == log[50]
+    with pytest.raises(IndexError):
+        log[100]
+
+    # The columns are typed and shared with the log
+    assert log.column("max_depth").dtype == np.int64
+    assert log.column("score").dtype == np.float64
+    assert log.column("criterion").tolist()[:3] == [0, 1, 0]
+    assert log.categories["criterion"] == ["gini", "entropy"]
+    assert log.column("cv_scores").shape == (100, 2)
+    assert np.isnan(log.column("cv_scores")[0]).all()
+    assert np.shares_memory(log.column("score"), log.column("score"))
+
+    assert log.select("score")[:2] == [0.0, 0.1]
+    depths, scores = log.select("max_depth", "score")
+    assert depths[:2] == [2, 3] and scores[:2] == [0.0, 0.1]
+
+
+def test_evaluation_log_types():
+    log = EvaluationLog(space, capacity=1)
+    log.record(max_depth=2, criterion="gini", resources=10, cv_scores=[0.5])
+    log.record(max_depth=3, criterion="log_loss", resources=5.5, cv_scores=[0.5, 0.7])
+    log.record(max_depth=4, raced=True)
+
+    # The columns are converted when a value doesn't fit its type
+    assert log.column("resources").dtype == np.float64
+    assert log.column("criterion").dtype == object
+    assert log.column("cv_scores").shape == (3, 2)
+    assert log[0] == {
+        "max_depth": 2,
+        "criterion": "gini",
+        "resources": 10.0,
+        "cv_scores": [0.5],
+    }
+    assert log[1]["criterion"] == "log_loss"
+    assert log[1]["cv_scores"] == [0.5, 0.7]
+    assert log[2] == {"max_depth": 4, "raced": True}
+    assert log.select("raced") == [None, None, True]
+
+
+def test_evaluation_log_export():
+    log = get_log(10)
+
+    df = log.to_pandas()
+    assert df.shape == (10, 6)
+    assert df["criterion"].dtype == "category"
+    assert df["criterion"].tolist()[:2] == ["gini", "entropy"]
+    assert df["score"].tolist() == log.select("score")
+    assert df["cv_scores_1"].isna().sum() == 4
+    assert logbook_to_pandas(_logbook(log)).equals(df)
+
+    # Only the used rows are pickled
+    restored = pickle.loads(pickle.dumps(log))
+    assert restored == log
+    assert len(restored._data["score"]) == 10
+    restored.record(max_depth=2, alpha=0.5, criterion="gini", score=1.0)
+    assert len(restored) == 11
+
+    # The logbook prints the log as a chapter
+    logbook = _logbook(log)
+    lines = str(logbook).splitlines()
+    assert "parameters" in lines[0]
+    assert lines[2].split() == log.fields
+    assert len(lines) == 13
+
+
+def test_evaluation_log_arrow():
+    pa = pytest.importorskip("pyarrow")
+    log = get_log(10)
+
+    table = log.to_arrow()
+    assert table.num_rows == 10
+    assert table.column("score").to_pylist() == log.select("score")
+    assert isinstance(table.column("criterion").type, pa.DictionaryType)
+
+
+def _logbook(log):
+    logbook = Logbook()
+    logbook.header = ["parameters"]
+    logbook.chapters["parameters"] = log
+    return logbook
+
+
+def test_evaluation_log_discard():
+    log = get_log()
+    records = log[:]
+
+    log.discard(60)
+    assert len(log) == 40 and log.offset == 60
+    assert log[:] == records[60:]
+    assert log.column("score").shape == (40,)
+
+    log.discard(0)
+    log.discard(100)
+    assert len(log) == 0 and log.offset == 100
+
+    log.record(max_depth=5, alpha=0.5, criterion="gini", score=1.0)
+    assert log[0] == {"max_depth": 5, "alpha": 0.5, "criterion": "gini", "score": 1.0}
+
+
+@pytest.mark.parametrize("file_name", ["log.jsonl", "log.jsonl.bz2", "log.jsonl.xz"])
+def test_read_logbook(file_name, tmp_path):
+    log = get_log(10)
+    path = str(tmp_path / file_name)
+    with open_log_file(path, "wt") as file:
+        for record in log:
+            file.write(json.dumps(record) + "\n")
+
+    logbook = read_logbook(path, space=space)
+    assert logbook.header == ["parameters"]
+    assert logbook.chapters["parameters"] == log
+    assert logbook.chapters["parameters"].categories["criterion"] == [
+        "gini",
+        "entropy",
+    ]
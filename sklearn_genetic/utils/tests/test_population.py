@@ -0,0 +1,182 @@
+import numpy as np
+import pytest
+
+from ...space import Categorical, Continuous, Integer, Space
+from ..individual import Individual, MultiObjectiveIndividual
+from ..population import (
+    ArrayPopulation,
+    mutate,
+    sel_roulette,
+    sel_tournament,
+    two_point_masks,
+    var_and,
+    var_or,
+)
+
+space = Space(
+    {
+        "max_depth": Integer(2, 20),
+        "alpha": Continuous(1e-4, 1, distribution="log-uniform"),
+        "criterion": Categorical(["gini", "entropy", "log_loss"]),
+        "hidden_layer_sizes": Categorical([(10,), (10, 10)]),
+    }
+)
+
+
+def check_individual(values):
+    max_depth, alpha, criterion, hidden_layer_sizes = values
+    assert isinstance(max_depth, int) and 2 <= max_depth <= 20
+    assert 1e-4 <= alpha <= 1
+    assert criterion in ["gini", "entropy", "log_loss"]
+    assert hidden_layer_sizes in [(10,), (10, 10)]
+
+
+def test_array_population():
+    individuals = [Individual(values) for values in space.sample_population(10)]
+    for fitness, individual in enumerate(individuals[:5]):
+        individual.fitness.values = (float(fitness),)
+
+    population = ArrayPopulation.from_individuals(space, individuals)
+
+    assert population.genes.shape == (10, 4)
+    assert len(population) == 10
+    assert population.fitness[:5].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert np.isnan(population.fitness[5:]).all()
+
+    restored = population.to_individuals(Individual)
+    assert [list(individual) for individual in restored] == [
+        list(individual) for individual in individuals
+    ]
+    assert [individual.fitness.valid for individual in restored] == [True] * 5 + [
+        False
+    ] * 5
+    assert population.to_parameters()[0] == dict(zip(space.parameters, individuals[0]))
+
+
+def test_array_population_operations():
+    individuals = [Individual(values) for values in space.sample_population(6)]
+    population = ArrayPopulation.from_individuals(space, individuals)
+    assert population.individual_class is Individual
+    assert not population.evaluated().any()
+
+    population.set_fitness([0, 2, 3], [(0.5,), None, (0.7,)])
+    assert population.evaluated().tolist() == [True, False, False, True, False, False]
+    assert population.scores()[[0, 3]].tolist() == [0.5, 0.7]
+
+    evaluated = population.take(np.flatnonzero(population.evaluated()))
+    assert len(evaluated) == 2
+    assert evaluated.individual_class is Individual
+    assert [list(ind) for ind in evaluated.to_individuals()] == [
+        list(individuals[0]),
+        list(individuals[3]),
+    ]
+    # The rows are copied
+    evaluated.fitness[0] = 0.1
+    assert population.fitness[0] == 0.5
+
+    joined = population + evaluated
+    assert len(joined) == 8
+    assert joined.scores()[-2:].tolist() == [0.1, 0.7]
+
+    population[:] = evaluated
+    assert len(population) == 2
+    with pytest.raises(TypeError):
+        population[1:] = evaluated
+
+    # The fitness gets a column per objective when the first individual is evaluated
+    population = ArrayPopulation.from_individuals(
+        space,
+        [MultiObjectiveIndividual(values) for values in space.sample_population(3)],
+    )
+    population.set_fitness([1], [(0.9, -0.5)])
+    assert population.fitness.shape == (3, 2)
+    assert population.evaluated().tolist() == [False, True, False]
+    assert population.scores()[1] == 0.9
+    assert population.to_individuals()[1].fitness.values == (0.9, -0.5)
+
+
+def test_array_population_multi_objective():
+    individuals = [
+        MultiObjectiveIndividual(values) for values in space.sample_population(4)
+    ]
+    individuals[0].fitness.values = (0.9, -0.5)
+    individuals[2].fitness.values = (0.7, -0.1)
+
+    population = ArrayPopulation.from_individuals(space, individuals)
+    assert population.fitness.shape == (4, 2)
+    assert population.fitness[0].tolist() == [0.9, -0.5]
+    assert np.isnan(population.fitness[[1, 3]]).all()
+
+    restored = population.to_individuals(MultiObjectiveIndividual)
+    assert [individual.fitness.values for individual in restored] == [
+        (0.9, -0.5),
+        (),
+        (0.7, -0.1),
+        (),
+    ]
+
+    # The reproduced individuals keep all the values of its fitness
+    offspring = var_or(population, 20, 0.0, 0.0).to_individuals(
+        MultiObjectiveIndividual
+    )
+    for individual in offspring:
+        assert individual.fitness.values in [(0.9, -0.5), (0.7, -0.1), ()]
+
+
+def test_selection():
+    np.random.seed(0)
+    fitness = np.array([0.1, 0.5, 0.2, 0.9])
+
+    selected = sel_tournament(fitness, 1000, tournsize=4)
+    assert selected.shape == (1000,)
+    # The best individual wins every tournament it takes part in
+    assert np.mean(selected == 3) == pytest.approx(1 - 0.75**4, abs=0.05)
+
+    selected = sel_roulette(fitness, 10000)
+    frequencies = np.bincount(selected, minlength=4) / 10000
+    assert frequencies == pytest.approx(fitness / fitness.sum(), abs=0.02)
+
+
+def test_operators():
+    np.random.seed(0)
+    masks = two_point_masks(100, 4)
+    assert masks.shape == (100, 4)
+    assert not masks[:, 0].any()
+    assert masks.any(axis=1).all()
+    assert two_point_masks(3, 1).shape == (3, 1)
+
+    population = ArrayPopulation(
+        space, [[2, 0.01, 0, 0], [20, 1, 1, 1]] * 50, np.arange(100.0)
+    )
+    mutated = ArrayPopulation(space, population.genes.copy(), population.fitness.copy())
+    mutate(mutated, [0, 1, 2])
+    assert np.isnan(mutated.fitness[:3]).all()
+    assert (mutated.genes[3:] == population.genes[3:]).all()
+    assert ((mutated.genes[:3] != population.genes[:3]).sum(axis=1) <= 1).all()
+
+    offspring = var_and(population, cxpb=1.0, mutpb=0.0)
+    assert np.isnan(offspring.fitness).all()
+    # Each pair of consecutive individuals exchange a slice of its genes
+    assert (offspring.genes != population.genes).any(axis=1).all()
+    assert (population.genes == [[2, 0.01, 0, 0], [20, 1, 1, 1]] * 50).all()
+
+    offspring = var_and(population, cxpb=0.0, mutpb=0.0)
+    assert (offspring.genes == population.genes).all()
+    assert (offspring.fitness == population.fitness).all()
+
+    offspring = var_or(population, 30, cxpb=0.5, mutpb=0.5)
+    assert len(offspring) == 30
+    assert np.isnan(offspring.fitness).all()
+    for values in offspring.values():
+        check_individual(values)
+
+    offspring = var_or(population, 30, cxpb=0.0, mutpb=0.0)
+    assert not np.isnan(offspring.fitness).any()
+
+    with pytest.raises(Exception) as excinfo:
+        var_or(population, 30, cxpb=0.6, mutpb=0.6)
+    assert (
+        str(excinfo.value)
+        == "The sum of the crossover and mutation probabilities must be smaller "
+        "or equal to 1.0."
+    )
@@ -0,0 +1,59 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+from sklearn.datasets import load_digits
+from sklearn.tree import DecisionTreeClassifier
+
+from ..cv_scores import Fold
+from ..shared import to_memmap, is_file_backed
+
+data = load_digits()
+y = data["target"]
+X = data["data"]
+
+train = np.arange(0, len(y), 2)
+test = np.arange(1, len(y), 2)
+
+
+def test_to_memmap(tmp_path):
+    X_shared = to_memmap(X, str(tmp_path), "X")
+    assert is_file_backed(X_shared)
+    assert not X_shared.flags.writeable
+    assert np.array_equal(X_shared, X)
+    assert not is_file_backed(X_shared[10:])
+
+    # Only numpy arrays without python objects are shared
+    objects = np.array(["a", None], dtype=object)
+    assert to_memmap(objects, str(tmp_path), "objects") is objects
+    frame = pd.DataFrame(X)
+    assert to_memmap(frame, str(tmp_path), "frame") is frame
+
+
+def test_fold_pickled_by_reference(tmp_path):
+    folder = str(tmp_path)
+    X_shared = to_memmap(X, folder, "X")
+    y_shared = to_memmap(y, folder, "y")
+    fold = Fold(X_shared, y_shared, train, test)
+
+    # The data is not copied in the pickle, only the reference to the files
+    pickled = pickle.dumps(fold)
+    assert len(pickled) < X.nbytes / 10
+
+    shared_fold = pickle.loads(pickled)
+    assert is_file_backed(shared_fold.X)
+    assert shared_fold.X.filename == X_shared.filename
+    assert np.array_equal(shared_fold.y, y)
+
+    estimator = DecisionTreeClassifier()
+    fold = Fold(X, y, train, test, {"sample_weight": np.ones(len(y))})
+    fold.materialize(estimator)
+    fold.share(folder, "fold_0")
+    pickled = pickle.dumps(fold)
+    assert len(pickled) < X.nbytes / 10
+
+    X_train, y_train, X_test, y_test, fit_params = pickle.loads(pickled).get(estimator)
+    assert is_file_backed(X_train)
+    assert np.array_equal(X_train, X[train])
+    assert np.array_equal(y_test, y[test])
+    assert np.array_equal(fit_params["sample_weight"], np.ones(len(train)))
@@ -0,0 +1,137 @@
+import numpy as np
+from sklearn.datasets import load_digits
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import check_scoring
+
+from ..cv_scores import Fold, fit_and_score
+from ..warm_start import ModelCache, WarmStart, clear_model_cache, _model_cache
+
+data = load_digits()
+y = data["target"]
+X = data["data"]
+
+train = np.arange(0, len(y), 2)
+test = np.arange(1, len(y), 2)
+
+
+def test_model_cache():
+    cache = ModelCache(max_size=2)
+    cache.put("a", (5, 1), {"trees": 5})
+    cache.put("a", (10, 1), {"trees": 10})
+
+    # The biggest model with no growable value bigger than the candidate is returned
+    assert cache.lookup("a", (7, 1)) == ((5, 1), {"trees": 5})
+    assert cache.lookup("a", (20, 2)) == ((10, 1), {"trees": 10})
+    assert cache.lookup("a", (20, 0)) == (None, None)
+    assert cache.lookup("b", (20, 1)) == (None, None)
+
+    # A copy is returned
+    parent_growth, model = cache.lookup("a", (20, 1))
+    model["trees"] = 20
+    assert cache.lookup("a", (20, 1))[1] == {"trees": 10}
+
+    # The least recently used model is discarded
+    cache.put("a", (3, 1), {"trees": 3})
+    assert len(cache) == 2
+    assert cache.lookup("a", (7, 1)) == ((3, 1), {"trees": 3})
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_model_cache_owners():
+    cache = ModelCache(max_size=2)
+    cache.put(("a", 1), (5,), "a5", max_size=1)
+    cache.put(("b", 1), (5,), "b5", max_size=3)
+    cache.put(("a", 1), (10,), "a10", max_size=1)
+    cache.put(("b", 1), (10,), "b10", max_size=3)
+    cache.put(("b", 1), (15,), "b15", max_size=3)
+
+    # Each owner keeps its own number of models
+    assert len(cache) == 4
+    assert cache.lookup(("a", 1), (7,)) == (None, None)
+    assert cache.lookup(("a", 1), (12,)) == ((10,), "a10")
+    assert cache.lookup(("b", 1), (7,)) == ((5,), "b5")
+
+    # The cache without max_size uses the one of the cache
+    cache.put(("c", 1), (5,), "c5")
+    cache.put(("c", 1), (10,), "c10")
+    cache.put(("c", 1), (15,), "c15")
+    assert cache.lookup(("c", 1), (7,)) == (None, None)
+    assert len(cache) == 6
+
+    cache.clear("b")
+    assert len(cache) == 3
+    cache.put(("b", 1), (5,), "b5", max_size=3)
+    assert len(cache) == 4
+
+
+def test_warm_started_fit():
+    clear_model_cache()
+    estimator = RandomForestClassifier(random_state=0)
+    fold = Fold(X, y, train, test)
+    other_fold = Fold(X, y, train, test)
+    scorer = check_scoring(estimator, scoring="accuracy")
+    warm_start = WarmStart(["n_estimators"], max_size=10)
+
+    fit_and_score(
+        estimator,
+        fold,
+        scorer,
+        {"n_estimators": 5, "max_depth": 4},
+        warm_start=warm_start,
+    )
+    assert len(_model_cache) == 1
+
+    model, grow = warm_start.lookup(fold, {"n_estimators": 8, "max_depth": 4})
+    assert grow
+    assert model.warm_start
+    assert model.n_estimators == 8
+    assert len(model.estimators_) == 5
+
+    model, grow = warm_start.lookup(fold, {"n_estimators": 5, "max_depth": 4})
+    assert not grow
+    assert warm_start.lookup(fold, {"n_estimators": 3, "max_depth": 4}) == (None, True)
+    assert warm_start.lookup(fold, {"n_estimators": 8, "max_depth": 5}) == (None, True)
+    assert warm_start.lookup(other_fold, {"n_estimators": 8, "max_depth": 4}) == (
+        None,
+        True,
+    )
+
+    # Growing the forest gives the same model as fitting it from scratch
+    result = fit_and_score(
+        estimator,
+        fold,
+        scorer,
+        {"n_estimators": 10, "max_depth": 4},
+        warm_start=warm_start,
+    )
+    expected = fit_and_score(
+        estimator, fold, scorer, {"n_estimators": 10, "max_depth": 4}
+    )
+    assert result["score"] == expected["score"]
+    assert len(_model_cache) == 2
+
+    # The parent model was not modified
+    model, _ = warm_start.lookup(fold, {"n_estimators": 6, "max_depth": 4})
+    assert len(model.estimators_) == 5
+
+    # Other searches don't see the models, and they are released independently
+    other_warm_start = WarmStart(["n_estimators"], max_size=10)
+    assert other_warm_start.lookup(fold, {"n_estimators": 8, "max_depth": 4}) == (
+        None,
+        True,
+    )
+    fit_and_score(
+        estimator,
+        fold,
+        scorer,
+        {"n_estimators": 5, "max_depth": 4},
+        warm_start=other_warm_start,
+    )
+    clear_model_cache(warm_start)
+    assert len(_model_cache) == 1
+    assert other_warm_start.lookup(fold, {"n_estimators": 8, "max_depth": 4})[1]
+
+    clear_model_cache()
+    assert len(_model_cache) == 0
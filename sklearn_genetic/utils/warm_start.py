@@ -0,0 +1,231 @@
+import copy
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from .cache import genome_key
+
+"""
+This module contains the cache of fitted models used to continue the training
+of the candidates that only differ from an already fitted one in a growable parameter
+"""
+
+
+class ModelCache:
+    """
+    LRU cache of the models fitted in the current process. The first element of each key
+    identifies the owner of the model, like a search, and each owner has its own maximum
+    number of models, so the searches that share the process don't evict each other's models.
+    """
+
+    def __init__(self, max_size):
+        """
+        Parameters
+        ----------
+        max_size: int
+            Maximum number of fitted models of each owner, if :meth:`put` doesn't set it
+        """
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, key, growth):
+        """
+        Parameters
+        ----------
+        key: tuple
+            Identifier of the fold and the hyperparameters that can't grow
+        growth: tuple
+            Values of the growable hyperparameters of the candidate
+
+        Returns
+        -------
+        parent_growth, model: tuple
+            The growable values and a copy of the biggest cached model that has
+            the same key and no growable value bigger than the candidate ones,
+            ``(None, None)`` if there isn't any
+        """
+        with self._lock:
+            parents = [
+                parent_growth
+                for parent_key, parent_growth in self._data
+                if parent_key == key
+                and all(
+                    parent_value <= value
+                    for parent_value, value in zip(parent_growth, growth)
+                )
+            ]
+            if not parents:
+                return None, None
+
+            parent_growth = max(parents)
+            self._data.move_to_end((key, parent_growth))
+            model = self._data[(key, parent_growth)]
+
+        # The cached model must not be modified by the training of the candidate
+        return parent_growth, copy.deepcopy(model)
+
+    def put(self, key, growth, model, max_size=None):
+        """
+        Parameters
+        ----------
+        key: tuple
+            Identifier of the fold and the hyperparameters that can't grow,
+            its first element is the owner of the model
+        growth: tuple
+            Values of the growable hyperparameters of the model
+        model: estimator object
+            The fitted model
+        max_size: int, default=None
+            Maximum number of models of the owner, if ``None``, the ``max_size`` of the cache
+        """
+        max_size = self.max_size if max_size is None else max_size
+        owner = key[0]
+        with self._lock:
+            if (key, growth) not in self._data:
+                self._sizes[owner] = self._sizes.get(owner, 0) + 1
+            self._data[(key, growth)] = model
+            self._data.move_to_end((key, growth))
+
+            # The least recently used models of the same owner are discarded
+            for cached_key, cached_growth in list(self._data):
+                if self._sizes[owner] <= max_size:
+                    break
+                if cached_key[0] == owner:
+                    del self._data[(cached_key, cached_growth)]
+                    self._sizes[owner] -= 1
+
+    def clear(self, owner=None):
+        """
+        Parameters
+        ----------
+        owner: str, default=None
+            If set, only the models whose key starts with it are removed
+        """
+        with self._lock:
+            if owner is None:
+                self._data.clear()
+                self._sizes.clear()
+                return
+            for key, growth in list(self._data):
+                if key[0] == owner:
+                    del self._data[(key, growth)]
+            self._sizes.pop(owner, None)
+
+    def __len__(self):
+        return len(self._data)
+
+
+# Fitted models of the current process, shared by all the evaluations that run on it
+_model_cache = ModelCache(max_size=100)
+
+
+class WarmStart:
+    """
+    Settings of the warm-started evaluations, they are sent with each evaluation so any
+    process can keep its own cache of fitted models.
+    A candidate that only differs from a cached model of the same fold in bigger values of the
+    growable parameters continues the training of a copy of that model using ``warm_start=True``.
+    """
+
+    def __init__(self, parameters, max_size=100):
+        """
+        Parameters
+        ----------
+        parameters: list of str
+            Growable hyperparameters, like ``n_estimators``, for which the warm-started
+            training of the estimator grows the model up to the new value
+        max_size: int, default=100
+            Maximum number of fitted models kept in each process
+        """
+        self.parameters = list(parameters)
+        self.max_size = max_size
+        # Identifies the models of this search, when several of them share the process
+        self.key = uuid.uuid4().hex
+
+    def _key(self, fold, parameters):
+        fixed = {
+            key: value
+            for key, value in parameters.items()
+            if key not in self.parameters
+        }
+        growth = tuple(parameters[key] for key in self.parameters)
+        return (self.key, fold.key, genome_key(fixed)), growth
+
+    def lookup(self, fold, parameters):
+        """
+        Parameters
+        ----------
+        fold: :class:`~sklearn_genetic.utils.cv_scores.Fold`
+            The fold the candidate is trained on
+        parameters: dict
+            Hyperparameters of the candidate
+
+        Returns
+        -------
+        model, grow: tuple
+            A copy of the cached model to continue training, or ``None``,
+            and ``True`` if the model must be trained to reach the candidate
+            growable values, ``False`` if it already has them
+        """
+        key, growth = self._key(fold, parameters)
+        parent_growth, model = _model_cache.lookup(key, growth)
+        if model is None:
+            return None, True
+
+        model.set_params(
+            warm_start=True,
+            **{key: parameters[key] for key in self.parameters},
+        )
+        return model, parent_growth != growth
+
+    def put(self, fold, parameters, model):
+        """
+        Parameters
+        ----------
+        fold: :class:`~sklearn_genetic.utils.cv_scores.Fold`
+            The fold the model was trained on
+        parameters: dict
+            Hyperparameters of the candidate
+        model: estimator object
+            The fitted model
+        """
+        key, growth = self._key(fold, parameters)
+        _model_cache.put(key, growth, model, self.max_size)
+
+
+def clear_model_cache(warm_start=None):
+    """
+    Releases the fitted models kept by the current process
+
+    Parameters
+    ----------
+    warm_start: :class:`WarmStart`, default=None
+        If set, only the models cached with these settings are released
+    """
+    _model_cache.clear(None if warm_start is None else warm_start.key)
+
+
+def release_in_worker(warm_start, delay=0.1):
+    """
+    Cleanup task that releases the models cached with some settings in the worker
+    process that runs it. It holds the worker for ``delay`` seconds, so the idle workers
+    of a pool take one task each when a task per worker is submitted at once.
+
+    Parameters
+    ----------
+    warm_start: :class:`WarmStart`
+        Settings of the warm-started training whose models are released
+    delay: float, default=0.1
+        Seconds the worker is held after releasing the models
+
+    Returns
+    -------
+        The id of the process that ran the task
+    """
+    clear_model_cache(warm_start)
+    time.sleep(delay)
+    return os.getpid()
@@ -0,0 +1,166 @@
+"""
+Worker server that evaluates the candidates sent by a
+:class:`~sklearn_genetic.executors.RemoteExecutor`.
+It can be started in each machine of the cluster with::
+
+    python -m sklearn_genetic.worker --host 0.0.0.0 --port 6000 --authkey <secret>
+
+The messages are pickled, so the worker refuses to start without a secret ``authkey``,
+given with ``--authkey`` or the ``SKLEARN_GENETIC_AUTHKEY`` environment variable.
+"""
+
+import argparse
+import os
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener
+from traceback import format_exc
+
+from .executors import check_authkey
+from .utils.cv_scores import cross_validate, select_folds
+from .utils.warm_start import clear_model_cache
+
+AUTHKEY_ENV = "SKLEARN_GENETIC_AUTHKEY"
+
+
+def serve(host="localhost", port=6000, authkey=None, verbose=True):
+    """
+    Listens for connections of executors until the process is terminated,
+    each connection is handled in its own thread
+
+    Parameters
+    ----------
+    host: str, default="localhost"
+        Host name or IP address to listen on
+    port: int, default=6000
+        Port to listen on, if 0, a free port is selected
+    authkey: bytes or str, default=None
+        Secret key used to authenticate the connections, it's required
+    verbose: bool, default=True
+        If ``True``, prints the address of the worker once it's listening
+    """
+    authkey = check_authkey(authkey)
+
+    with Listener((host, port), authkey=authkey) as listener:
+        if verbose:
+            host, port = listener.address
+            print(f"Worker listening on {host}:{port}", flush=True)
+
+        while True:
+            try:
+                connection = listener.accept()
+            except (AuthenticationError, OSError, EOFError):
+                continue
+            threading.Thread(target=handle, args=(connection,), daemon=True).start()
+
+
+def handle(connection):
+    """
+    Evaluates the candidates received in the connection, using the data sent
+    in its first message, until the executor closes it.
+    The models cached for the warm-started training of the search are released at the end.
+
+    Parameters
+    ----------
+    connection: :class:`multiprocessing.connection.Connection`
+        Connection with the executor
+    """
+    data = None
+    try:
+        with connection:
+            while True:
+                try:
+                    command, payload = connection.recv()
+                except (OSError, EOFError):
+                    break
+
+                if command == "start":
+                    data = payload
+                    continue
+                if command != "evaluate":
+                    break
+
+                if data is None:
+                    reply = (
+                        "error",
+                        RuntimeError(
+                            "The data of the search must be sent before the candidates"
+                        ),
+                    )
+                else:
+                    reply = _evaluate(data, payload)
+
+                try:
+                    _send(connection, reply)
+                except (OSError, EOFError):
+                    # The executor was shut down during the evaluation
+                    break
+    finally:
+        if data is not None and data[4] is not None:
+            clear_model_cache(data[4])
+
+
+def _evaluate(data, payload):
+    """
+    Returns
+    -------
+        ``"result"`` and the evaluation of the candidate, or ``"error"`` and the exception
+    """
+    estimator, folds, scorer, error_score, warm_start, model_size = data
+    parameters, indices = payload
+    try:
+        evaluation = cross_validate(
+            estimator,
+            select_folds(folds, indices),
+            scorer,
+            parameters,
+            error_score,
+            warm_start,
+            model_size,
+        )
+        return "result", evaluation
+    except Exception as e:
+        return "error", e
+
+
+def _send(connection, reply):
+    """
+    Sends the reply to the executor, an error that can't be pickled is sent as its traceback
+    """
+    try:
+        connection.send(reply)
+    except (OSError, EOFError):
+        raise
+    except Exception:
+        connection.send(("error", RuntimeError(format_exc())))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m sklearn_genetic.worker",
+        description="Worker server of sklearn_genetic.executors.RemoteExecutor",
+    )
+    parser.add_argument("--host", default="localhost", help="Address to listen on")
+    parser.add_argument(
+        "--port", type=int, default=6000, help="Port to listen on, 0 picks a free one"
+    )
+    parser.add_argument(
+        "--authkey",
+        default=os.environ.get(AUTHKEY_ENV),
+        help="Secret key shared with the executor, "
+        f"defaults to the {AUTHKEY_ENV} environment variable",
+    )
+    args = parser.parse_args(argv)
+    if not args.authkey:
+        parser.error(
+            f"a secret key is required, set --authkey or the {AUTHKEY_ENV} environment variable"
+        )
+
+    try:
+        serve(args.host, args.port, args.authkey)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()